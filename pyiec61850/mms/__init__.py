@@ -39,16 +39,7 @@ Features:
 __version__ = "0.1.0"
 __author__ = "f0rw4rd"
 
-# Main client class
-from .client import DataAttribute, MMSClient, ServerIdentity
-from .control import (
-    CancelError,
-    ControlClient,
-    ControlError,
-    ControlResult,
-    OperateError,
-    SelectError,
-)
+import importlib
 
 # Exceptions
 from .exceptions import (
@@ -66,20 +57,6 @@ from .exceptions import (
     ReadError,
     WriteError,
 )
-from .files import FileAccessError, FileClient, FileError, FileInfo, FileNotFoundError
-from .gocb import GoCBClient, GoCBError, GoCBInfo
-from .logging_service import (
-    JournalEntry,
-    JournalEntryData,
-    LogClient,
-    LogError,
-    LogQueryError,
-    LogQueryResult,
-)
-
-# New feature modules
-from .reporting import RCBConfig, Report, ReportClient, ReportConfigError, ReportEntry, ReportError
-from .tls import TLSConfig, TLSConfigError, TLSError, create_tls_configuration
 from .types import FC, ACSIClass, MmsType
 
 # Safe utility functions
@@ -109,6 +86,66 @@ from .utils import (
     unpack_result,
 )
 
+# Client and feature-module classes are resolved on first attribute access
+# (PEP 562), so importing the package for its enums, exceptions or guards does
+# not load the client, reporting, control, file, log, GoCB and TLS modules.
+_LAZY_IMPORTS = {
+    # Main client class
+    "MMSClient": ".client",
+    "ServerIdentity": ".client",
+    "DataAttribute": ".client",
+    # Reporting
+    "ReportClient": ".reporting",
+    "Report": ".reporting",
+    "ReportEntry": ".reporting",
+    "RCBConfig": ".reporting",
+    "ReportError": ".reporting",
+    "ReportConfigError": ".reporting",
+    # Control
+    "ControlClient": ".control",
+    "ControlResult": ".control",
+    "ControlError": ".control",
+    "SelectError": ".control",
+    "OperateError": ".control",
+    "CancelError": ".control",
+    # File services
+    "FileClient": ".files",
+    "FileInfo": ".files",
+    "FileError": ".files",
+    "FileNotFoundError": ".files",
+    "FileAccessError": ".files",
+    # Log/Journal services
+    "LogClient": ".logging_service",
+    "JournalEntry": ".logging_service",
+    "JournalEntryData": ".logging_service",
+    "LogQueryResult": ".logging_service",
+    "LogError": ".logging_service",
+    "LogQueryError": ".logging_service",
+    # TLS
+    "TLSConfig": ".tls",
+    "TLSError": ".tls",
+    "TLSConfigError": ".tls",
+    "create_tls_configuration": ".tls",
+    # GoCB
+    "GoCBClient": ".gocb",
+    "GoCBInfo": ".gocb",
+    "GoCBError": ".gocb",
+}
+
+
+def __getattr__(name):
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
 __all__ = [
     # Version
     "__version__",
@@ -60,19 +60,28 @@ class IedServer:
         server.stop()
     """
 
-    def __init__(self, model_path: Optional[str] = None, config: Optional[ServerConfig] = None):
+    def __init__(
+        self,
+        model_path: Optional[str] = None,
+        config: Optional[ServerConfig] = None,
+        _iec_lib: Any = None,
+    ):
         """
         Initialize IEC 61850 server.
 
         Args:
             model_path: Path to ICD/SCL model file, or None for runtime model
             config: Server configuration (uses defaults if None)
+            _iec_lib: Binding to call instead of pyiec61850 (for tests; skips
+                the native-library check)
 
         Raises:
             LibraryNotFoundError: If pyiec61850 is not available
             ModelError: If model file cannot be loaded
         """
-        require_library(LibraryNotFoundError)
+        if _iec_lib is None:
+            require_library(LibraryNotFoundError)
+        self._iec = _iec_lib if _iec_lib is not None else iec61850
 
         self._config = config or ServerConfig()
         self._model = None
@@ -106,10 +115,10 @@ class IedServer:
             # expects a C FILE* (SWIG type "FileHandle"), not a Python
             # path. Prefer the ..._Ex variant that takes a filename;
             # it is the only form callable from Python with a str.
-            if hasattr(iec61850, "ConfigFileParser_createModelFromConfigFileEx"):
-                self._model = iec61850.ConfigFileParser_createModelFromConfigFileEx(model_path)
-            elif hasattr(iec61850, "IedModel_createFromConfigFile"):
-                self._model = iec61850.IedModel_createFromConfigFile(model_path)
+            if hasattr(self._iec, "ConfigFileParser_createModelFromConfigFileEx"):
+                self._model = self._iec.ConfigFileParser_createModelFromConfigFileEx(model_path)
+            elif hasattr(self._iec, "IedModel_createFromConfigFile"):
+                self._model = self._iec.IedModel_createFromConfigFile(model_path)
             else:
                 raise ModelError("No model loading API available in bindings")
 
@@ -145,31 +154,31 @@ class IedServer:
             self._port = port
 
             # Create server configuration
-            if hasattr(iec61850, "IedServerConfig_create"):
-                self._ied_server_config = iec61850.IedServerConfig_create()
+            if hasattr(self._iec, "IedServerConfig_create"):
+                self._ied_server_config = self._iec.IedServerConfig_create()
                 if self._ied_server_config:
-                    if hasattr(iec61850, "IedServerConfig_setMaxMmsConnections"):
-                        iec61850.IedServerConfig_setMaxMmsConnections(
+                    if hasattr(self._iec, "IedServerConfig_setMaxMmsConnections"):
+                        self._iec.IedServerConfig_setMaxMmsConnections(
                             self._ied_server_config, self._config.max_connections
                         )
                     if self._config.file_service_base_path and hasattr(
-                        iec61850, "IedServerConfig_setFileServiceBasePath"
+                        self._iec, "IedServerConfig_setFileServiceBasePath"
                     ):
-                        iec61850.IedServerConfig_setFileServiceBasePath(
+                        self._iec.IedServerConfig_setFileServiceBasePath(
                             self._ied_server_config,
                             self._config.file_service_base_path,
                         )
-                    if hasattr(iec61850, "IedServerConfig_setEdition"):
-                        iec61850.IedServerConfig_setEdition(
+                    if hasattr(self._iec, "IedServerConfig_setEdition"):
+                        self._iec.IedServerConfig_setEdition(
                             self._ied_server_config, self._config.edition
                         )
-                    if hasattr(iec61850, "IedServerConfig_enableDynamicDataSetService"):
-                        iec61850.IedServerConfig_enableDynamicDataSetService(
+                    if hasattr(self._iec, "IedServerConfig_enableDynamicDataSetService"):
+                        self._iec.IedServerConfig_enableDynamicDataSetService(
                             self._ied_server_config,
                             self._config.enable_dynamic_datasets,
                         )
-                    if hasattr(iec61850, "IedServerConfig_enableFileService"):
-                        iec61850.IedServerConfig_enableFileService(
+                    if hasattr(self._iec, "IedServerConfig_enableFileService"):
+                        self._iec.IedServerConfig_enableFileService(
                             self._ied_server_config,
                             self._config.enable_file_service,
                         )
@@ -186,22 +195,22 @@ class IedServer:
             # at create time.
             if (
                 self._ied_server_config
-                and hasattr(iec61850, "IedServer_createWithConfig")
+                and hasattr(self._iec, "IedServer_createWithConfig")
                 and getattr(self._config, "tls", None) is not None
             ):
-                self._server = iec61850.IedServer_createWithConfig(
+                self._server = self._iec.IedServer_createWithConfig(
                     self._model, self._config.tls, self._ied_server_config
                 )
             else:
-                self._server = iec61850.IedServer_create(self._model)
+                self._server = self._iec.IedServer_create(self._model)
 
             if not self._server:
                 raise ServerError("Failed to create IedServer")
 
             # Start server
-            iec61850.IedServer_start(self._server, port)
+            self._iec.IedServer_start(self._server, port)
 
-            if not iec61850.IedServer_isRunning(self._server):
+            if not self._iec.IedServer_isRunning(self._server):
                 raise ServerError(
                     f"Server failed to start on port {port} "
                     "(port may be in use or insufficient permissions)"
@@ -210,7 +219,7 @@ class IedServer:
             # Enable GOOSE publishing if configured
             if self._config.enable_goose_publishing:
                 try:
-                    iec61850.IedServer_enableGoosePublishing(self._server)
+                    self._iec.IedServer_enableGoosePublishing(self._server)
                     logger.info("GOOSE publishing enabled")
                 except Exception as e:
                     logger.warning(f"Failed to enable GOOSE publishing: {e}")
@@ -238,7 +247,7 @@ class IedServer:
 
         try:
             if self._server:
-                iec61850.IedServer_stop(self._server)
+                self._iec.IedServer_stop(self._server)
         except Exception as e:
             logger.warning(f"Error stopping server: {e}")
         finally:
@@ -253,10 +262,10 @@ class IedServer:
         ``toDataAttribute`` helper performs the cast; without it every
         update would raise TypeError at the SWIG boundary.
         """
-        node = iec61850.IedModel_getModelNodeByObjectReference(self._model, reference)
+        node = self._iec.IedModel_getModelNodeByObjectReference(self._model, reference)
         if not node:
             return None
-        to_da = getattr(iec61850, "toDataAttribute", None)
+        to_da = getattr(self._iec, "toDataAttribute", None)
         return to_da(node) if to_da is not None else node
 
     def _cleanup(self) -> None:
@@ -266,22 +275,22 @@ class IedServer:
 
         if self._server:
             try:
-                iec61850.IedServer_destroy(self._server)
+                self._iec.IedServer_destroy(self._server)
             except Exception as e:
                 logger.warning(f"Error destroying IedServer: {e}")
         self._server = None
 
         if self._ied_server_config:
             try:
-                if hasattr(iec61850, "IedServerConfig_destroy"):
-                    iec61850.IedServerConfig_destroy(self._ied_server_config)
+                if hasattr(self._iec, "IedServerConfig_destroy"):
+                    self._iec.IedServerConfig_destroy(self._ied_server_config)
             except Exception as e:
                 logger.debug("destroying IedServerConfig: %s", e)
         self._ied_server_config = None
 
         if self._model:
             try:
-                iec61850.IedModel_destroy(self._model)
+                self._iec.IedModel_destroy(self._model)
             except Exception as e:
                 logger.warning(f"Error destroying model: {e}")
         self._model = None
@@ -307,7 +316,7 @@ class IedServer:
             if not node:
                 raise UpdateError(reference, "node not found in model")
 
-            iec61850.IedServer_updateBooleanAttributeValue(self._server, node, value)
+            self._iec.IedServer_updateBooleanAttributeValue(self._server, node, value)
         except NotRunningError:
             raise
         except UpdateError:
@@ -335,7 +344,7 @@ class IedServer:
             if not node:
                 raise UpdateError(reference, "node not found in model")
 
-            iec61850.IedServer_updateInt32AttributeValue(self._server, node, value)
+            self._iec.IedServer_updateInt32AttributeValue(self._server, node, value)
         except NotRunningError:
             raise
         except UpdateError:
@@ -363,7 +372,7 @@ class IedServer:
             if not node:
                 raise UpdateError(reference, "node not found in model")
 
-            iec61850.IedServer_updateFloatAttributeValue(self._server, node, value)
+            self._iec.IedServer_updateFloatAttributeValue(self._server, node, value)
         except NotRunningError:
             raise
         except UpdateError:
@@ -391,7 +400,7 @@ class IedServer:
             if not node:
                 raise UpdateError(reference, "node not found in model")
 
-            iec61850.IedServer_updateVisibleStringAttributeValue(self._server, node, value)
+            self._iec.IedServer_updateVisibleStringAttributeValue(self._server, node, value)
         except NotRunningError:
             raise
         except UpdateError:
@@ -419,7 +428,7 @@ class IedServer:
             if not node:
                 raise UpdateError(reference, "node not found in model")
 
-            iec61850.IedServer_updateQuality(self._server, node, quality)
+            self._iec.IedServer_updateQuality(self._server, node, quality)
         except NotRunningError:
             raise
         except UpdateError:
@@ -447,7 +456,7 @@ class IedServer:
             if not node:
                 raise UpdateError(reference, "node not found in model")
 
-            iec61850.IedServer_updateUTCTimeAttributeValue(self._server, node, timestamp_ms)
+            self._iec.IedServer_updateUTCTimeAttributeValue(self._server, node, timestamp_ms)
         except NotRunningError:
             raise
         except UpdateError:
@@ -482,16 +491,16 @@ class IedServer:
             raise ControlHandlerError("handler must be callable")
 
         try:
-            node = iec61850.IedModel_getModelNodeByObjectReference(self._model, object_ref)
+            node = self._iec.IedModel_getModelNodeByObjectReference(self._model, object_ref)
             if not node:
                 raise ControlHandlerError(f"control object '{object_ref}' not found in model")
 
-            if hasattr(iec61850, "ControlSubscriberForPython"):
-                ctrl_sub = iec61850.ControlSubscriberForPython()
+            if hasattr(self._iec, "ControlSubscriberForPython"):
+                ctrl_sub = self._iec.ControlSubscriberForPython()
                 ctrl_sub.setIedServer(self._server)
                 ctrl_sub.setControlObject(node)
 
-                ctrl_handler = _PyControlHandler(handler, object_ref)
+                ctrl_handler = _PyControlHandler(handler, object_ref, iec=self._iec)
                 ctrl_sub.setControlHandler(ctrl_handler)
                 ctrl_sub.subscribe()
 
@@ -521,7 +530,7 @@ class IedServer:
             raise NotRunningError()
 
         try:
-            iec61850.IedServer_enableGoosePublishing(self._server)
+            self._iec.IedServer_enableGoosePublishing(self._server)
             logger.info("GOOSE publishing enabled")
         except Exception as e:
             raise ServerError(f"Failed to enable GOOSE publishing: {e}")
@@ -538,7 +547,7 @@ class IedServer:
             raise NotRunningError()
 
         try:
-            iec61850.IedServer_disableGoosePublishing(self._server)
+            self._iec.IedServer_disableGoosePublishing(self._server)
             logger.info("GOOSE publishing disabled")
         except Exception as e:
             raise ServerError(f"Failed to disable GOOSE publishing: {e}")
@@ -557,7 +566,7 @@ class IedServer:
             raise NotRunningError()
 
         try:
-            return iec61850.IedServer_getNumberOfOpenConnections(self._server)
+            return self._iec.IedServer_getNumberOfOpenConnections(self._server)
         except Exception:
             return 0
 
@@ -573,7 +582,7 @@ class IedServer:
         """
         if not self._running:
             raise NotRunningError()
-        iec61850.IedServer_lockDataModel(self._server)
+        self._iec.IedServer_lockDataModel(self._server)
 
     def unlock_data_model(self) -> None:
         """
@@ -584,7 +593,7 @@ class IedServer:
         """
         if not self._running:
             raise NotRunningError()
-        iec61850.IedServer_unlockDataModel(self._server)
+        self._iec.IedServer_unlockDataModel(self._server)
 
     def __enter__(self) -> "IedServer":
         """Context manager entry."""
@@ -611,13 +620,18 @@ class _PyControlHandler:
     them to the Python callback.
     """
 
-    def __init__(self, callback: Callable, object_ref: str):
+    def __init__(self, callback: Callable, object_ref: str, iec: Any = None):
         self._callback = callback
         self._object_ref = object_ref
 
-        if _HAS_IEC61850 and hasattr(iec61850, "ControlHandlerForPython"):
+        # The owning IedServer passes its binding, so an injected one also
+        # supplies the director base class.
+        if iec is None:
+            iec = iec61850 if _HAS_IEC61850 else None
+
+        if iec is not None and hasattr(iec, "ControlHandlerForPython"):
             try:
-                iec61850.ControlHandlerForPython.__init__(self)
+                iec.ControlHandlerForPython.__init__(self)
             except Exception as e:
                 logger.debug("initializing ControlHandlerForPython: %s", e)
 
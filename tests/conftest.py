@@ -30,6 +30,7 @@ and no hang is possible, so it is a no-op.
 from __future__ import annotations
 
 import functools
+import logging
 import os
 import types
 import unittest.mock as _mock
@@ -81,6 +82,27 @@ def _install_mock_safe_native_guard() -> None:
 _install_mock_safe_native_guard()
 
 
+def pytest_configure(config):
+    """Silence library logging for the unit-test session.
+
+    The wrappers log every cleanup and error path the mocked tests exercise;
+    those tests assert on behaviour, not log output. The integration suite
+    keeps its logs for diagnosing real-server failures.
+    """
+    if not _IS_INTEGRATION:
+        logging.disable(logging.CRITICAL)
+
+
+@pytest.fixture(scope="session")
+def pyrcb_init_source() -> str:
+    """Source of ``_PyRCBHandler.__init__``, read from disk once per session."""
+    import inspect
+
+    from pyiec61850.mms.reporting import _PyRCBHandler
+
+    return inspect.getsource(_PyRCBHandler.__init__)
+
+
 def _native_extension_importable() -> bool:
     try:
         import pyiec61850.pyiec61850  # noqa: F401
@@ -102,10 +124,11 @@ def pytest_collection_modifyitems(config, items):
     plain functions, but directors route through C++ object machinery the guard
     cannot reach).
 
-    These tests are identified structurally by the ``_make_handler`` helper
-    every director crash-path class defines. They run normally on a plain
-    checkout; here we only skip them when the extension is importable, so the
-    unit and integration environments can coexist without hanging.
+    These tests are identified structurally: unittest-style classes define a
+    ``_make_handler`` helper, pytest-style tests request a ``make_handler``
+    fixture. They run normally on a plain checkout; here we only skip them
+    when the extension is importable, so the unit and integration
+    environments can coexist without hanging.
     """
     if _IS_INTEGRATION or not _native_extension_importable():
         return
@@ -115,5 +138,6 @@ def pytest_collection_modifyitems(config, items):
     )
     for item in items:
         cls = getattr(item, "cls", None)
-        if cls is not None and hasattr(cls, "_make_handler"):
+        uses_handler_fixture = "make_handler" in getattr(item, "fixturenames", ())
+        if uses_handler_fixture or (cls is not None and hasattr(cls, "_make_handler")):
             item.add_marker(skip)
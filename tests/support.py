@@ -31,9 +31,13 @@ mock connection is torn down while the fake is still installed (no GC hang).
 from __future__ import annotations
 
 import os
-from unittest.mock import MagicMock, patch
+import subprocess
+import sys
+import unittest
+from unittest.mock import Mock, patch
 
 _SYMBOLS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_binding_symbols.txt")
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 # Real constant values, captured from the binding. Kept here (not read live)
 # so the fake is faithful even on a checkout with no native extension.
@@ -104,6 +108,7 @@ _TUPLE_RETURN_OK = (
 )
 
 _cached_symbols: frozenset[str] | None = None
+_cached_spec: tuple[str, ...] | None = None
 
 
 def binding_symbols() -> frozenset[str]:
@@ -120,8 +125,8 @@ def binding_symbols() -> frozenset[str]:
     return _cached_symbols
 
 
-def make_binding(**overrides) -> MagicMock:
-    """Return a MagicMock spec'd to the real binding's symbols.
+def make_binding(**overrides) -> Mock:
+    """Return a Mock spec'd to the real binding's symbols.
 
     - Accessing a name the binding does not export raises ``AttributeError``.
     - Constants carry real integer values.
@@ -131,7 +136,12 @@ def make_binding(**overrides) -> MagicMock:
     ``overrides`` set ``return_value`` on named functions, e.g.
     ``make_binding(IedConnection_writeObject=(None, 25))``.
     """
-    binding = MagicMock(spec=sorted(binding_symbols()))
+    global _cached_spec
+    if _cached_spec is None:
+        # Sorted once: every test builds a binding, and Mock never mutates
+        # its spec, so all of them can share the tuple.
+        _cached_spec = tuple(sorted(binding_symbols()))
+    binding = Mock(spec=_cached_spec)
 
     for name, value in _CONSTANTS.items():
         setattr(binding, name, value)
@@ -154,10 +164,10 @@ _DEFAULT_MODULES = ("pyiec61850.mms.client", "pyiec61850.mms.utils")
 
 def install_binding(
     testcase,
-    binding: MagicMock | None = None,
+    binding: Mock | None = None,
     modules=None,
     **overrides,
-) -> MagicMock:
+) -> Mock:
     """Patch wrapper modules to use a faithful fake binding for one test.
 
     For each module in ``modules`` (default: the MMS client + utils), patches
@@ -191,3 +201,70 @@ def connected_client(testcase, **overrides):
     client.connect("host", 102)
     testcase.addCleanup(client.disconnect)
     return client, binding
+
+
+def run_lazy_import_check(package: str, attribute: str, submodule: str):
+    """Check in a fresh interpreter that ``package`` loads ``submodule`` lazily.
+
+    Importing ``package`` must leave ``submodule`` out of ``sys.modules`` until
+    ``package.<attribute>`` is first accessed (PEP 562). A fresh process is
+    needed because this test process has long since imported everything.
+    Returns the ``CompletedProcess``; a non-zero ``returncode`` is a failure,
+    with the reason in ``stderr``.
+    """
+    code = (
+        f"import sys, {package}\n"
+        f"assert {submodule!r} not in sys.modules\n"
+        f"{package}.{attribute}\n"
+        f"assert {submodule!r} in sys.modules\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, cwd=_REPO_ROOT
+    )
+
+
+# -- IedServer ----------------------------------------------------------------
+
+# Opaque native handles for the server tests. They are only passed through the
+# wrapper (and may be compared by identity); nothing calls methods on them.
+SENTINEL_MODEL = object()
+SENTINEL_SERVER = object()
+SENTINEL_CONFIG = object()
+SENTINEL_NODE = object()
+
+
+class ServerTestCase(unittest.TestCase):
+    """Gives each test its own fake binding for IedServer.
+
+    The fake is spec'd to the real binding's symbols, so a test that touches a
+    function the binding does not export fails instead of growing a child mock.
+    It is injected through ``IedServer(_iec_lib=...)`` rather than patched into
+    pyiec61850.server.server, so tests share no module state.
+    """
+
+    def setUp(self):
+        self.mock_iec = make_binding()
+
+    def _make_server(self, *args, **kwargs):
+        """Return an IedServer that calls ``self.mock_iec``."""
+        from pyiec61850.server import IedServer
+
+        return IedServer(*args, _iec_lib=self.mock_iec, **kwargs)
+
+    def _seed_running(self):
+        """Make ``self.mock_iec`` load a model and report a started server."""
+        self.mock_iec.configure_mock(
+            **{
+                "ConfigFileParser_createModelFromConfigFileEx.return_value": SENTINEL_MODEL,
+                "IedServer_create.return_value": SENTINEL_SERVER,
+                "IedServer_isRunning.return_value": True,
+                "IedModel_getModelNodeByObjectReference.return_value": SENTINEL_NODE,
+            }
+        )
+
+    def _started(self, config=None):
+        """Return an IedServer on "model.cfg", started against ``self.mock_iec``."""
+        self._seed_running()
+        srv = self._make_server("model.cfg", config=config)
+        srv.start()
+        return srv
@@ -8,51 +8,87 @@ requiring the actual C library (uses mocks).
 
 import logging
 import unittest
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
+
+from pyiec61850.mms import client as _client_mod
+from pyiec61850.mms import utils as _utils_mod
+
+from .support import run_lazy_import_check
 
 # Suppress logging during tests
 logging.disable(logging.CRITICAL)
 
+# Binding names the utils guards and the TestMMSClient paths touch. Mocks
+# spec'd to this set resolve these from the spec instead of synthesising a
+# child mock for any attribute name, and a mistyped name raises AttributeError.
+_IEC_SPEC = (
+    "IED_ERROR_OK",
+    "IedClientError_toString",
+    "IedConnection_close",
+    "IedConnection_connect",
+    "IedConnection_create",
+    "IedConnection_destroy",
+    "IedConnection_getLogicalDeviceList",
+    "IedConnection_setConnectTimeout",
+    "LinkedList_destroy",
+    "LinkedList_getData",
+    "LinkedList_getNext",
+    "MmsError_destroy",
+    "MmsServerIdentity_destroy",
+    "MmsValue_delete",
+    "toCharP",
+)
+
+
+def _iec_mock():
+    """Return a ``MagicMock`` restricted to ``_IEC_SPEC``."""
+    return MagicMock(spec=_IEC_SPEC)
+
+
+def _ll_mock(n, mock_iec=None):
+    """Wire ``mock_iec`` to walk an ``n``-element LinkedList of device names.
+
+    Returns ``(mock_iec, names)``; a fresh spec'd mock is used when
+    ``mock_iec`` is omitted. Elements are plain ``object()`` handles and the
+    side effects are tuples, so no per-element mocks are allocated.
+    """
+    if mock_iec is None:
+        mock_iec = _iec_mock()
+    elems = tuple(object() for _ in range(n))
+    names = [f"Dev{i}" for i in range(n)]
+    mock_iec.LinkedList_getNext.side_effect = elems + (None,)
+    mock_iec.LinkedList_getData.side_effect = elems
+    mock_iec.toCharP.side_effect = tuple(names)
+    return mock_iec, names
+
 
 class TestMmsImports(unittest.TestCase):
     """Test that mms module imports correctly."""
 
-    def test_import_module(self):
-        """Test basic module import."""
-        from pyiec61850 import mms
-
-        self.assertIsNotNone(mms)
-
-    def test_import_client(self):
-        """Test MMSClient import."""
-        from pyiec61850.mms import MMSClient
-
-        self.assertIsNotNone(MMSClient)
-
-    def test_import_utils(self):
-        """Test utility functions import."""
-        from pyiec61850.mms import (
-            safe_to_char_p,
-        )
-
-        self.assertIsNotNone(safe_to_char_p)
-
-    def test_import_guards(self):
-        """Test context manager guards import."""
-        from pyiec61850.mms import (
-            LinkedListGuard,
-        )
-
-        self.assertIsNotNone(LinkedListGuard)
-
-    def test_import_exceptions(self):
-        """Test exception classes import."""
-        from pyiec61850.mms import (
-            ConnectionFailedError,
-            MMSError,
-        )
-
-        self.assertTrue(issubclass(ConnectionFailedError, MMSError))
+    def test_public_api(self):
+        """Package exposes the client, utilities, guards and exceptions."""
+        import pyiec61850.mms as mms
+
+        for name in (
+            "MMSClient",
+            "safe_to_char_p",
+            "safe_linked_list_iter",
+            "LinkedListGuard",
+            "MmsValueGuard",
+            "MmsErrorGuard",
+            "IdentityGuard",
+            "MMSError",
+            "ConnectionFailedError",
+            "NotConnectedError",
+            "NullPointerError",
+        ):
+            self.assertTrue(hasattr(mms, name), name)
+        self.assertTrue(issubclass(mms.ConnectionFailedError, mms.MMSError))
+
+    def test_client_import_is_lazy(self):
+        """Importing the package must not load the client module (PEP 562)."""
+        result = run_lazy_import_check("pyiec61850.mms", "MMSClient", "pyiec61850.mms.client")
+        self.assertEqual(result.returncode, 0, result.stderr)
 
 
 class TestSafeToCharP(unittest.TestCase):
@@ -63,7 +99,7 @@ class TestSafeToCharP(unittest.TestCase):
         from pyiec61850.mms.utils import safe_to_char_p
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 result = safe_to_char_p(None)
                 self.assertIsNone(result)
                 # toCharP should NOT be called with None
@@ -74,7 +110,7 @@ class TestSafeToCharP(unittest.TestCase):
         from pyiec61850.mms.utils import safe_to_char_p
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 result = safe_to_char_p(0)
                 self.assertIsNone(result)
                 mock_iec.toCharP.assert_not_called()
@@ -84,7 +120,7 @@ class TestSafeToCharP(unittest.TestCase):
         from pyiec61850.mms.utils import safe_to_char_p
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_iec.toCharP.return_value = "test_string"
                 mock_ptr = Mock()
                 result = safe_to_char_p(mock_ptr)
@@ -96,7 +132,7 @@ class TestSafeToCharP(unittest.TestCase):
         from pyiec61850.mms.utils import safe_to_char_p
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_iec.toCharP.side_effect = Exception("Segfault avoided!")
                 mock_ptr = Mock()
                 result = safe_to_char_p(mock_ptr)
@@ -111,7 +147,7 @@ class TestSafeLinkedListIter(unittest.TestCase):
         from pyiec61850.mms.utils import safe_linked_list_iter
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850"):
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock):
                 result = list(safe_linked_list_iter(None))
                 self.assertEqual(result, [])
 
@@ -119,29 +155,18 @@ class TestSafeLinkedListIter(unittest.TestCase):
         """Should iterate and convert valid elements."""
         from pyiec61850.mms.utils import safe_linked_list_iter
 
-        with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
-                # Setup mock linked list with 3 elements
-                mock_list = Mock()
-                elem1, elem2, elem3 = Mock(), Mock(), Mock()
-                data1, data2, data3 = Mock(), Mock(), Mock()
-
-                # LinkedList_getNext chain
-                mock_iec.LinkedList_getNext.side_effect = [elem1, elem2, elem3, None]
-                # LinkedList_getData for each element
-                mock_iec.LinkedList_getData.side_effect = [data1, data2, data3]
-                # toCharP conversion
-                mock_iec.toCharP.side_effect = ["Device1", "Device2", "Device3"]
-
-                result = list(safe_linked_list_iter(mock_list))
-                self.assertEqual(result, ["Device1", "Device2", "Device3"])
+        mock_iec, expected = _ll_mock(3)
+        with patch.object(_utils_mod, "_HAS_IEC61850", True):
+            with patch.object(_utils_mod, "iec61850", mock_iec):
+                result = list(safe_linked_list_iter(Mock()))
+                self.assertEqual(result, expected)
 
     def test_skips_null_data_elements(self):
         """NULL data elements should be skipped (Issue #2)."""
         from pyiec61850.mms.utils import safe_linked_list_iter
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_list = Mock()
                 elem1, elem2 = Mock(), Mock()
 
@@ -163,7 +188,7 @@ class TestLinkedListGuard(unittest.TestCase):
         from pyiec61850.mms.utils import LinkedListGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_list = Mock()
 
                 with LinkedListGuard(mock_list) as guard:
@@ -176,7 +201,7 @@ class TestLinkedListGuard(unittest.TestCase):
         from pyiec61850.mms.utils import LinkedListGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850"):
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock):
                 mock_list = Mock()
                 guard = LinkedListGuard(mock_list)
 
@@ -190,7 +215,7 @@ class TestLinkedListGuard(unittest.TestCase):
         from pyiec61850.mms.utils import LinkedListGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 with LinkedListGuard(None) as guard:
                     self.assertIsNone(guard.list)
 
@@ -202,7 +227,7 @@ class TestLinkedListGuard(unittest.TestCase):
         from pyiec61850.mms.utils import LinkedListGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_list = Mock()
                 mock_iec.LinkedList_getNext.side_effect = [Mock(), None]
                 mock_iec.LinkedList_getData.return_value = Mock()
@@ -222,7 +247,7 @@ class TestMmsValueGuard(unittest.TestCase):
         from pyiec61850.mms.utils import MmsValueGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_value = Mock()
 
                 with MmsValueGuard(mock_value) as guard:
@@ -235,7 +260,7 @@ class TestMmsValueGuard(unittest.TestCase):
         from pyiec61850.mms.utils import MmsValueGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850"):
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock):
                 mock_value = Mock()
                 guard = MmsValueGuard(mock_value)
 
@@ -253,7 +278,7 @@ class TestMmsErrorGuard(unittest.TestCase):
         from pyiec61850.mms.utils import MmsErrorGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_iec.MmsError_destroy = Mock()
                 mock_error = Mock()
 
@@ -272,7 +297,7 @@ class TestIdentityGuard(unittest.TestCase):
         from pyiec61850.mms.utils import IdentityGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 mock_identity = Mock()
 
                 with IdentityGuard(mock_identity) as guard:
@@ -285,7 +310,7 @@ class TestIdentityGuard(unittest.TestCase):
         from pyiec61850.mms.utils import IdentityGuard
 
         with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850") as mock_iec:
+            with patch("pyiec61850.mms.utils.iec61850", new_callable=_iec_mock) as mock_iec:
                 with IdentityGuard(None) as guard:
                     self.assertIsNone(guard.identity)
 
@@ -295,15 +320,32 @@ class TestIdentityGuard(unittest.TestCase):
 class TestMMSClient(unittest.TestCase):
     """Test MMSClient class."""
 
+    def setUp(self):
+        from pyiec61850.mms import MMSClient
+
+        self.mock_iec = _iec_mock()
+        self.mock_iec.IedConnection_create.return_value = Mock()
+        self.mock_iec.IedConnection_connect.return_value = 0
+        self.mock_iec.IED_ERROR_OK = 0
+        for p in (
+            patch("pyiec61850._libload.have_library", return_value=True),
+            patch.object(_client_mod, "_HAS_IEC61850", True),
+            patch.object(_client_mod, "iec61850", self.mock_iec),
+        ):
+            p.start()
+            self.addCleanup(p.stop)
+        self.client = MMSClient()
+        # Registered after the patches so it runs first (LIFO), while the
+        # mock binding is still installed.
+        self.addCleanup(self.client.disconnect)
+
+    def _connect(self):
+        self.client.connect("192.168.1.100", 102)
+
     def test_client_creation(self):
         """Client should be creatable when library available."""
-        with patch("pyiec61850.mms.client._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.client.iec61850"):
-                from pyiec61850.mms import MMSClient
-
-                client = MMSClient()
-                self.assertIsNotNone(client)
-                self.assertFalse(client.is_connected)
+        self.assertIsNotNone(self.client)
+        self.assertFalse(self.client.is_connected)
 
     def test_client_raises_without_library(self):
         """Client should raise LibraryNotFoundError if library missing.
@@ -320,116 +362,63 @@ class TestMMSClient(unittest.TestCase):
 
     def test_connect_success(self):
         """Successful connection."""
-        with patch("pyiec61850.mms.client._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.client.iec61850") as mock_iec:
-                mock_conn = Mock()
-                mock_iec.IedConnection_create.return_value = mock_conn
-                mock_iec.IED_ERROR_OK = 0
-                mock_iec.IedConnection_connect.return_value = 0  # Use actual value
+        result = self.client.connect("192.168.1.100", 102)
 
-                from pyiec61850.mms import MMSClient
-
-                client = MMSClient()
-                result = client.connect("192.168.1.100", 102)
-
-                self.assertTrue(result)
-                self.assertTrue(client.is_connected)
-                self.assertEqual(client.host, "192.168.1.100")
-                self.assertEqual(client.port, 102)
+        self.assertTrue(result)
+        self.assertTrue(self.client.is_connected)
+        self.assertEqual(self.client.host, "192.168.1.100")
+        self.assertEqual(self.client.port, 102)
 
     def test_connect_failure(self):
         """Connection failure should raise ConnectionFailedError."""
-        with patch("pyiec61850.mms.client._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.client.iec61850") as mock_iec:
-                mock_conn = Mock()
-                mock_iec.IedConnection_create.return_value = mock_conn
-                mock_iec.IedConnection_connect.return_value = 1  # Error
-                mock_iec.IED_ERROR_OK = 0
-
-                from pyiec61850.mms import ConnectionFailedError, MMSClient
+        from pyiec61850.mms import ConnectionFailedError
 
-                client = MMSClient()
+        self.mock_iec.IedConnection_connect.return_value = 1  # Error
 
-                with self.assertRaises(ConnectionFailedError):
-                    client.connect("192.168.1.100", 102)
+        with self.assertRaises(ConnectionFailedError):
+            self._connect()
 
     def test_disconnect_cleanup(self):
         """Disconnect should clean up resources."""
-        with patch("pyiec61850.mms.client._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.client.iec61850") as mock_iec:
-                mock_conn = Mock()
-                mock_iec.IedConnection_create.return_value = mock_conn
-                mock_iec.IedConnection_connect.return_value = 0
-                mock_iec.IED_ERROR_OK = 0
-
-                from pyiec61850.mms import MMSClient
+        self._connect()
+        self.client.disconnect()
 
-                client = MMSClient()
-                client.connect("192.168.1.100", 102)
-                client.disconnect()
-
-                mock_iec.IedConnection_close.assert_called_once()
-                mock_iec.IedConnection_destroy.assert_called_once()
-                self.assertFalse(client.is_connected)
+        self.mock_iec.IedConnection_close.assert_called_once()
+        self.mock_iec.IedConnection_destroy.assert_called_once()
+        self.assertFalse(self.client.is_connected)
 
     def test_context_manager(self):
         """Context manager should auto-disconnect."""
-        with patch("pyiec61850.mms.client._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.client.iec61850") as mock_iec:
-                mock_conn = Mock()
-                mock_iec.IedConnection_create.return_value = mock_conn
-                mock_iec.IedConnection_connect.return_value = 0
-                mock_iec.IED_ERROR_OK = 0
-
-                from pyiec61850.mms import MMSClient
+        with self.client as client:
+            client.connect("192.168.1.100", 102)
 
-                with MMSClient() as client:
-                    client.connect("192.168.1.100", 102)
-
-                # Should be disconnected after exiting context
-                mock_iec.IedConnection_destroy.assert_called()
+        # Should be disconnected after exiting context
+        self.mock_iec.IedConnection_destroy.assert_called()
 
     def test_get_logical_devices_uses_guard(self):
         """get_logical_devices should use safe LinkedList handling."""
-        with patch("pyiec61850.mms.client._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-                with patch("pyiec61850.mms.client.iec61850") as mock_iec:
-                    with patch("pyiec61850.mms.utils.iec61850", mock_iec):
-                        mock_conn = Mock()
-                        mock_iec.IedConnection_create.return_value = mock_conn
-                        mock_iec.IedConnection_connect.return_value = 0
-                        mock_iec.IED_ERROR_OK = 0
-
-                        # Mock the device list result
-                        mock_list = Mock()
-                        mock_iec.IedConnection_getLogicalDeviceList.return_value = (mock_list, 0)
-
-                        # Mock LinkedList iteration
-                        elem1 = Mock()
-                        mock_iec.LinkedList_getNext.side_effect = [elem1, None]
-                        mock_iec.LinkedList_getData.return_value = Mock()
-                        mock_iec.toCharP.return_value = "TestDevice"
+        with patch.object(_utils_mod, "_HAS_IEC61850", True):
+            with patch.object(_utils_mod, "iec61850", self.mock_iec):
+                # Mock the device list result
+                mock_list = Mock()
+                self.mock_iec.IedConnection_getLogicalDeviceList.return_value = (mock_list, 0)
 
-                        from pyiec61850.mms import MMSClient
+                # Mock LinkedList iteration
+                _, expected = _ll_mock(1, self.mock_iec)
 
-                        client = MMSClient()
-                        client.connect("192.168.1.100", 102)
-                        devices = client.get_logical_devices()
+                self._connect()
+                devices = self.client.get_logical_devices()
 
-                        self.assertEqual(devices, ["TestDevice"])
-                        # LinkedList should be destroyed
-                        mock_iec.LinkedList_destroy.assert_called_once_with(mock_list)
+                self.assertEqual(devices, expected)
+                # LinkedList should be destroyed
+                self.mock_iec.LinkedList_destroy.assert_called_once_with(mock_list)
 
     def test_not_connected_error(self):
         """Operations without connection should raise NotConnectedError."""
-        with patch("pyiec61850.mms.client._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.client.iec61850"):
-                from pyiec61850.mms import MMSClient, NotConnectedError
+        from pyiec61850.mms import NotConnectedError
 
-                client = MMSClient()
-
-                with self.assertRaises(NotConnectedError):
-                    client.get_logical_devices()
+        with self.assertRaises(NotConnectedError):
+            self.client.get_logical_devices()
 
 
 class TestUnpackResult(unittest.TestCase):
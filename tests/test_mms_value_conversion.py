@@ -2,378 +2,296 @@
 """
 Tests for mms_value_to_python and python_to_mms_value.
 
-All tests use mocks (no C library needed).
+All tests use mocks (no C library needed). Plain pytest functions; logging
+is silenced for the whole session in conftest.py.
 """
 
-import logging
-import unittest
+import copy
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-logging.disable(logging.CRITICAL)
-
-
-class TestMmsValueToPython(unittest.TestCase):
-    """Test mms_value_to_python conversion function."""
-
-    def _call(self, mock_iec, mms_value):
-        """Helper to call mms_value_to_python with mocked library."""
-        with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850", mock_iec):
-                from pyiec61850.mms.utils import mms_value_to_python
-
-                return mms_value_to_python(mms_value)
-
-    def test_none_returns_none(self):
-        """None input returns None."""
-        mock_iec = Mock()
-        result = self._call(mock_iec, None)
-        self.assertIsNone(result)
-
-    def test_zero_returns_none(self):
-        """Zero (C NULL) returns None."""
-        mock_iec = Mock()
-        result = self._call(mock_iec, 0)
-        self.assertIsNone(result)
-
-    def test_boolean_true(self):
-        mock_iec = Mock()
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MmsValue_getType.return_value = 2
-        mock_iec.MmsValue_getBoolean.return_value = True
-        result = self._call(mock_iec, Mock())
-        self.assertIs(result, True)
-
-    def test_boolean_false(self):
-        mock_iec = Mock()
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MmsValue_getType.return_value = 2
-        mock_iec.MmsValue_getBoolean.return_value = False
-        result = self._call(mock_iec, Mock())
-        self.assertIs(result, False)
-
-    def test_integer(self):
-        mock_iec = Mock()
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MmsValue_getType.return_value = 4
-        mock_iec.MmsValue_toInt64.return_value = -42
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, -42)
-        self.assertIsInstance(result, int)
-
-    def test_unsigned(self):
-        mock_iec = Mock()
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MmsValue_getType.return_value = 5
-        mock_iec.MmsValue_toUint32.return_value = 65535
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, 65535)
-        self.assertIsInstance(result, int)
-
-    def test_float(self):
-        mock_iec = Mock()
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MmsValue_getType.return_value = 6
-        mock_iec.MmsValue_toFloat.return_value = 3.14
-        result = self._call(mock_iec, Mock())
-        self.assertAlmostEqual(result, 3.14)
-        self.assertIsInstance(result, float)
-
-    def test_visible_string(self):
-        mock_iec = Mock()
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MmsValue_getType.return_value = 8
-        mock_iec.MmsValue_toString.return_value = "hello"
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, "hello")
-        self.assertIsInstance(result, str)
-
-    def test_mms_string(self):
-        mock_iec = Mock()
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MmsValue_getType.return_value = 13
-        mock_iec.MmsValue_toString.return_value = "mms_string"
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, "mms_string")
-
-    def test_bit_string(self):
-        mock_iec = Mock()
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MmsValue_getType.return_value = 3
-        mock_iec.MmsValue_getBitStringAsInteger.return_value = 0xFF
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, 255)
-
-    def test_octet_string(self):
-        mock_iec = Mock()
-        mock_iec.MMS_OCTET_STRING = 7
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MmsValue_getType.return_value = 7
-        mock_iec.MmsValue_getOctetStringSize.return_value = 3
-        mock_iec.MmsValue_getOctetStringBuffer.return_value = Mock()
-        mock_iec.MmsValue_getOctetStringOctet.side_effect = [0xDE, 0xAD, 0xBE]
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, b"\xde\xad\xbe")
-        self.assertIsInstance(result, bytes)
-
-    def test_octet_string_empty(self):
-        mock_iec = Mock()
-        mock_iec.MMS_OCTET_STRING = 7
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MmsValue_getType.return_value = 7
-        mock_iec.MmsValue_getOctetStringSize.return_value = 0
-        mock_iec.MmsValue_getOctetStringBuffer.return_value = None
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, b"")
-
-    def test_utc_time(self):
-        mock_iec = Mock()
-        mock_iec.MMS_UTC_TIME = 14
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MMS_OCTET_STRING = 7
-        mock_iec.MMS_STRUCTURE = 1
-        mock_iec.MMS_ARRAY = 0
-        mock_iec.MMS_BINARY_TIME = 10
-        mock_iec.MmsValue_getType.return_value = 14
-        mock_iec.MmsValue_getUtcTimeInMs.return_value = 1700000000000
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, 1700000000000)
-
-    def test_binary_time(self):
-        mock_iec = Mock()
-        mock_iec.MMS_BINARY_TIME = 10
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MMS_OCTET_STRING = 7
-        mock_iec.MMS_STRUCTURE = 1
-        mock_iec.MMS_ARRAY = 0
-        mock_iec.MMS_UTC_TIME = 14
-        mock_iec.MmsValue_getType.return_value = 10
-        mock_iec.MmsValue_getBinaryTimeAsUtcMs.return_value = 1700000000000
-        result = self._call(mock_iec, Mock())
-        self.assertEqual(result, 1700000000000)
-
-    def test_data_access_error(self):
-        mock_iec = Mock()
-        mock_iec.MMS_DATA_ACCESS_ERROR = 15
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MMS_OCTET_STRING = 7
-        mock_iec.MMS_STRUCTURE = 1
-        mock_iec.MMS_ARRAY = 0
-        mock_iec.MMS_UTC_TIME = 14
-        mock_iec.MMS_BINARY_TIME = 10
-        mock_iec.MmsValue_getType.return_value = 15
-        result = self._call(mock_iec, Mock())
-        self.assertIsNone(result)
-
-    def test_array_recursive(self):
-        """Arrays should be recursively converted."""
-        mock_iec = Mock()
-        mock_iec.MMS_ARRAY = 0
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MMS_OCTET_STRING = 7
-        mock_iec.MMS_STRUCTURE = 1
-        mock_iec.MMS_UTC_TIME = 14
-        mock_iec.MMS_BINARY_TIME = 10
-        mock_iec.MMS_DATA_ACCESS_ERROR = 15
-
-        arr_val = Mock(name="array")
-        elem0 = Mock(name="elem0")
-        elem1 = Mock(name="elem1")
-
-        # First call: array, then element calls: int, bool
-        mock_iec.MmsValue_getType.side_effect = [0, 4, 2]
-        mock_iec.MmsValue_getArraySize.return_value = 2
-        mock_iec.MmsValue_getElement.side_effect = [elem0, elem1]
-        mock_iec.MmsValue_toInt64.return_value = 99
-        mock_iec.MmsValue_getBoolean.return_value = True
-
-        result = self._call(mock_iec, arr_val)
-        self.assertEqual(result, [99, True])
-
-    def test_structure_recursive(self):
-        """Structures should be recursively converted to dict."""
-        mock_iec = Mock()
-        mock_iec.MMS_STRUCTURE = 1
-        mock_iec.MMS_BOOLEAN = 2
-        mock_iec.MMS_INTEGER = 4
-        mock_iec.MMS_UNSIGNED = 5
-        mock_iec.MMS_FLOAT = 6
-        mock_iec.MMS_VISIBLE_STRING = 8
-        mock_iec.MMS_STRING = 13
-        mock_iec.MMS_BIT_STRING = 3
-        mock_iec.MMS_OCTET_STRING = 7
-        mock_iec.MMS_ARRAY = 0
-        mock_iec.MMS_UTC_TIME = 14
-        mock_iec.MMS_BINARY_TIME = 10
-        mock_iec.MMS_DATA_ACCESS_ERROR = 15
-
-        struct_val = Mock(name="struct")
-        field0 = Mock(name="field0")
-
-        mock_iec.MmsValue_getType.side_effect = [1, 6]
-        mock_iec.MmsValue_getArraySize.return_value = 1
-        mock_iec.MmsValue_getElement.return_value = field0
-        mock_iec.MmsValue_toFloat.return_value = 2.71
-
-        result = self._call(mock_iec, struct_val)
-        self.assertEqual(result, {0: 2.71})
-
-    def test_library_not_found(self):
-        """Should raise LibraryNotFoundError when library missing."""
-        from pyiec61850.mms.exceptions import LibraryNotFoundError
-        from pyiec61850.mms.utils import mms_value_to_python
-
-        with patch("pyiec61850._libload.have_library", return_value=False):
-            with self.assertRaises(LibraryNotFoundError):
-                mms_value_to_python(Mock())
-
-
-class TestPythonToMmsValue(unittest.TestCase):
-    """Test python_to_mms_value conversion function."""
-
-    def _call(self, mock_iec, value):
-        """Helper to call python_to_mms_value with mocked library."""
-        with patch("pyiec61850.mms.utils._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.utils.iec61850", mock_iec):
-                from pyiec61850.mms.utils import python_to_mms_value
-
-                return python_to_mms_value(value)
-
-    def test_bool_true(self):
-        mock_iec = Mock()
-        mock_iec.MmsValue_newBoolean.return_value = "bool_handle"
-        result = self._call(mock_iec, True)
-        mock_iec.MmsValue_newBoolean.assert_called_once_with(True)
-        self.assertEqual(result, "bool_handle")
-
-    def test_bool_false(self):
-        mock_iec = Mock()
-        mock_iec.MmsValue_newBoolean.return_value = "bool_handle"
-        self._call(mock_iec, False)
-        mock_iec.MmsValue_newBoolean.assert_called_once_with(False)
-
-    def test_bool_before_int(self):
-        """bool is subclass of int -- must create boolean, not integer."""
-        mock_iec = Mock()
-        mock_iec.MmsValue_newBoolean.return_value = "bool_handle"
-        self._call(mock_iec, True)
-        mock_iec.MmsValue_newBoolean.assert_called_once()
-        mock_iec.MmsValue_newIntegerFromInt64.assert_not_called()
-
-    def test_int(self):
-        mock_iec = Mock()
-        mock_iec.MmsValue_newIntegerFromInt64.return_value = "int_handle"
-        result = self._call(mock_iec, 42)
-        mock_iec.MmsValue_newIntegerFromInt64.assert_called_once_with(42)
-        self.assertEqual(result, "int_handle")
-
-    def test_negative_int(self):
-        mock_iec = Mock()
-        mock_iec.MmsValue_newIntegerFromInt64.return_value = "int_handle"
-        self._call(mock_iec, -100)
-        mock_iec.MmsValue_newIntegerFromInt64.assert_called_once_with(-100)
-
-    def test_float(self):
-        mock_iec = Mock()
-        mock_iec.MmsValue_newFloat.return_value = "float_handle"
-        result = self._call(mock_iec, 3.14)
-        mock_iec.MmsValue_newFloat.assert_called_once_with(3.14)
-        self.assertEqual(result, "float_handle")
-
-    def test_string(self):
-        mock_iec = Mock()
-        mock_iec.MmsValue_newVisibleString.return_value = "str_handle"
-        result = self._call(mock_iec, "hello")
-        mock_iec.MmsValue_newVisibleString.assert_called_once_with("hello")
-        self.assertEqual(result, "str_handle")
-
-    def test_empty_string(self):
-        mock_iec = Mock()
-        mock_iec.MmsValue_newVisibleString.return_value = "str_handle"
-        self._call(mock_iec, "")
-        mock_iec.MmsValue_newVisibleString.assert_called_once_with("")
-
-    def test_unsupported_type_raises_type_error(self):
-        mock_iec = Mock()
-        with self.assertRaises(TypeError) as ctx:
-            self._call(mock_iec, [1, 2, 3])
-        self.assertIn("list", str(ctx.exception))
-
-    def test_unsupported_type_dict(self):
-        mock_iec = Mock()
-        with self.assertRaises(TypeError):
-            self._call(mock_iec, {"key": "val"})
-
-    def test_unsupported_type_bytes(self):
-        mock_iec = Mock()
-        with self.assertRaises(TypeError):
-            self._call(mock_iec, b"\x00")
-
-    def test_library_not_found(self):
-        from pyiec61850.mms.exceptions import LibraryNotFoundError
-        from pyiec61850.mms.utils import python_to_mms_value
-
-        with patch("pyiec61850._libload.have_library", return_value=False):
-            with self.assertRaises(LibraryNotFoundError):
-                python_to_mms_value(42)
-
-
-if __name__ == "__main__":
-    unittest.main()
+import pytest
+
+from pyiec61850 import _libload
+from pyiec61850.mms import utils as _utils
+from pyiec61850.mms.exceptions import LibraryNotFoundError
+from pyiec61850.mms.utils import mms_value_to_python, python_to_mms_value
+
+# MMS type codes as exported by the binding (mms_common.h MmsType).
+_MMS_CONSTS = {
+    "MMS_ARRAY": 0,
+    "MMS_STRUCTURE": 1,
+    "MMS_BOOLEAN": 2,
+    "MMS_BIT_STRING": 3,
+    "MMS_INTEGER": 4,
+    "MMS_UNSIGNED": 5,
+    "MMS_FLOAT": 6,
+    "MMS_OCTET_STRING": 7,
+    "MMS_VISIBLE_STRING": 8,
+    "MMS_BINARY_TIME": 10,
+    "MMS_STRING": 13,
+    "MMS_UTC_TIME": 14,
+    "MMS_DATA_ACCESS_ERROR": 15,
+}
+
+
+# Every binding name the two conversion helpers touch. Mocks are built with
+# spec_set on this list, so a typo in a test fails instead of silently
+# creating a new child mock.
+_IEC_SPEC = (
+    *_MMS_CONSTS,
+    "MmsValue_getArraySize",
+    "MmsValue_getBinaryTimeAsUtcMs",
+    "MmsValue_getBitStringAsInteger",
+    "MmsValue_getBoolean",
+    "MmsValue_getElement",
+    "MmsValue_getOctetStringBuffer",
+    "MmsValue_getOctetStringOctet",
+    "MmsValue_getOctetStringSize",
+    "MmsValue_getType",
+    "MmsValue_getUtcTimeInMs",
+    "MmsValue_newBoolean",
+    "MmsValue_newFloat",
+    "MmsValue_newIntegerFromInt64",
+    "MmsValue_newVisibleString",
+    "MmsValue_toFloat",
+    "MmsValue_toInt64",
+    "MmsValue_toString",
+    "MmsValue_toUint32",
+)
+
+
+def _make_iec():
+    """Return a spec'd mock binding carrying the MMS type constants."""
+    mock_iec = Mock(spec_set=_IEC_SPEC)
+    mock_iec.configure_mock(**_MMS_CONSTS)
+    return mock_iec
+
+
+def _octets(data):
+    """Stand-in for ``MmsValue_getOctetStringOctet`` backed by ``data``.
+
+    Indexes one bytes buffer by position, like the C getter, instead of
+    popping from a per-call side_effect list.
+    """
+    return lambda _value, index: data[index]
+
+
+def _install_tree(mock_iec, tree):
+    """Drive ``mock_iec``'s getters from ``tree``.
+
+    ``tree`` maps each value handle to ``(MMS type code, payload)``. For
+    arrays and structures the payload is the list of element handles; for
+    scalars it is what the type's getter returns. Every handle looks up its
+    own entry, so nesting depth and element order need no side_effect lists.
+    """
+
+    def payload(value):
+        return tree[value][1]
+
+    mock_iec.configure_mock(
+        **{
+            "MmsValue_getType.side_effect": lambda value: tree[value][0],
+            "MmsValue_getArraySize.side_effect": lambda value: len(payload(value)),
+            "MmsValue_getElement.side_effect": lambda value, index: payload(value)[index],
+            "MmsValue_getBoolean.side_effect": payload,
+            "MmsValue_toInt64.side_effect": payload,
+            "MmsValue_toFloat.side_effect": payload,
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def _library():
+    """Open the native-library gate the conversion helpers check first."""
+    with (
+        patch.object(_libload, "have_library", return_value=True),
+        patch.object(_utils, "_HAS_IEC61850", True),
+    ):
+        yield
+
+
+@pytest.fixture(scope="module")
+def iec_template():
+    """MMS_* constant bag built once per module and copied by ``iec_ns``.
+
+    A Mock cannot serve as the template: copies would share its child mocks.
+    """
+    return SimpleNamespace(**_MMS_CONSTS)
+
+
+@pytest.fixture
+def iec_ns(iec_template):
+    """Install a plain attribute-bag binding into pyiec61850.mms.utils.
+
+    Cheaper than ``iec_mock`` for tests that only read constants and call a
+    getter or two, with no call assertions.
+    """
+    iec = copy.copy(iec_template)
+    with patch.object(_utils, "iec61850", iec):
+        yield iec
+
+
+@pytest.fixture
+def iec_mock():
+    """Install a fresh ``_make_iec()`` binding into pyiec61850.mms.utils."""
+    mock_iec = _make_iec()
+    with patch.object(_utils, "iec61850", mock_iec):
+        yield mock_iec
+
+
+# -- mms_value_to_python ------------------------------------------------------
+
+# (MMS type code, getter used for that type, getter return, expected result)
+CASES = [
+    (2, "MmsValue_getBoolean", True, True),
+    (2, "MmsValue_getBoolean", False, False),
+    (4, "MmsValue_toInt64", -42, -42),
+    (5, "MmsValue_toUint32", 65535, 65535),
+    (6, "MmsValue_toFloat", 3.14, 3.14),
+    (8, "MmsValue_toString", "hello", "hello"),
+    (13, "MmsValue_toString", "mms_string", "mms_string"),
+    (3, "MmsValue_getBitStringAsInteger", 0xFF, 255),
+    (14, "MmsValue_getUtcTimeInMs", 1700000000000, 1700000000000),
+    (10, "MmsValue_getBinaryTimeAsUtcMs", 1700000000000, 1700000000000),
+]
+
+
+@pytest.mark.parametrize("tcode,getter,ret,expected", CASES)
+def test_type_dispatch(iec_ns, tcode, getter, ret, expected):
+    """Each scalar MMS type is read through its getter and coerced to Python."""
+    iec_ns.MmsValue_getType = lambda _value: tcode
+    setattr(iec_ns, getter, lambda _value: ret)
+    result = mms_value_to_python(Mock())
+    assert result == expected and type(result) is type(expected)
+
+
+@pytest.mark.parametrize("null", [None, 0], ids=["none", "zero"])
+def test_null_returns_none(iec_ns, null):
+    """None and 0 (C NULL) both convert to None."""
+    assert mms_value_to_python(null) is None
+
+
+def test_octet_string(iec_mock):
+    data = b"\xde\xad\xbe"
+    iec_mock.configure_mock(
+        **{
+            "MmsValue_getType.return_value": 7,
+            "MmsValue_getOctetStringSize.return_value": len(data),
+            "MmsValue_getOctetStringBuffer.return_value": Mock(),
+            "MmsValue_getOctetStringOctet.side_effect": _octets(data),
+        }
+    )
+    result = mms_value_to_python(Mock())
+    assert result == data
+    assert isinstance(result, bytes)
+
+
+def test_octet_string_empty(iec_mock):
+    iec_mock.configure_mock(
+        **{
+            "MmsValue_getType.return_value": 7,
+            "MmsValue_getOctetStringSize.return_value": 0,
+            "MmsValue_getOctetStringBuffer.return_value": None,
+        }
+    )
+    assert mms_value_to_python(Mock()) == b""
+
+
+def test_data_access_error(iec_ns):
+    iec_ns.MmsValue_getType = lambda _value: 15
+    assert mms_value_to_python(Mock()) is None
+
+
+def test_array_recursive(iec_mock):
+    """Arrays should be recursively converted."""
+    arr_val, elem0, elem1 = object(), object(), object()
+    _install_tree(
+        iec_mock,
+        {
+            arr_val: (0, [elem0, elem1]),
+            elem0: (4, 99),
+            elem1: (2, True),
+        },
+    )
+    assert mms_value_to_python(arr_val) == [99, True]
+
+
+def test_structure_recursive(iec_mock):
+    """Structures should be recursively converted to dict."""
+    struct_val, field0 = object(), object()
+    _install_tree(iec_mock, {struct_val: (1, [field0]), field0: (6, 2.71)})
+    assert mms_value_to_python(struct_val) == {0: 2.71}
+
+
+def test_mms_value_to_python_library_not_found():
+    """Should raise LibraryNotFoundError when library missing."""
+    with patch.object(_libload, "have_library", return_value=False):
+        with pytest.raises(LibraryNotFoundError):
+            mms_value_to_python(Mock())
+
+
+# -- python_to_mms_value ------------------------------------------------------
+
+
+def test_bool_true(iec_mock):
+    iec_mock.MmsValue_newBoolean.return_value = "bool_handle"
+    assert python_to_mms_value(True) == "bool_handle"
+    iec_mock.MmsValue_newBoolean.assert_called_once_with(True)
+
+
+def test_bool_false(iec_mock):
+    python_to_mms_value(False)
+    iec_mock.MmsValue_newBoolean.assert_called_once_with(False)
+
+
+def test_bool_before_int(iec_mock):
+    """bool is subclass of int -- must create boolean, not integer."""
+    python_to_mms_value(True)
+    iec_mock.MmsValue_newBoolean.assert_called_once()
+    iec_mock.MmsValue_newIntegerFromInt64.assert_not_called()
+
+
+def test_int(iec_mock):
+    iec_mock.MmsValue_newIntegerFromInt64.return_value = "int_handle"
+    assert python_to_mms_value(42) == "int_handle"
+    iec_mock.MmsValue_newIntegerFromInt64.assert_called_once_with(42)
+
+
+def test_negative_int(iec_mock):
+    python_to_mms_value(-100)
+    iec_mock.MmsValue_newIntegerFromInt64.assert_called_once_with(-100)
+
+
+def test_float(iec_mock):
+    iec_mock.MmsValue_newFloat.return_value = "float_handle"
+    assert python_to_mms_value(3.14) == "float_handle"
+    iec_mock.MmsValue_newFloat.assert_called_once_with(3.14)
+
+
+def test_string(iec_mock):
+    iec_mock.MmsValue_newVisibleString.return_value = "str_handle"
+    assert python_to_mms_value("hello") == "str_handle"
+    iec_mock.MmsValue_newVisibleString.assert_called_once_with("hello")
+
+
+def test_empty_string(iec_mock):
+    python_to_mms_value("")
+    iec_mock.MmsValue_newVisibleString.assert_called_once_with("")
+
+
+@pytest.mark.parametrize(
+    "bad",
+    [[1, 2, 3], {"key": "val"}, b"\x00", (1, 2), set(), None],
+    ids=lambda value: type(value).__name__,
+)
+def test_unsupported_type_raises_type_error(iec_mock, bad):
+    """Anything but bool/int/float/str is rejected, naming the offending type."""
+    with pytest.raises(TypeError, match=type(bad).__name__):
+        python_to_mms_value(bad)
+
+
+def test_python_to_mms_value_library_not_found():
+    with patch.object(_libload, "have_library", return_value=False):
+        with pytest.raises(LibraryNotFoundError):
+            python_to_mms_value(42)
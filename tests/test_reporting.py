@@ -2,37 +2,129 @@
 """
 Tests for pyiec61850.mms.reporting module - Report Control Block client.
 
-All tests use mocks since the C library isn't available in dev.
+All tests use mocks since the C library isn't available in dev. The binding
+is installed per test by the ``mock_iec`` fixture.
+
+Every fixture here is function-scoped and undoes its patches through
+``monkeypatch``; module-level objects are read-only sentinels. Tests can
+therefore run in any order or split across pytest-xdist workers
+(``pytest -n auto``).
 """
 
-import logging
-import unittest
-from unittest.mock import Mock, patch
+import re
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Optional
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from pyiec61850 import _libload
+from pyiec61850.mms import reporting
+from pyiec61850.mms.exceptions import (
+    LibraryNotFoundError,
+    NotConnectedError,
+    ReadError,
+)
+
+from .support import run_lazy_import_check
+
+_SUPER_INIT_RE = re.compile(r"super\(\)\.__init__")
+
+
+@pytest.fixture
+def mock_iec(monkeypatch):
+    """Install a MagicMock binding into pyiec61850.mms.reporting."""
+    monkeypatch.setattr(_libload, "have_library", lambda: True)
+    monkeypatch.setattr(reporting, "_HAS_IEC61850", True)
+    m = MagicMock()
+    m.IED_ERROR_OK = 0
+    monkeypatch.setattr(reporting, "iec61850", m)
+    return m
+
+
+@pytest.fixture
+def mms_client():
+    """A connected MMSClient stand-in (ReportClient reads only these two)."""
+    return SimpleNamespace(is_connected=True, _connection=SimpleNamespace())
+
+
+@pytest.fixture
+def disconnected_mms_client():
+    """An MMSClient stand-in whose connection has dropped."""
+    return SimpleNamespace(is_connected=False)
+
+
+@pytest.fixture
+def report_client(mock_iec, mms_client):
+    """ReportClient over ``mms_client``, built with the binding installed."""
+    return reporting.ReportClient(mms_client)
+
+
+def _ignore_report(report):
+    """Report callback for tests that do not inspect delivered reports."""
+
+
+# ClientReport_* header getters trigger() reads, plus element getters under
+# which every data-set element reads back as an INTEGER included for reason 1.
+_DEFAULT_REPORT_ATTRS = {
+    "ClientReport_getRptId.return_value": "rpt01",
+    "ClientReport_getDataSetName.return_value": "ds01",
+    "ClientReport_getSeqNum.return_value": 1,
+    "ClientReport_getSubSeqNum.return_value": 0,
+    "ClientReport_getMoreSegementsFollow.return_value": False,
+    "ClientReport_hasTimestamp.return_value": False,
+    "ClientReport_hasBufOvfl.return_value": False,
+    "ClientReport_getConfRev.return_value": 1,
+    "ClientReport_getDataSetValues.return_value": None,
+    "ClientReport_getReasonForInclusion.return_value": 1,
+    "MMS_INTEGER": 4,
+    "MmsValue_getType.return_value": 4,
+    "MmsValue_toInt32.return_value": 100,
+}
+
 
-logging.disable(logging.CRITICAL)
+@pytest.fixture
+def report_defaults(mock_iec):
+    """``mock_iec`` configured with ``_DEFAULT_REPORT_ATTRS``."""
+    mock_iec.configure_mock(**_DEFAULT_REPORT_ATTRS)
+    return mock_iec
 
 
-class TestReportingImports(unittest.TestCase):
+@pytest.fixture
+def make_handler():
+    """Factory for ``_PyRCBHandler`` instances on a fixed RCB reference.
+
+    conftest.py keys the director crash-path skip on this fixture name.
+    """
+
+    def _make(callback=_ignore_report):
+        return reporting._PyRCBHandler(callback, "myLD/LLN0$BR$brcb01")
+
+    return _make
+
+
+class TestReportingImports:
     """Test reporting module imports."""
 
     def test_import_report_client(self):
         from pyiec61850.mms.reporting import ReportClient
 
-        self.assertIsNotNone(ReportClient)
+        assert ReportClient is not None
 
     def test_import_types(self):
         from pyiec61850.mms.reporting import RCBConfig, Report, ReportEntry
 
-        self.assertIsNotNone(Report)
-        self.assertIsNotNone(ReportEntry)
-        self.assertIsNotNone(RCBConfig)
+        assert Report is not None
+        assert ReportEntry is not None
+        assert RCBConfig is not None
 
     def test_import_exceptions(self):
         from pyiec61850.mms.exceptions import MMSError
         from pyiec61850.mms.reporting import ReportConfigError, ReportError
 
-        self.assertTrue(issubclass(ReportError, MMSError))
-        self.assertTrue(issubclass(ReportConfigError, ReportError))
+        assert issubclass(ReportError, MMSError)
+        assert issubclass(ReportConfigError, ReportError)
 
     def test_import_constants(self):
         from pyiec61850.mms.reporting import (
@@ -40,511 +132,304 @@ class TestReportingImports(unittest.TestCase):
             TRG_OPT_GI,
         )
 
-        self.assertEqual(TRG_OPT_DATA_CHANGED, 1)
-        self.assertEqual(TRG_OPT_GI, 16)
+        assert TRG_OPT_DATA_CHANGED == 1
+        assert TRG_OPT_GI == 16
+
+    def test_package_import_is_lazy(self):
+        """Importing pyiec61850.mms must not load the reporting module (PEP 562)."""
+        result = run_lazy_import_check("pyiec61850.mms", "ReportClient", "pyiec61850.mms.reporting")
+        assert result.returncode == 0, result.stderr
 
 
-class TestReport(unittest.TestCase):
+class TestReport:
     """Test Report dataclass."""
 
     def test_default_creation(self):
-        from pyiec61850.mms.reporting import Report
-
-        report = Report()
-        self.assertEqual(report.rcb_reference, "")
-        self.assertEqual(report.entries, [])
-        self.assertEqual(report.seq_num, 0)
+        report = reporting.Report()
+        assert report.rcb_reference == ""
+        assert report.entries == []
+        assert report.seq_num == 0
 
     def test_to_dict(self):
-        from pyiec61850.mms.reporting import Report
-
-        report = Report(rcb_reference="myLD/LLN0$BR$brcb01", seq_num=5)
+        report = reporting.Report(rcb_reference="myLD/LLN0$BR$brcb01", seq_num=5)
         d = report.to_dict()
-        self.assertEqual(d["rcb_reference"], "myLD/LLN0$BR$brcb01")
-        self.assertEqual(d["seq_num"], 5)
+        assert d["rcb_reference"] == "myLD/LLN0$BR$brcb01"
+        assert d["seq_num"] == 5
 
 
-class TestRCBConfig(unittest.TestCase):
+class TestRCBConfig:
     """Test RCBConfig dataclass."""
 
     def test_default_values(self):
-        from pyiec61850.mms.reporting import RCBConfig
-
-        cfg = RCBConfig()
-        self.assertIsNone(cfg.rpt_id)
-        self.assertIsNone(cfg.data_set)
-        self.assertIsNone(cfg.rpt_ena)
+        cfg = reporting.RCBConfig()
+        assert cfg.rpt_id is None
+        assert cfg.data_set is None
+        assert cfg.rpt_ena is None
 
     def test_to_dict(self):
-        from pyiec61850.mms.reporting import RCBConfig
-
-        cfg = RCBConfig(rpt_id="rpt01", data_set="ds01", rpt_ena=True)
+        cfg = reporting.RCBConfig(rpt_id="rpt01", data_set="ds01", rpt_ena=True)
         d = cfg.to_dict()
-        self.assertEqual(d["rpt_id"], "rpt01")
-        self.assertEqual(d["data_set"], "ds01")
-        self.assertTrue(d["rpt_ena"])
+        assert d["rpt_id"] == "rpt01"
+        assert d["data_set"] == "ds01"
+        assert d["rpt_ena"]
 
 
-class TestReportClient(unittest.TestCase):
+class TestReportClient:
     """Test ReportClient class."""
 
-    def _make_mock_mms_client(self):
-        client = Mock()
-        client.is_connected = True
-        client._connection = Mock()
-        return client
-
-    def test_raises_without_library(self):
-        with patch("pyiec61850._libload.have_library", return_value=False):
-            from pyiec61850.mms.exceptions import LibraryNotFoundError
-            from pyiec61850.mms.reporting import ReportClient
-
-            with self.assertRaises(LibraryNotFoundError):
-                ReportClient(Mock())
-
-    def test_creation_success(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850"):
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                self.assertFalse(reports.is_active)
-
-    def test_get_rcb_values(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.IED_ERROR_OK = 0
-                mock_rcb = Mock()
-                mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
-                mock_iec.ClientReportControlBlock_getRptId.return_value = "rpt01"
-                mock_iec.ClientReportControlBlock_getDataSetReference.return_value = "ds01"
-                mock_iec.ClientReportControlBlock_getTrgOps.return_value = 5
-                mock_iec.ClientReportControlBlock_getRptEna.return_value = True
-
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                config = reports.get_rcb_values("myLD/LLN0$BR$brcb01")
-
-                self.assertEqual(config.rpt_id, "rpt01")
-                self.assertEqual(config.data_set, "ds01")
-                self.assertTrue(config.rpt_ena)
-
-    def test_get_rcb_values_not_connected(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850"):
-                from pyiec61850.mms.exceptions import NotConnectedError
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = Mock()
-                client.is_connected = False
-                reports = ReportClient(client)
-                with self.assertRaises(NotConnectedError):
-                    reports.get_rcb_values("test")
-
-    def test_get_rcb_values_error(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.IED_ERROR_OK = 0
-                mock_iec.IedConnection_getRCBValues.return_value = (None, 5)
-
-                from pyiec61850.mms.exceptions import ReadError
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                with self.assertRaises(ReadError):
-                    reports.get_rcb_values("test")
-
-    def test_enable_reporting(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.IED_ERROR_OK = 0
-                mock_rcb = Mock()
-                mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
-                mock_iec.IedConnection_setRCBValues.return_value = 0
-
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                reports.enable_reporting("myLD/LLN0$BR$brcb01")
-
-                mock_iec.ClientReportControlBlock_setRptEna.assert_called()
-
-    def test_disable_reporting(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.IED_ERROR_OK = 0
-                mock_rcb = Mock()
-                mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
-                mock_iec.IedConnection_setRCBValues.return_value = 0
-
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                reports.disable_reporting("myLD/LLN0$BR$brcb01")
-
-                mock_iec.ClientReportControlBlock_setRptEna.assert_called_with(mock_rcb, False)
-
-    def test_trigger_gi_report(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.IED_ERROR_OK = 0
-                mock_rcb = Mock()
-                mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
-                mock_iec.IedConnection_setRCBValues.return_value = 0
-
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                reports.trigger_gi_report("myLD/LLN0$BR$brcb01")
-
-                mock_iec.ClientReportControlBlock_setGI.assert_called()
-
-    def test_install_report_handler_not_callable(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850"):
-                from pyiec61850.mms.reporting import ReportClient, ReportError
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                with self.assertRaises(ReportError):
-                    reports.install_report_handler("test", "rpt01", "not_callable")
-
-    def test_uninstall_report_handler(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850"):
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                reports._handlers["test"] = Mock()
-                reports._callbacks["test"] = Mock()
-                reports.uninstall_report_handler("test")
-                self.assertNotIn("test", reports._handlers)
-                self.assertNotIn("test", reports._callbacks)
-
-    def test_context_manager(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850"):
-                from pyiec61850.mms.reporting import ReportClient
-
-                client = self._make_mock_mms_client()
-                with ReportClient(client) as reports:
-                    reports._handlers["test"] = Mock()
-                # All handlers should be cleared after exit
-                self.assertEqual(len(reports._handlers), 0)
-
-
-class TestPyRCBHandlerDirectorInheritance(unittest.TestCase):
+    def test_raises_without_library(self, monkeypatch):
+        monkeypatch.setattr(_libload, "have_library", lambda: False)
+        with pytest.raises(LibraryNotFoundError):
+            reporting.ReportClient(object())
+
+    def test_creation_success(self, report_client):
+        assert not report_client.is_active
+
+    def test_get_rcb_values(self, mock_iec, report_client):
+        mock_rcb = object()
+        mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
+        mock_iec.ClientReportControlBlock_getRptId.return_value = "rpt01"
+        mock_iec.ClientReportControlBlock_getDataSetReference.return_value = "ds01"
+        mock_iec.ClientReportControlBlock_getTrgOps.return_value = 5
+        mock_iec.ClientReportControlBlock_getRptEna.return_value = True
+
+        config = report_client.get_rcb_values("myLD/LLN0$BR$brcb01")
+
+        assert config.rpt_id == "rpt01"
+        assert config.data_set == "ds01"
+        assert config.rpt_ena
+
+    def test_get_rcb_values_not_connected(self, mock_iec, disconnected_mms_client):
+        reports = reporting.ReportClient(disconnected_mms_client)
+        with pytest.raises(NotConnectedError):
+            reports.get_rcb_values("test")
+
+    def test_get_rcb_values_error(self, mock_iec, report_client):
+        mock_iec.IedConnection_getRCBValues.return_value = (None, 5)
+
+        with pytest.raises(ReadError):
+            report_client.get_rcb_values("test")
+
+    def test_enable_reporting(self, mock_iec, report_client):
+        mock_rcb = object()
+        mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
+        mock_iec.IedConnection_setRCBValues.return_value = 0
+
+        report_client.enable_reporting("myLD/LLN0$BR$brcb01")
+
+        mock_iec.ClientReportControlBlock_setRptEna.assert_called()
+
+    def test_disable_reporting(self, mock_iec, report_client):
+        mock_rcb = object()
+        mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
+        mock_iec.IedConnection_setRCBValues.return_value = 0
+
+        report_client.disable_reporting("myLD/LLN0$BR$brcb01")
+
+        mock_iec.ClientReportControlBlock_setRptEna.assert_called_with(mock_rcb, False)
+
+    def test_trigger_gi_report(self, mock_iec, report_client):
+        mock_rcb = object()
+        mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
+        mock_iec.IedConnection_setRCBValues.return_value = 0
+
+        report_client.trigger_gi_report("myLD/LLN0$BR$brcb01")
+
+        mock_iec.ClientReportControlBlock_setGI.assert_called()
+
+    def test_install_report_handler_not_callable(self, report_client):
+        with pytest.raises(reporting.ReportError):
+            report_client.install_report_handler("test", "rpt01", "not_callable")
+
+    def test_uninstall_report_handler(self, report_client):
+        report_client._handlers["test"] = object()
+        report_client._callbacks["test"] = _ignore_report
+        report_client.uninstall_report_handler("test")
+        assert "test" not in report_client._handlers
+        assert "test" not in report_client._callbacks
+
+    def test_context_manager(self, report_client):
+        with report_client as reports:
+            reports._handlers["test"] = object()
+        # All handlers should be cleared after exit
+        assert len(reports._handlers) == 0
+
+
+class TestPyRCBHandlerDirectorInheritance:
     """_PyRCBHandler must properly inherit from RCBHandler for SWIG director."""
 
     def test_base_class_is_dynamic(self):
         """_RCBHandlerBase must exist as module-level dynamic base class."""
-        from pyiec61850.mms import reporting
-
-        self.assertTrue(
-            hasattr(reporting, "_RCBHandlerBase"),
-            "_RCBHandlerBase not defined — handler won't inherit from RCBHandler",
+        assert hasattr(reporting, "_RCBHandlerBase"), (
+            "_RCBHandlerBase not defined — handler won't inherit from RCBHandler"
         )
 
     def test_handler_uses_dynamic_base(self):
         """_PyRCBHandler must inherit from _RCBHandlerBase, not plain object."""
-        from pyiec61850.mms.reporting import _PyRCBHandler, _RCBHandlerBase
-
-        self.assertTrue(
-            issubclass(_PyRCBHandler, _RCBHandlerBase),
-            "_PyRCBHandler does not inherit from _RCBHandlerBase",
+        assert issubclass(reporting._PyRCBHandler, reporting._RCBHandlerBase), (
+            "_PyRCBHandler does not inherit from _RCBHandlerBase"
         )
 
-    def test_handler_calls_super_init(self):
+    def test_handler_calls_super_init(self, pyrcb_init_source):
         """__init__ must call super().__init__(), not iec61850.X.__init__(self)."""
-        import inspect
-
-        from pyiec61850.mms.reporting import _PyRCBHandler
-
-        source = inspect.getsource(_PyRCBHandler.__init__)
-        self.assertIn("super().__init__", source)
-        self.assertNotIn("RCBHandler.__init__(self)", source)
-
-
-class TestPyRCBHandlerTriggerCrashPaths(unittest.TestCase):
+        assert _SUPER_INIT_RE.search(pyrcb_init_source)
+        assert "RCBHandler.__init__(self)" not in pyrcb_init_source
+
+
+_DATA_SET = object()
+_ELEMENT = object()
+
+
+@dataclass(frozen=True)
+class _TriggerCase:
+    """What the binding returns during one trigger(), and what must arrive."""
+
+    has_client_report: bool = True
+    has_callback: bool = True
+    ds_values: object = None
+    array_size: int = 0
+    element_side_effect: object = None
+    # Entries in the single delivered report; None means nothing is delivered.
+    expected_entries: Optional[int] = None
+
+
+_TRIGGER_CASES = [
+    pytest.param(_TriggerCase(has_client_report=False), id="null-client-report"),
+    pytest.param(_TriggerCase(has_callback=False), id="null-callback"),
+    pytest.param(
+        _TriggerCase(ds_values=_DATA_SET, array_size=2, expected_entries=2),
+        id="entries-extracted",
+    ),
+    pytest.param(_TriggerCase(expected_entries=0), id="null-ds-values"),
+    pytest.param(
+        _TriggerCase(
+            ds_values=_DATA_SET,
+            array_size=2,
+            element_side_effect=[None, _ELEMENT],
+            expected_entries=1,
+        ),
+        id="null-element-skipped",
+    ),
+]
+
+
+class TestPyRCBHandlerTriggerCrashPaths:
     """Test _PyRCBHandler.trigger() crash paths.
 
     trigger() runs in C++ context -- any unhandled exception = segfault.
     """
 
-    def _make_handler(self, callback=None):
-        from pyiec61850.mms.reporting import _PyRCBHandler
+    @pytest.mark.parametrize("case", _TRIGGER_CASES)
+    def test_trigger(self, report_defaults, make_handler, case):
+        """trigger() must never raise, and deliver what it could extract."""
+        mock_iec = report_defaults
+        reports = []
+        handler = make_handler(reports.append if case.has_callback else None)
+        if case.has_client_report:
+            handler._client_report = object()
 
-        return _PyRCBHandler(callback or Mock(), "myLD/LLN0$BR$brcb01")
+        mock_iec.ClientReport_getDataSetValues.return_value = case.ds_values
+        mock_iec.MmsValue_getArraySize.return_value = case.array_size
+        mock_iec.MmsValue_getElement.side_effect = case.element_side_effect
 
-    def test_trigger_with_null_client_report_no_crash(self):
-        """trigger() must not crash when _client_report attribute is missing."""
-        handler = self._make_handler()
-        # _client_report is not set -- accessing it will raise AttributeError
         handler.trigger()  # Must not raise
 
-    def test_trigger_callback_exception_no_crash(self):
-        """trigger() must catch callback exceptions."""
-        callback = Mock(side_effect=RuntimeError("callback exploded"))
-        handler = self._make_handler(callback)
-        handler._client_report = Mock()
-
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.ClientReport_getRptId.return_value = "rpt01"
-                mock_iec.ClientReport_getDataSetName.return_value = "ds01"
-                mock_iec.ClientReport_getSeqNum.return_value = 1
-                mock_iec.ClientReport_getSubSeqNum.return_value = 0
-                mock_iec.ClientReport_getMoreSegementsFollow.return_value = False
-                mock_iec.ClientReport_hasTimestamp.return_value = False
-                mock_iec.ClientReport_hasBufOvfl.return_value = False
-                mock_iec.ClientReport_getConfRev.return_value = 1
-                mock_iec.ClientReport_getDataSetValues.return_value = None
-                handler.trigger()  # Must not raise despite callback crash
-
-    def test_trigger_with_null_callback_no_crash(self):
-        """trigger() must handle None callback."""
-        handler = self._make_handler()
-        handler._callback = None
-        handler._client_report = Mock()
-
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.ClientReport_getRptId.return_value = "rpt01"
-                mock_iec.ClientReport_getDataSetName.return_value = "ds01"
-                mock_iec.ClientReport_getSeqNum.return_value = 1
-                mock_iec.ClientReport_getSubSeqNum.return_value = 0
-                mock_iec.ClientReport_getMoreSegementsFollow.return_value = False
-                mock_iec.ClientReport_hasTimestamp.return_value = False
-                mock_iec.ClientReport_hasBufOvfl.return_value = False
-                mock_iec.ClientReport_getConfRev.return_value = 1
-                mock_iec.ClientReport_getDataSetValues.return_value = None
-                handler.trigger()  # Must not raise
-
-    def test_trigger_extracts_report_entries(self):
-        """trigger() must extract data set values into report entries."""
-        callback = Mock()
-        handler = self._make_handler(callback)
-        handler._client_report = Mock()
-
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.ClientReport_getRptId.return_value = "rpt01"
-                mock_iec.ClientReport_getDataSetName.return_value = "ds01"
-                mock_iec.ClientReport_getSeqNum.return_value = 1
-                mock_iec.ClientReport_getSubSeqNum.return_value = 0
-                mock_iec.ClientReport_getMoreSegementsFollow.return_value = False
-                mock_iec.ClientReport_hasTimestamp.return_value = False
-                mock_iec.ClientReport_hasBufOvfl.return_value = False
-                mock_iec.ClientReport_getConfRev.return_value = 1
-
-                mock_ds = Mock()
-                mock_iec.ClientReport_getDataSetValues.return_value = mock_ds
-                mock_iec.MmsValue_getArraySize.return_value = 2
-                mock_elem = Mock()
-                mock_iec.MmsValue_getElement.return_value = mock_elem
-                mock_iec.ClientReport_getReasonForInclusion.return_value = 1
-                mock_iec.MMS_INTEGER = 4
-                mock_iec.MmsValue_getType.return_value = 4
-                mock_iec.MmsValue_toInt32.return_value = 100
-
-                handler.trigger()
-
-                callback.assert_called_once()
-                report = callback.call_args[0][0]
-                self.assertEqual(len(report.entries), 2)
-
-    def test_trigger_null_data_set_values_no_crash(self):
-        """trigger() with NULL getDataSetValues must not crash."""
-        callback = Mock()
-        handler = self._make_handler(callback)
-        handler._client_report = Mock()
-
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.ClientReport_getRptId.return_value = ""
-                mock_iec.ClientReport_getDataSetName.return_value = ""
-                mock_iec.ClientReport_getSeqNum.return_value = 0
-                mock_iec.ClientReport_getSubSeqNum.return_value = 0
-                mock_iec.ClientReport_getMoreSegementsFollow.return_value = False
-                mock_iec.ClientReport_hasTimestamp.return_value = False
-                mock_iec.ClientReport_hasBufOvfl.return_value = False
-                mock_iec.ClientReport_getConfRev.return_value = 0
-                mock_iec.ClientReport_getDataSetValues.return_value = None
-
-                handler.trigger()
-
-                report = callback.call_args[0][0]
-                self.assertEqual(report.entries, [])
-
-    def test_trigger_null_element_skipped(self):
-        """trigger() must skip NULL elements in data set values."""
-        callback = Mock()
-        handler = self._make_handler(callback)
-        handler._client_report = Mock()
-
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.ClientReport_getRptId.return_value = ""
-                mock_iec.ClientReport_getDataSetName.return_value = ""
-                mock_iec.ClientReport_getSeqNum.return_value = 0
-                mock_iec.ClientReport_getSubSeqNum.return_value = 0
-                mock_iec.ClientReport_getMoreSegementsFollow.return_value = False
-                mock_iec.ClientReport_hasTimestamp.return_value = False
-                mock_iec.ClientReport_hasBufOvfl.return_value = False
-                mock_iec.ClientReport_getConfRev.return_value = 0
-
-                mock_ds = Mock()
-                mock_iec.ClientReport_getDataSetValues.return_value = mock_ds
-                mock_iec.MmsValue_getArraySize.return_value = 2
-                # First NULL, second valid
-                mock_iec.MmsValue_getElement.side_effect = [None, Mock()]
-                mock_iec.ClientReport_getReasonForInclusion.return_value = 0
-                mock_iec.MMS_INTEGER = 4
-                mock_iec.MmsValue_getType.return_value = 4
-                mock_iec.MmsValue_toInt32.return_value = 42
-
-                handler.trigger()
-
-                report = callback.call_args[0][0]
-                self.assertEqual(len(report.entries), 1)
-
-
-class TestReportClientInstallHandler(unittest.TestCase):
-    """Test install_report_handler with SWIG director path."""
+        # The report is parsed whenever there is one, even with no callback.
+        assert mock_iec.ClientReport_getDataSetValues.called is case.has_client_report
+        if not case.has_callback:
+            return
+        if case.expected_entries is None:
+            assert reports == []
+        else:
+            assert len(reports) == 1
+            assert len(reports[0].entries) == case.expected_entries
 
-    def _make_mock_mms_client(self):
-        client = Mock()
-        client.is_connected = True
-        client._connection = Mock()
-        return client
-
-    def test_install_handler_with_director_classes(self):
-        """install_report_handler with RCBHandler/RCBSubscriber director classes."""
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.RCBHandler = type("RCBHandler", (), {"__init__": lambda self: None})
-                mock_subscriber_instance = Mock()
-                mock_subscriber_instance.subscribe.return_value = True
-                mock_iec.RCBSubscriber.return_value = mock_subscriber_instance
+    def test_trigger_callback_exception(self, report_defaults, make_handler):
+        """A raising callback is contained, and the handler keeps delivering."""
+        reports = []
 
-                from pyiec61850.mms.reporting import ReportClient
+        def callback(report):
+            reports.append(report)
+            raise RuntimeError("callback exploded")
 
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                reports.install_report_handler("myLD/LLN0$BR$brcb01", "rpt01", Mock())
+        handler = make_handler(callback)
+        handler._client_report = object()
 
-                self.assertIn("myLD/LLN0$BR$brcb01", reports._handlers)
+        handler.trigger()  # Must not raise
+        handler.trigger()
 
-    def test_install_handler_subscribe_fails(self):
-        """If subscriber.subscribe() returns False, must raise ReportError."""
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.RCBHandler = type("RCBHandler", (), {"__init__": lambda self: None})
-                mock_subscriber_instance = Mock()
-                mock_subscriber_instance.subscribe.return_value = False
-                mock_iec.RCBSubscriber.return_value = mock_subscriber_instance
+        assert len(reports) == 2
 
-                from pyiec61850.mms.reporting import ReportClient, ReportError
 
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                with self.assertRaises(ReportError):
-                    reports.install_report_handler("myLD/LLN0$BR$brcb01", "rpt01", Mock())
+class TestReportClientInstallHandler:
+    """Test install_report_handler with SWIG director path."""
 
-    def test_install_handler_fallback_no_director(self):
-        """Without RCBHandler/RCBSubscriber, must use direct API fallback."""
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                # Remove director classes
-                if hasattr(mock_iec, "RCBHandler"):
-                    del mock_iec.RCBHandler
-                if hasattr(mock_iec, "RCBSubscriber"):
-                    del mock_iec.RCBSubscriber
+    def test_install_handler_with_director_classes(self, mock_iec, report_client):
+        """install_report_handler with RCBHandler/RCBSubscriber director classes."""
+        mock_iec.RCBHandler = type("RCBHandler", (), {"__init__": lambda self: None})
+        mock_subscriber_instance = Mock()
+        mock_subscriber_instance.subscribe.return_value = True
+        mock_iec.RCBSubscriber.return_value = mock_subscriber_instance
 
-                from pyiec61850.mms.reporting import ReportClient
+        report_client.install_report_handler("myLD/LLN0$BR$brcb01", "rpt01", _ignore_report)
 
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                reports.install_report_handler("myLD/LLN0$BR$brcb01", "rpt01", Mock())
+        assert "myLD/LLN0$BR$brcb01" in report_client._handlers
 
-                mock_iec.IedConnection_installReportHandler.assert_called_once()
+    def test_install_handler_subscribe_fails(self, mock_iec, report_client):
+        """If subscriber.subscribe() returns False, must raise ReportError."""
+        mock_iec.RCBHandler = type("RCBHandler", (), {"__init__": lambda self: None})
+        mock_subscriber_instance = Mock()
+        mock_subscriber_instance.subscribe.return_value = False
+        mock_iec.RCBSubscriber.return_value = mock_subscriber_instance
 
+        with pytest.raises(reporting.ReportError):
+            report_client.install_report_handler("myLD/LLN0$BR$brcb01", "rpt01", _ignore_report)
 
-class TestReportingExtractMmsValue(unittest.TestCase):
-    """Test _extract_mms_value in reporting module."""
+    def test_install_handler_fallback_no_director(self, mock_iec, report_client):
+        """Without RCBHandler/RCBSubscriber, must use direct API fallback."""
+        # Remove director classes
+        del mock_iec.RCBHandler
+        del mock_iec.RCBSubscriber
 
-    def test_null_returns_none(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            from pyiec61850.mms.reporting import _extract_mms_value
+        report_client.install_report_handler("myLD/LLN0$BR$brcb01", "rpt01", _ignore_report)
 
-            self.assertIsNone(_extract_mms_value(None))
+        mock_iec.IedConnection_installReportHandler.assert_called_once()
 
-    def test_no_library_returns_none(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", False):
-            from pyiec61850.mms.reporting import _extract_mms_value
 
-            self.assertIsNone(_extract_mms_value(Mock()))
+class TestReportingExtractMmsValue:
+    """Test _extract_mms_value in reporting module."""
 
-    def test_exception_returns_none(self):
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.MmsValue_getType.side_effect = RuntimeError("crash")
+    def test_null_returns_none(self, monkeypatch):
+        monkeypatch.setattr(reporting, "_HAS_IEC61850", True)
+        assert reporting._extract_mms_value(None) is None
 
-                from pyiec61850.mms.reporting import _extract_mms_value
+    def test_no_library_returns_none(self, monkeypatch):
+        monkeypatch.setattr(reporting, "_HAS_IEC61850", False)
+        assert reporting._extract_mms_value(object()) is None
 
-                self.assertIsNone(_extract_mms_value(Mock()))
+    def test_exception_returns_none(self, mock_iec):
+        mock_iec.MmsValue_getType.side_effect = RuntimeError("crash")
+        assert reporting._extract_mms_value(object()) is None
 
 
-class TestSetRCBValuesWriteError(unittest.TestCase):
+class TestSetRCBValuesWriteError:
     """Test set_rcb_values write error path."""
 
-    def _make_mock_mms_client(self):
-        client = Mock()
-        client.is_connected = True
-        client._connection = Mock()
-        return client
-
-    def test_set_rcb_values_write_error(self):
+    def test_set_rcb_values_write_error(self, mock_iec, report_client):
         """set_rcb_values must raise ReportConfigError on write error."""
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.IED_ERROR_OK = 0
-                mock_rcb = Mock()
-                mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
-                mock_iec.IedConnection_setRCBValues.return_value = 5  # Error
-                mock_iec.RCB_ELEMENT_RPT_ENA = 0x04
-
-                from pyiec61850.mms.reporting import RCBConfig, ReportClient, ReportConfigError
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                config = RCBConfig(rpt_ena=True)
-                with self.assertRaises(ReportConfigError):
-                    reports.set_rcb_values("test", config)
-
-    def test_set_rcb_values_null_rcb(self):
-        """set_rcb_values with NULL RCB result must raise ReportConfigError."""
-        with patch("pyiec61850.mms.reporting._HAS_IEC61850", True):
-            with patch("pyiec61850.mms.reporting.iec61850") as mock_iec:
-                mock_iec.IED_ERROR_OK = 0
-                mock_iec.IedConnection_getRCBValues.return_value = (None, 0)
+        mock_rcb = object()
+        mock_iec.IedConnection_getRCBValues.return_value = (mock_rcb, 0)
+        mock_iec.IedConnection_setRCBValues.return_value = 5  # Error
+        mock_iec.RCB_ELEMENT_RPT_ENA = 0x04
 
-                from pyiec61850.mms.reporting import RCBConfig, ReportClient, ReportConfigError
-
-                client = self._make_mock_mms_client()
-                reports = ReportClient(client)
-                config = RCBConfig(rpt_ena=True)
-                with self.assertRaises(ReportConfigError):
-                    reports.set_rcb_values("test", config)
+        config = reporting.RCBConfig(rpt_ena=True)
+        with pytest.raises(reporting.ReportConfigError):
+            report_client.set_rcb_values("test", config)
 
+    def test_set_rcb_values_null_rcb(self, mock_iec, report_client):
+        """set_rcb_values with NULL RCB result must raise ReportConfigError."""
+        mock_iec.IedConnection_getRCBValues.return_value = (None, 0)
 
-if __name__ == "__main__":
-    unittest.main()
+        config = reporting.RCBConfig(rpt_ena=True)
+        with pytest.raises(reporting.ReportConfigError):
+            report_client.set_rcb_values("test", config)
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Tests for pyiec61850.server - module imports and ServerConfig.
+
+All tests use mocks since the C library isn't available in dev.
+"""
+
+import unittest
+
+from pyiec61850.server import ServerConfig
+
+
+class TestServerImports(unittest.TestCase):
+    """Test server module imports."""
+
+    def test_public_api_symbols(self):
+        from pyiec61850 import server
+        from pyiec61850.server import (
+            CONTROL_ACCEPTED,
+            IedServer,
+            ModelError,
+            ServerConfig,
+            ServerError,
+            UpdateError,
+        )
+
+        for name, obj in (
+            ("server", server),
+            ("IedServer", IedServer),
+            ("ServerConfig", ServerConfig),
+        ):
+            with self.subTest(name=name):
+                self.assertIsNotNone(obj)
+        self.assertTrue(issubclass(ModelError, ServerError))
+        self.assertTrue(issubclass(UpdateError, ServerError))
+        self.assertEqual(CONTROL_ACCEPTED, 0)
+
+
+class TestServerConfig(unittest.TestCase):
+    """Test ServerConfig dataclass."""
+
+    def test_default_values(self):
+        cfg = ServerConfig()
+        self.assertEqual(cfg.port, 102)
+        self.assertEqual(cfg.max_connections, 5)
+        self.assertFalse(cfg.enable_goose_publishing)
+
+    def test_custom_values(self):
+        cfg = ServerConfig(port=8102, max_connections=20, enable_goose_publishing=True)
+        self.assertEqual(cfg.port, 8102)
+        self.assertEqual(cfg.max_connections, 20)
+        self.assertTrue(cfg.enable_goose_publishing)
+
+    def test_to_dict(self):
+        cfg = ServerConfig(port=102)
+        d = cfg.to_dict()
+        self.assertEqual(d["port"], 102)
+        self.assertIn("max_connections", d)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Tests for pyiec61850.server - IedServer crash and error paths.
+
+All tests use mocks since the C library isn't available in dev.
+"""
+
+import unittest
+from unittest.mock import Mock, call
+
+from pyiec61850.server import (
+    ControlHandlerError,
+    ModelError,
+    NotRunningError,
+    ServerConfig,
+    ServerError,
+)
+
+from .support import SENTINEL_CONFIG, SENTINEL_MODEL, SENTINEL_SERVER, ServerTestCase
+
+# (IedServer method, arguments) pairs that require a running server.
+_NOT_RUNNING_CALLS = [
+    ("update_boolean", ("myLD/GGIO1.Ind1.stVal", True)),
+    ("set_control_handler", ("myLD/CSWI1.Pos", lambda *args: None)),
+    ("enable_goose_publishing", ()),
+    ("disable_goose_publishing", ()),
+    ("get_number_of_open_connections", ()),
+]
+
+
+class TestIedServerCrashPaths(ServerTestCase):
+    """Test IedServer crash paths: start/stop, cleanup ordering, model loading."""
+
+    def test_load_model_fallback_api(self):
+        """Without the Ex loader, _load_model must fall back to IedModel_createFromConfigFile."""
+        del self.mock_iec.ConfigFileParser_createModelFromConfigFileEx
+        # Not exported by the current binding; older builds provided it.
+        self.mock_iec.IedModel_createFromConfigFile = Mock(return_value=SENTINEL_MODEL)
+
+        srv = self._make_server("model.cfg")
+
+        self.assertIs(srv._model, SENTINEL_MODEL)
+        self.assertEqual(
+            self.mock_iec.IedModel_createFromConfigFile.call_args_list, [call("model.cfg")]
+        )
+
+    def test_load_model_no_api_available(self):
+        """_load_model with no loading API must raise ModelError."""
+        del self.mock_iec.ConfigFileParser_createModelFromConfigFileEx
+
+        with self.assertRaises(ModelError):
+            self._make_server("model.cfg")
+
+    def test_load_model_exception_wraps(self):
+        """_load_model must wrap unexpected exceptions in ModelError."""
+        self.mock_iec.ConfigFileParser_createModelFromConfigFileEx.side_effect = RuntimeError(
+            "disk fail"
+        )
+
+        with self.assertRaises(ModelError):
+            self._make_server("model.cfg")
+
+    def test_start_server_create_null(self):
+        """IedServer_create returning NULL must raise ServerError."""
+        self.mock_iec.ConfigFileParser_createModelFromConfigFileEx.return_value = SENTINEL_MODEL
+        # Remove config API so it falls through to IedServer_create
+        del self.mock_iec.IedServerConfig_create
+        self.mock_iec.IedServer_create.return_value = None
+
+        srv = self._make_server("model.cfg")
+        with self.assertRaises(ServerError):
+            srv.start()
+
+    def test_start_unexpected_exception_triggers_cleanup(self):
+        """Unexpected exception during start must trigger _cleanup."""
+        self.mock_iec.ConfigFileParser_createModelFromConfigFileEx.return_value = SENTINEL_MODEL
+        self.mock_iec.IedServerConfig_create.return_value = SENTINEL_CONFIG
+        # Without TLS configured, start() creates the server with IedServer_create.
+        self.mock_iec.IedServer_create.side_effect = RuntimeError("out of memory")
+
+        srv = self._make_server("model.cfg")
+        with self.assertRaises(ServerError):
+            srv.start()
+
+        self.assertIsNone(srv._server)
+        self.assertIsNone(srv._ied_server_config)
+        self.assertIsNone(srv._model)
+        self.assertEqual(
+            self.mock_iec.IedServerConfig_destroy.call_args_list, [call(SENTINEL_CONFIG)]
+        )
+        self.assertEqual(self.mock_iec.IedModel_destroy.call_args_list, [call(SENTINEL_MODEL)])
+        self.assertFalse(self.mock_iec.IedServer_destroy.called)
+
+    def test_start_with_goose_publishing(self):
+        """start() with enable_goose_publishing must call enableGoosePublishing."""
+        self._started(config=ServerConfig(enable_goose_publishing=True))
+
+        self.assertTrue(self.mock_iec.IedServer_enableGoosePublishing.called)
+
+    def test_start_goose_publishing_failure_no_crash(self):
+        """If enableGoosePublishing fails, start() must continue."""
+        self.mock_iec.IedServer_enableGoosePublishing.side_effect = RuntimeError("fail")
+
+        srv = self._started(config=ServerConfig(enable_goose_publishing=True))  # Must not raise
+
+        self.assertTrue(srv.is_running)
+
+    def test_cleanup_destroy_exception_still_clears(self):
+        """If IedServer_destroy throws, references must still be cleared."""
+        self.mock_iec.IedServer_destroy.side_effect = RuntimeError("destroy failed")
+
+        srv = self._make_server()
+        srv._running = True
+        srv._server = SENTINEL_SERVER
+        srv._model = SENTINEL_MODEL
+
+        srv.stop()  # Must not raise
+
+        self.assertIsNone(srv._server)
+        self.assertIsNone(srv._model)
+        self.assertFalse(srv.is_running)
+
+    def test_cleanup_config_destroy_exception_no_crash(self):
+        """If IedServerConfig_destroy throws, cleanup must continue."""
+        self.mock_iec.IedServerConfig_destroy.side_effect = RuntimeError("fail")
+
+        srv = self._make_server()
+        srv._running = True
+        srv._server = SENTINEL_SERVER
+        srv._ied_server_config = SENTINEL_CONFIG
+        srv._model = SENTINEL_MODEL
+
+        srv.stop()  # Must not raise
+
+        self.assertIsNone(srv._ied_server_config)
+
+    def test_stop_server_stop_exception_still_cleans_up(self):
+        """If IedServer_stop throws, cleanup must still happen."""
+        self.mock_iec.IedServer_stop.side_effect = RuntimeError("stop failed")
+
+        srv = self._make_server()
+        srv._running = True
+        srv._server = SENTINEL_SERVER
+        srv._model = SENTINEL_MODEL
+
+        srv.stop()  # Must not raise
+
+        self.assertFalse(srv.is_running)
+        self.assertEqual(self.mock_iec.IedServer_destroy.call_args_list, [call(SENTINEL_SERVER)])
+
+    def test_double_stop_no_crash(self):
+        """Calling stop() twice must not crash."""
+        srv = self._started()
+        srv.stop()
+        srv.stop()  # Must be no-op
+        self.assertFalse(srv.is_running)
+
+    def test_calls_raise_not_running(self):
+        """Server operations before start() must raise NotRunningError."""
+        srv = self._make_server()
+        for name, args in _NOT_RUNNING_CALLS:
+            with self.subTest(name=name), self.assertRaises(NotRunningError):
+                getattr(srv, name)(*args)
+
+    def test_set_control_handler_not_callable(self):
+        """set_control_handler with non-callable must raise ControlHandlerError."""
+        srv = self._started()
+        with self.assertRaises(ControlHandlerError):
+            srv.set_control_handler("test", "not_callable")
+
+    def test_set_control_handler_node_not_found(self):
+        """set_control_handler with missing node must raise ControlHandlerError."""
+        srv = self._started()
+        self.mock_iec.IedModel_getModelNodeByObjectReference.return_value = None
+
+        with self.assertRaises(ControlHandlerError):
+            srv.set_control_handler("nonexistent", lambda *args: None)
+
+    def test_get_number_of_open_connections_exception_returns_zero(self):
+        """get_number_of_open_connections exception must return 0."""
+        self.mock_iec.IedServer_getNumberOfOpenConnections.side_effect = RuntimeError("fail")
+
+        srv = self._started()
+        count = srv.get_number_of_open_connections()
+        self.assertEqual(count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
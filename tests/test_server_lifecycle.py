@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Tests for pyiec61850.server - IedServer lifecycle.
+
+All tests use mocks since the C library isn't available in dev.
+"""
+
+import unittest
+from unittest.mock import call, patch
+
+from pyiec61850 import _libload
+from pyiec61850.server import (
+    AlreadyRunningError,
+    IedServer,
+    LibraryNotFoundError,
+    ModelError,
+    ServerError,
+)
+
+from .support import SENTINEL_MODEL, SENTINEL_SERVER, ServerTestCase
+
+
+class TestIedServer(ServerTestCase):
+    """Test IedServer creation, start/stop and data-model locking."""
+
+    def test_raises_without_library(self):
+        with patch.object(_libload, "have_library", return_value=False):
+            with self.assertRaises(LibraryNotFoundError):
+                IedServer()
+
+    def test_injected_binding_skips_library_check(self):
+        with patch.object(_libload, "have_library", return_value=False):
+            srv = self._make_server()
+        self.assertFalse(srv.is_running)
+
+    def test_creation_without_model(self):
+        srv = self._make_server()
+        self.assertFalse(srv.is_running)
+        self.assertEqual(srv.port, 102)
+
+    def test_creation_with_model(self):
+        # _load_model prefers the ...Ex variant (the only model loader
+        # callable from Python with a str path).
+        self.mock_iec.ConfigFileParser_createModelFromConfigFileEx.return_value = SENTINEL_MODEL
+
+        srv = self._make_server("model.cfg")
+        self.assertIs(srv._model, SENTINEL_MODEL)
+
+    def test_creation_with_bad_model(self):
+        self.mock_iec.ConfigFileParser_createModelFromConfigFileEx.return_value = None
+
+        with self.assertRaises(ModelError):
+            self._make_server("bad_model.cfg")
+
+    def test_start_success(self):
+        # Default ServerConfig has tls=None, so start() uses the plain
+        # IedServer_create path (createWithConfig requires a TLS config).
+        self._seed_running()
+
+        srv = self._make_server("model.cfg")
+        srv.start(8102)
+
+        self.assertTrue(srv.is_running)
+        self.assertEqual(srv.port, 8102)
+        self.assertEqual(
+            self.mock_iec.IedServer_start.call_args_list, [call(SENTINEL_SERVER, 8102)]
+        )
+
+    def test_start_already_running(self):
+        srv = self._started()
+        with self.assertRaises(AlreadyRunningError):
+            srv.start()
+
+    def test_start_no_model(self):
+        srv = self._make_server()
+        with self.assertRaises(ModelError):
+            srv.start()
+
+    def test_start_failed(self):
+        self._seed_running()
+        self.mock_iec.IedServer_isRunning.return_value = False
+
+        srv = self._make_server("model.cfg")
+        with self.assertRaises(ServerError):
+            srv.start()
+
+    def test_stop(self):
+        srv = self._started()
+        srv.stop()
+
+        self.assertFalse(srv.is_running)
+        self.assertEqual(self.mock_iec.IedServer_stop.call_args_list, [call(SENTINEL_SERVER)])
+        self.assertEqual(self.mock_iec.IedServer_destroy.call_args_list, [call(SENTINEL_SERVER)])
+
+    def test_stop_when_not_running(self):
+        srv = self._make_server()
+        srv.stop()  # Should not raise
+
+    def test_context_manager(self):
+        self._seed_running()
+
+        with self._make_server("model.cfg") as srv:
+            srv.start()
+            self.assertTrue(srv.is_running)
+
+        self.assertFalse(srv.is_running)
+        self.assertTrue(self.mock_iec.IedServer_stop.called)
+
+    def test_lock_unlock_data_model(self):
+        srv = self._started()
+        srv.lock_data_model()
+        srv.unlock_data_model()
+
+        self.assertEqual(
+            self.mock_iec.IedServer_lockDataModel.call_args_list, [call(SENTINEL_SERVER)]
+        )
+        self.assertEqual(
+            self.mock_iec.IedServer_unlockDataModel.call_args_list, [call(SENTINEL_SERVER)]
+        )
+
+    def test_set_control_handler_uses_injected_binding(self):
+        """The control handler's director base comes from the server's binding."""
+        director_inits = []
+        self.mock_iec.ControlHandlerForPython = type(
+            "ControlHandlerForPython", (), {"__init__": director_inits.append}
+        )
+        srv = self._started()
+
+        srv.set_control_handler("myLD/CSWI1.Pos", lambda *args: None)
+
+        handler = srv._control_handlers["myLD/CSWI1.Pos"]
+        self.assertEqual(director_inits, [handler])
+        subscriber = self.mock_iec.ControlSubscriberForPython.return_value
+        self.assertEqual(subscriber.setControlHandler.call_args_list, [call(handler)])
+
+
+if __name__ == "__main__":
+    unittest.main()
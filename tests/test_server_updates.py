@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Tests for pyiec61850.server - IedServer attribute updates.
+
+All tests use mocks since the C library isn't available in dev.
+"""
+
+import unittest
+from unittest.mock import call
+
+from pyiec61850.server import UpdateError
+
+from .support import SENTINEL_SERVER, ServerTestCase
+
+# (IedServer method, object reference, value, C function it writes through)
+_UPDATERS = [
+    ("update_boolean", "myLD/GGIO1.Ind1.stVal", True, "IedServer_updateBooleanAttributeValue"),
+    ("update_int32", "myLD/GGIO1.SPCSO1.stVal", 42, "IedServer_updateInt32AttributeValue"),
+    ("update_float", "myLD/MMXU1.TotW.mag.f", 1234.5, "IedServer_updateFloatAttributeValue"),
+    (
+        "update_visible_string",
+        "myLD/LLN0.NamPlt.vendor",
+        "test",
+        "IedServer_updateVisibleStringAttributeValue",
+    ),
+    ("update_quality", "myLD/MMXU1.TotW.q", 0, "IedServer_updateQuality"),
+    (
+        "update_timestamp",
+        "myLD/MMXU1.TotW.t",
+        1704067200000,
+        "IedServer_updateUTCTimeAttributeValue",
+    ),
+]
+
+
+class TestIedServerUpdates(ServerTestCase):
+    """Test the IedServer.update_* data attribute writers."""
+
+    def test_update_functions(self):
+        """Each update_* method writes through its own C function."""
+        srv = self._started()
+        attribute = self.mock_iec.toDataAttribute.return_value
+        for method, reference, value, c_func in _UPDATERS:
+            with self.subTest(method=method):
+                getattr(srv, method)(reference, value)
+                self.assertEqual(
+                    getattr(self.mock_iec, c_func).call_args_list,
+                    [call(SENTINEL_SERVER, attribute, value)],
+                )
+
+    def test_update_functions_node_not_found(self):
+        """All update functions must raise UpdateError when node not found."""
+        srv = self._started()
+        self.mock_iec.IedModel_getModelNodeByObjectReference.return_value = None
+
+        for method, _reference, value, c_func in _UPDATERS:
+            with self.subTest(method=method):
+                with self.assertRaises(UpdateError):
+                    getattr(srv, method)("bad", value)
+                self.assertFalse(getattr(self.mock_iec, c_func).called)
+
+
+if __name__ == "__main__":
+    unittest.main()
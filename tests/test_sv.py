@@ -5,42 +5,53 @@ Tests for pyiec61850.sv module - Sampled Values publish/subscribe.
 All tests use mocks since the C library isn't available in dev.
 """
 
-import logging
 import unittest
 from unittest.mock import Mock, patch
 
-logging.disable(logging.CRITICAL)
+from pyiec61850 import _libload
+from pyiec61850.sv import (
+    AlreadyStartedError,
+    ConfigurationError,
+    InterfaceError,
+    LibraryNotFoundError,
+    NotStartedError,
+    PublishError,
+    SubscriptionError,
+    SVMessage,
+    SVPublisher,
+    SVSubscriber,
+)
+from pyiec61850.sv.subscriber import _decode_asdu
 
+from .support import install_binding
 
-class TestSVImports(unittest.TestCase):
-    """Test SV module imports."""
-
-    def test_import_module(self):
-        from pyiec61850 import sv
-
-        self.assertIsNotNone(sv)
+# Opaque native handles returned by the fake binding. The wrappers only store
+# them and pass them back into the binding; nothing calls methods on them.
+_RECEIVER = object()
+_SUBSCRIBER = object()
+_PUBLISHER = object()
+_ASDU = object()
 
-    def test_import_subscriber(self):
-        from pyiec61850.sv import SVSubscriber
 
-        self.assertIsNotNone(SVSubscriber)
+def _noop_listener(msg):
+    """Listener for tests that only check how it is stored and wired."""
 
-    def test_import_publisher(self):
-        from pyiec61850.sv import SVPublisher
 
-        self.assertIsNotNone(SVPublisher)
-
-    def test_import_types(self):
-        from pyiec61850.sv import SVMessage
-
-        self.assertIsNotNone(SVMessage)
-
-    def test_import_exceptions(self):
-        from pyiec61850.sv import (
-            PublishError,
-            SVError,
-        )
+class TestSVImports(unittest.TestCase):
+    """Test SV module imports."""
 
+    def test_public_api_symbols(self):
+        from pyiec61850 import sv
+        from pyiec61850.sv import PublishError, SVError, SVMessage, SVPublisher, SVSubscriber
+
+        for name, obj in (
+            ("sv", sv),
+            ("SVSubscriber", SVSubscriber),
+            ("SVPublisher", SVPublisher),
+            ("SVMessage", SVMessage),
+        ):
+            with self.subTest(name=name):
+                self.assertIsNotNone(obj)
         self.assertTrue(issubclass(PublishError, SVError))
 
 
@@ -48,551 +59,355 @@ class TestSVMessage(unittest.TestCase):
     """Test SVMessage dataclass."""
 
     def test_default_creation(self):
-        from pyiec61850.sv import SVMessage
-
         msg = SVMessage()
         self.assertEqual(msg.sv_id, "")
         self.assertEqual(msg.smp_cnt, 0)
         self.assertEqual(msg.values, [])
 
     def test_creation_with_values(self):
-        from pyiec61850.sv import SVMessage
-
         msg = SVMessage(sv_id="test", smp_cnt=42, values=[1.0, 2.0, 3.0])
         self.assertEqual(msg.sv_id, "test")
         self.assertEqual(len(msg.values), 3)
 
     def test_to_dict(self):
-        from pyiec61850.sv import SVMessage
-
         msg = SVMessage(sv_id="test", smp_cnt=42)
         d = msg.to_dict()
         self.assertEqual(d["sv_id"], "test")
         self.assertEqual(d["smp_cnt"], 42)
 
 
-class TestSVSubscriber(unittest.TestCase):
-    """Test SVSubscriber class."""
+class _SVTestCase(unittest.TestCase):
+    """Installs the faithful fake binding into one SV wrapper module per test."""
 
-    def test_raises_without_library(self):
-        with patch("pyiec61850._libload.have_library", return_value=False):
-            from pyiec61850.sv import LibraryNotFoundError, SVSubscriber
+    _module = ""
 
-            with self.assertRaises(LibraryNotFoundError):
-                SVSubscriber("eth0")
+    def setUp(self):
+        self.mock_iec = install_binding(self, modules=[self._module])
 
-    def test_raises_on_empty_interface(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import ConfigurationError, SVSubscriber
+    def _stop_on_cleanup(self, obj):
+        """Return ``obj``, registering its ``stop()`` as a cleanup.
 
-                with self.assertRaises(ConfigurationError):
-                    SVSubscriber("")
+        Registered after the patches, so it runs first, while the fake is
+        still installed.
+        """
+        self.addCleanup(obj.stop)
+        return obj
 
-    def test_creation_success(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import SVSubscriber
 
-                sub = SVSubscriber("eth0")
-                self.assertEqual(sub.interface, "eth0")
-                self.assertFalse(sub.is_running)
+class _SubscriberTestCase(_SVTestCase):
+    _module = "pyiec61850.sv.subscriber"
 
-    def test_set_app_id_valid(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import SVSubscriber
+    def setUp(self):
+        super().setUp()
+        self.mock_iec.SVReceiver_create.return_value = _RECEIVER
+        self.mock_iec.SVSubscriber_create.return_value = _SUBSCRIBER
+        self.sub = self._stop_on_cleanup(SVSubscriber("eth0"))
 
-                sub = SVSubscriber("eth0")
-                sub.set_app_id(0x4000)
-                self.assertEqual(sub._app_id, 0x4000)
 
-    def test_set_app_id_out_of_range(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import ConfigurationError, SVSubscriber
+class _PublisherTestCase(_SVTestCase):
+    _module = "pyiec61850.sv.publisher"
 
-                sub = SVSubscriber("eth0")
-                with self.assertRaises(ConfigurationError):
-                    sub.set_app_id(-1)
+    def setUp(self):
+        super().setUp()
+        self.mock_iec.SVPublisher_create.return_value = _PUBLISHER
+        self.mock_iec.SVPublisher_addASDU.return_value = _ASDU
+        self.pub = self._stop_on_cleanup(SVPublisher("eth0"))
 
-    def test_set_listener(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import SVSubscriber
 
-                sub = SVSubscriber("eth0")
-                cb = Mock()
-                sub.set_listener(cb)
-                self.assertEqual(sub._listener, cb)
+class TestSVSubscriber(_SubscriberTestCase):
+    """Test SVSubscriber class."""
 
-    def test_start_success(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_isRunning.return_value = True
+    @patch.object(_libload, "have_library", return_value=False)
+    def test_raises_without_library(self, _have_library):
+        with self.assertRaises(LibraryNotFoundError):
+            SVSubscriber("eth0")
 
-                from pyiec61850.sv import SVSubscriber
+    def test_raises_on_empty_interface(self):
+        with self.assertRaises(ConfigurationError):
+            SVSubscriber("")
 
-                sub = SVSubscriber("eth0")
-                sub.start()
-                self.assertTrue(sub.is_running)
+    def test_creation_success(self):
+        self.assertEqual(self.sub.interface, "eth0")
+        self.assertFalse(self.sub.is_running)
 
-    def test_start_already_running(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import AlreadyStartedError, SVSubscriber
+    def test_set_app_id_valid(self):
+        self.sub.set_app_id(0x4000)
+        self.assertEqual(self.sub._app_id, 0x4000)
 
-                sub = SVSubscriber("eth0")
-                sub._running = True
-                with self.assertRaises(AlreadyStartedError):
-                    sub.start()
+    def test_set_app_id_out_of_range(self):
+        with self.assertRaises(ConfigurationError):
+            self.sub.set_app_id(-1)
 
-    def test_start_receiver_failed(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_isRunning.return_value = False
+    def test_set_listener(self):
+        self.sub.set_listener(_noop_listener)
+        self.assertIs(self.sub._listener, _noop_listener)
 
-                from pyiec61850.sv import InterfaceError, SVSubscriber
+    def test_start_already_running(self):
+        self.sub._running = True
+        with self.assertRaises(AlreadyStartedError):
+            self.sub.start()
 
-                sub = SVSubscriber("eth0")
-                with self.assertRaises(InterfaceError):
-                    sub.start()
+    def test_start_receiver_failed(self):
+        self.mock_iec.SVReceiver_isRunning.return_value = False
 
-    def test_stop(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_isRunning.return_value = True
+        with self.assertRaises(InterfaceError):
+            self.sub.start()
 
-                from pyiec61850.sv import SVSubscriber
+    def test_start_stop(self):
+        self.mock_iec.SVReceiver_isRunning.return_value = True
 
-                sub = SVSubscriber("eth0")
-                sub.start()
-                sub.stop()
+        self.sub.start()
+        self.assertTrue(self.sub.is_running)
+        self.mock_iec.SVReceiver_start.assert_called_once_with(_RECEIVER)
 
-                self.assertFalse(sub.is_running)
-                mock_iec.SVReceiver_stop.assert_called_once()
+        self.sub.stop()
+        self.assertFalse(self.sub.is_running)
+        self.mock_iec.SVReceiver_stop.assert_called_once_with(_RECEIVER)
 
     def test_context_manager(self):
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_isRunning.return_value = True
-
-                from pyiec61850.sv import SVSubscriber
+        self.mock_iec.SVReceiver_isRunning.return_value = True
 
-                with SVSubscriber("eth0") as sub:
-                    sub.start()
-                self.assertFalse(sub.is_running)
+        with SVSubscriber("eth0") as sub:
+            sub.start()
+        self.assertFalse(sub.is_running)
 
 
-class TestSVPublisher(unittest.TestCase):
+class TestSVPublisher(_PublisherTestCase):
     """Test SVPublisher class."""
 
-    def test_raises_without_library(self):
-        with patch("pyiec61850._libload.have_library", return_value=False):
-            from pyiec61850.sv import LibraryNotFoundError, SVPublisher
-
-            with self.assertRaises(LibraryNotFoundError):
-                SVPublisher("eth0")
+    @patch.object(_libload, "have_library", return_value=False)
+    def test_raises_without_library(self, _have_library):
+        with self.assertRaises(LibraryNotFoundError):
+            SVPublisher("eth0")
 
     def test_creation_success(self):
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850"):
-                from pyiec61850.sv import SVPublisher
-
-                pub = SVPublisher("eth0")
-                self.assertEqual(pub.interface, "eth0")
-                self.assertFalse(pub.is_running)
+        self.assertEqual(self.pub.interface, "eth0")
+        self.assertFalse(self.pub.is_running)
 
     def test_set_sv_id(self):
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850"):
-                from pyiec61850.sv import SVPublisher
-
-                pub = SVPublisher("eth0")
-                pub.set_sv_id("myMU/MSVCB01")
-                self.assertEqual(pub._sv_id, "myMU/MSVCB01")
-
-    def test_start_success(self):
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_asdu = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = mock_asdu
-
-                from pyiec61850.sv import SVPublisher
-
-                pub = SVPublisher("eth0")
-                pub.start()
-                self.assertTrue(pub.is_running)
+        self.pub.set_sv_id("myMU/MSVCB01")
+        self.assertEqual(self.pub._sv_id, "myMU/MSVCB01")
 
     def test_publish_not_started(self):
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850"):
-                from pyiec61850.sv import NotStartedError, SVPublisher
-
-                pub = SVPublisher("eth0")
-                with self.assertRaises(NotStartedError):
-                    pub.publish_samples([1, 2, 3, 4])
+        with self.assertRaises(NotStartedError):
+            self.pub.publish_samples([1, 2, 3, 4])
 
-    def test_stop(self):
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = Mock()
+    def test_start_stop(self):
+        self.pub.start()
+        self.assertTrue(self.pub.is_running)
 
-                from pyiec61850.sv import SVPublisher
-
-                pub = SVPublisher("eth0")
-                pub.start()
-                pub.stop()
-
-                self.assertFalse(pub.is_running)
-                mock_iec.SVPublisher_destroy.assert_called_once()
+        self.pub.stop()
+        self.assertFalse(self.pub.is_running)
+        self.mock_iec.SVPublisher_destroy.assert_called_once_with(_PUBLISHER)
 
     def test_context_manager(self):
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = Mock()
-
-                from pyiec61850.sv import SVPublisher
-
-                with SVPublisher("eth0") as pub:
-                    pub.start()
-                mock_iec.SVPublisher_destroy.assert_called()
+        with SVPublisher("eth0") as pub:
+            pub.start()
+        self.mock_iec.SVPublisher_destroy.assert_called()
 
 
-class TestSVSubscriberCrashPaths(unittest.TestCase):
+class TestSVSubscriberCrashPaths(_SubscriberTestCase):
     """Test SVSubscriber crash paths: start, cleanup, NULL returns."""
 
     def test_start_receiver_create_null(self):
         """SVReceiver_create returning NULL must raise SubscriptionError."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = None
+        self.mock_iec.SVReceiver_create.return_value = None
 
-                from pyiec61850.sv import SubscriptionError, SVSubscriber
-
-                sub = SVSubscriber("eth0")
-                with self.assertRaises(SubscriptionError):
-                    sub.start()
+        with self.assertRaises(SubscriptionError):
+            self.sub.start()
 
     def test_start_subscriber_create_null(self):
         """SVSubscriber_create returning NULL must raise SubscriptionError."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = None
-
-                from pyiec61850.sv import SubscriptionError, SVSubscriber
+        self.mock_iec.SVSubscriber_create.return_value = None
 
-                sub = SVSubscriber("eth0")
-                with self.assertRaises(SubscriptionError):
-                    sub.start()
+        with self.assertRaises(SubscriptionError):
+            self.sub.start()
 
     def test_start_with_app_id_filter(self):
         """start() with app_id set must pass it to SVSubscriber_create."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_isRunning.return_value = True
+        self.mock_iec.SVReceiver_isRunning.return_value = True
 
-                from pyiec61850.sv import SVSubscriber
+        self.sub.set_app_id(0x4000)
+        self.sub.start()
 
-                sub = SVSubscriber("eth0")
-                sub.set_app_id(0x4000)
-                sub.start()
-
-                mock_iec.SVSubscriber_create.assert_called_once_with(None, 0x4000)
+        self.mock_iec.SVSubscriber_create.assert_called_once_with(None, 0x4000)
 
     def test_start_with_listener_wires_director(self):
         """start() with a listener must wire the SWIG director (SVSubscriberForPython)."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_isRunning.return_value = True
-                sv_py = Mock()
-                mock_iec.SVSubscriberForPython.return_value = sv_py
-
-                from pyiec61850.sv import SVSubscriber
-
-                sub = SVSubscriber("eth0")
-                sub.set_listener(Mock())
-                sub.start()
-
-                # The subscriber, handler, and receiver are wired together and
-                # the listener is installed via subscribe().
-                mock_iec.SVSubscriberForPython.assert_called_once()
-                sv_py.setLibiec61850SVSubscriber.assert_called_once()
-                sv_py.setEventHandler.assert_called_once()
-                sv_py.subscribe.assert_called_once()
-
-                sub.stop()
-                # Cleanup severs the director link.
-                sv_py.deleteEventHandler.assert_called_once()
+        self.mock_iec.SVReceiver_isRunning.return_value = True
+        sv_py = Mock()
+        self.mock_iec.SVSubscriberForPython.return_value = sv_py
+
+        self.sub.set_listener(_noop_listener)
+        self.sub.start()
+
+        # The subscriber, handler, and receiver are wired together and
+        # the listener is installed via subscribe().
+        self.mock_iec.SVSubscriberForPython.assert_called_once()
+        sv_py.setLibiec61850SVSubscriber.assert_called_once()
+        sv_py.setEventHandler.assert_called_once()
+        sv_py.subscribe.assert_called_once()
+
+        self.sub.stop()
+        # Cleanup severs the director link.
+        sv_py.deleteEventHandler.assert_called_once()
 
     def test_start_unexpected_exception_triggers_cleanup(self):
         """Unexpected exception during start must trigger _cleanup."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_addSubscriber.side_effect = RuntimeError("boom")
+        self.mock_iec.SVReceiver_addSubscriber.side_effect = RuntimeError("boom")
 
-                from pyiec61850.sv import SubscriptionError, SVSubscriber
+        with self.assertRaises(SubscriptionError):
+            self.sub.start()
 
-                sub = SVSubscriber("eth0")
-                with self.assertRaises(SubscriptionError):
-                    sub.start()
-
-                self.assertIsNone(sub._receiver)
-                self.assertIsNone(sub._subscriber)
+        self.assertIsNone(self.sub._receiver)
+        self.assertIsNone(self.sub._subscriber)
 
     def test_cleanup_destroy_exception_still_clears(self):
         """If SVReceiver_destroy throws, references must still be cleared."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_destroy.side_effect = RuntimeError("destroy failed")
-
-                from pyiec61850.sv import SVSubscriber
+        self.mock_iec.SVReceiver_destroy.side_effect = RuntimeError("destroy failed")
 
-                sub = SVSubscriber("eth0")
-                sub._running = True
-                sub._receiver = Mock()
-                sub._subscriber = Mock()
+        self.sub._running = True
+        self.sub._receiver = _RECEIVER
+        self.sub._subscriber = _SUBSCRIBER
 
-                sub.stop()  # Must not raise
+        self.sub.stop()  # Must not raise
 
-                self.assertIsNone(sub._receiver)
-                self.assertIsNone(sub._subscriber)
-                self.assertFalse(sub.is_running)
+        self.assertIsNone(self.sub._receiver)
+        self.assertIsNone(self.sub._subscriber)
+        self.assertFalse(self.sub.is_running)
 
     def test_stop_receiver_stop_exception_still_cleans_up(self):
         """If SVReceiver_stop throws, cleanup must still happen."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_stop.side_effect = RuntimeError("stop failed")
+        self.mock_iec.SVReceiver_stop.side_effect = RuntimeError("stop failed")
 
-                from pyiec61850.sv import SVSubscriber
+        self.sub._running = True
+        self.sub._receiver = _RECEIVER
+        self.sub._subscriber = _SUBSCRIBER
 
-                sub = SVSubscriber("eth0")
-                sub._running = True
-                sub._receiver = Mock()
-                sub._subscriber = Mock()
+        self.sub.stop()  # Must not raise
 
-                sub.stop()  # Must not raise
-
-                self.assertFalse(sub.is_running)
-                mock_iec.SVReceiver_destroy.assert_called_once()
+        self.assertFalse(self.sub.is_running)
+        self.mock_iec.SVReceiver_destroy.assert_called_once_with(_RECEIVER)
 
     def test_double_stop_no_crash(self):
         """Calling stop() twice must not crash."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVReceiver_create.return_value = Mock()
-                mock_iec.SVSubscriber_create.return_value = Mock()
-                mock_iec.SVReceiver_isRunning.return_value = True
-
-                from pyiec61850.sv import SVSubscriber
+        self.mock_iec.SVReceiver_isRunning.return_value = True
 
-                sub = SVSubscriber("eth0")
-                sub.start()
-                sub.stop()
-                sub.stop()  # Must be no-op
-                self.assertFalse(sub.is_running)
+        self.sub.start()
+        self.sub.stop()
+        self.sub.stop()  # Must be no-op
+        self.assertFalse(self.sub.is_running)
 
     def test_handler_decodes_asdu_values(self):
         """_decode_asdu must decode ASDU INT32 samples into an SVMessage."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVSubscriber_ASDU_getSmpCnt.return_value = 42
-                mock_iec.SVSubscriber_ASDU_getConfRev.return_value = 1
-                mock_iec.SVSubscriber_ASDU_getDataSize.return_value = 16  # 4 x INT32
-                samples = {0: 100, 4: 200, 8: 300, 12: 400}
-                mock_iec.SVSubscriber_ASDU_getINT32.side_effect = lambda _a, off: samples[off]
+        self.mock_iec.SVSubscriber_ASDU_getSmpCnt.return_value = 42
+        self.mock_iec.SVSubscriber_ASDU_getConfRev.return_value = 1
+        self.mock_iec.SVSubscriber_ASDU_getDataSize.return_value = 16  # 4 x INT32
+        samples = {0: 100, 4: 200, 8: 300, 12: 400}
+        self.mock_iec.SVSubscriber_ASDU_getINT32.side_effect = lambda _a, off: samples[off]
 
-                # A fake ASDU is passed as an argument — never assigned to the
-                # director's typed _libiec61850_sv_asdu member (see _decode_asdu).
-                from pyiec61850.sv.subscriber import _decode_asdu
+        # A fake ASDU is passed as an argument — never assigned to the
+        # director's typed _libiec61850_sv_asdu member (see _decode_asdu).
+        msg = _decode_asdu(object())
 
-                msg = _decode_asdu(object())
-
-                self.assertEqual(msg.smp_cnt, 42)
-                self.assertEqual(msg.values, [100, 200, 300, 400])
+        self.assertEqual(msg.smp_cnt, 42)
+        self.assertEqual(msg.values, [100, 200, 300, 400])
 
     def test_handler_empty_dataset(self):
         """An ASDU with a zero-byte data set yields no values and does not crash."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850") as mock_iec:
-                mock_iec.SVSubscriber_ASDU_getSmpCnt.return_value = 0
-                mock_iec.SVSubscriber_ASDU_getConfRev.return_value = 0
-                mock_iec.SVSubscriber_ASDU_getDataSize.return_value = 0
-
-                from pyiec61850.sv.subscriber import _decode_asdu
+        self.mock_iec.SVSubscriber_ASDU_getSmpCnt.return_value = 0
+        self.mock_iec.SVSubscriber_ASDU_getConfRev.return_value = 0
+        self.mock_iec.SVSubscriber_ASDU_getDataSize.return_value = 0
 
-                msg = _decode_asdu(object())
+        msg = _decode_asdu(object())
 
-                self.assertEqual(msg.values, [])
+        self.assertEqual(msg.values, [])
 
     def test_set_sv_id(self):
         """set_sv_id must store the SV ID."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import SVSubscriber
-
-                sub = SVSubscriber("eth0")
-                sub.set_sv_id("testSVID")
-                self.assertEqual(sub._sv_id, "testSVID")
+        self.sub.set_sv_id("testSVID")
+        self.assertEqual(self.sub._sv_id, "testSVID")
 
     def test_set_sv_id_while_running(self):
         """set_sv_id while running must raise AlreadyStartedError."""
-        with patch("pyiec61850.sv.subscriber._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.subscriber.iec61850"):
-                from pyiec61850.sv import AlreadyStartedError, SVSubscriber
+        self.sub._running = True
+        with self.assertRaises(AlreadyStartedError):
+            self.sub.set_sv_id("test")
 
-                sub = SVSubscriber("eth0")
-                sub._running = True
-                with self.assertRaises(AlreadyStartedError):
-                    sub.set_sv_id("test")
 
-
-class TestSVPublisherCrashPaths(unittest.TestCase):
+class TestSVPublisherCrashPaths(_PublisherTestCase):
     """Test SVPublisher crash paths: start, publish, stop, cleanup."""
 
     def test_start_publisher_create_null(self):
         """SVPublisher_create returning NULL must raise PublishError."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = None
-
-                from pyiec61850.sv import PublishError, SVPublisher
+        self.mock_iec.SVPublisher_create.return_value = None
 
-                pub = SVPublisher("eth0")
-                with self.assertRaises(PublishError):
-                    pub.start()
+        with self.assertRaises(PublishError):
+            self.pub.start()
 
     def test_start_asdu_create_null(self):
         """SVPublisher_addASDU returning NULL must raise PublishError."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = None
+        self.mock_iec.SVPublisher_addASDU.return_value = None
 
-                from pyiec61850.sv import PublishError, SVPublisher
-
-                pub = SVPublisher("eth0")
-                with self.assertRaises(PublishError):
-                    pub.start()
+        with self.assertRaises(PublishError):
+            self.pub.start()
 
     def test_start_unexpected_exception_triggers_cleanup(self):
         """Unexpected exception during start must trigger _cleanup."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = Mock()
-                mock_iec.SVPublisher_ASDU_addINT32.side_effect = RuntimeError("boom")
-
-                from pyiec61850.sv import PublishError, SVPublisher
+        self.mock_iec.SVPublisher_ASDU_addINT32.side_effect = RuntimeError("boom")
 
-                pub = SVPublisher("eth0")
-                with self.assertRaises(PublishError):
-                    pub.start()
+        with self.assertRaises(PublishError):
+            self.pub.start()
 
-                self.assertIsNone(pub._publisher)
+        self.assertIsNone(self.pub._publisher)
 
     def test_publish_success(self):
         """Successful publish path."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = Mock()
-
-                from pyiec61850.sv import SVPublisher
-
-                pub = SVPublisher("eth0")
-                pub.start()
-                pub.publish_samples([1000, 2000, 3000, 4000])
+        self.pub.start()
+        self.pub.publish_samples([1000, 2000, 3000, 4000])
 
-                mock_iec.SVPublisher_publish.assert_called_once()
-                # smp_cnt should wrap
-                self.assertEqual(pub._smp_cnt, 1)
+        self.mock_iec.SVPublisher_publish.assert_called_once()
+        # smp_cnt should wrap
+        self.assertEqual(self.pub._smp_cnt, 1)
 
     def test_publish_sample_count_wraps(self):
         """Sample count must wrap at smp_rate."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = Mock()
+        self.pub.set_smp_rate(3)
+        self.pub.start()
+        self.pub.publish_samples([1])
+        self.pub.publish_samples([2])
+        self.pub.publish_samples([3])
 
-                from pyiec61850.sv import SVPublisher
-
-                pub = SVPublisher("eth0")
-                pub.set_smp_rate(3)
-                pub.start()
-                pub.publish_samples([1])
-                pub.publish_samples([2])
-                pub.publish_samples([3])
-
-                self.assertEqual(pub._smp_cnt, 0)
+        self.assertEqual(self.pub._smp_cnt, 0)
 
     def test_publish_exception_raises_publish_error(self):
         """Exception during publish must raise PublishError."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = Mock()
-                mock_iec.SVPublisher_ASDU_setINT32.side_effect = RuntimeError("fail")
+        self.mock_iec.SVPublisher_ASDU_setINT32.side_effect = RuntimeError("fail")
 
-                from pyiec61850.sv import PublishError, SVPublisher
-
-                pub = SVPublisher("eth0")
-                pub.start()
-                with self.assertRaises(PublishError):
-                    pub.publish_samples([1])
+        self.pub.start()
+        with self.assertRaises(PublishError):
+            self.pub.publish_samples([1])
 
     def test_cleanup_destroy_exception_still_clears(self):
         """If SVPublisher_destroy throws, references must still be cleared."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_destroy.side_effect = RuntimeError("destroy failed")
-
-                from pyiec61850.sv import SVPublisher
+        self.mock_iec.SVPublisher_destroy.side_effect = RuntimeError("destroy failed")
 
-                pub = SVPublisher("eth0")
-                pub._running = True
-                pub._publisher = Mock()
-                pub._asdu = Mock()
+        self.pub._running = True
+        self.pub._publisher = _PUBLISHER
+        self.pub._asdu = _ASDU
 
-                pub.stop()  # Must not raise
+        self.pub.stop()  # Must not raise
 
-                self.assertIsNone(pub._publisher)
-                self.assertIsNone(pub._asdu)
-                self.assertFalse(pub.is_running)
+        self.assertIsNone(self.pub._publisher)
+        self.assertIsNone(self.pub._asdu)
+        self.assertFalse(self.pub.is_running)
 
     def test_double_stop_no_crash(self):
         """Calling stop() twice must not crash."""
-        with patch("pyiec61850.sv.publisher._HAS_IEC61850", True):
-            with patch("pyiec61850.sv.publisher.iec61850") as mock_iec:
-                mock_iec.SVPublisher_create.return_value = Mock()
-                mock_iec.SVPublisher_addASDU.return_value = Mock()
-
-                from pyiec61850.sv import SVPublisher
-
-                pub = SVPublisher("eth0")
-                pub.start()
-                pub.stop()
-                pub.stop()  # Must be no-op
-                self.assertFalse(pub.is_running)
+        self.pub.start()
+        self.pub.stop()
+        self.pub.stop()  # Must be no-op
+        self.assertFalse(self.pub.is_running)
 
 
 if __name__ == "__main__":
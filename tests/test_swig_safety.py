@@ -13,15 +13,11 @@ import unittest
 
 try:
     import pyiec61850.pyiec61850 as iec
-
-    _HAS_SWIG = True
 except ImportError:
-    _HAS_SWIG = False
-
-SKIP_MSG = "Requires built C extension (run ./build.sh first)"
+    # Skip the whole module before any class body runs.
+    raise unittest.SkipTest("Requires built C extension (run ./build.sh first)")
 
 
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
 class TestGooseSubscriberSafety(unittest.TestCase):
     """GOOSE subscriber NULL/empty guards."""
 
@@ -34,12 +30,7 @@ class TestGooseSubscriberSafety(unittest.TestCase):
         self.assertIsNotNone(sub)
         iec.GooseSubscriber_destroy(sub)
 
-    def test_destroy_null_is_noop(self):
-        # Should not segfault
-        iec.GooseSubscriber_destroy(None)
-
 
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
 class TestGooseReceiverSafety(unittest.TestCase):
     """GOOSE receiver NULL/state guards."""
 
@@ -48,9 +39,6 @@ class TestGooseReceiverSafety(unittest.TestCase):
         self.assertIsNotNone(recv)
         iec.GooseReceiver_destroy(recv)
 
-    def test_destroy_null_is_noop(self):
-        iec.GooseReceiver_destroy(None)
-
     def test_double_start_raises(self):
         recv = iec.GooseReceiver_create()
         sub = iec.GooseSubscriber_create("test/LLN0$GO$gcb", None)
@@ -71,7 +59,6 @@ class TestGooseReceiverSafety(unittest.TestCase):
         iec.GooseReceiver_destroy(recv)
 
 
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
 class TestIedConnectionSafety(unittest.TestCase):
     """IedConnection NULL guards."""
 
@@ -80,11 +67,7 @@ class TestIedConnectionSafety(unittest.TestCase):
         self.assertIsNotNone(conn)
         iec.IedConnection_destroy(conn)
 
-    def test_destroy_null_is_noop(self):
-        iec.IedConnection_destroy(None)
-
 
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
 class TestMmsConnectionSafety(unittest.TestCase):
     """MmsConnection NULL guards."""
 
@@ -93,11 +76,7 @@ class TestMmsConnectionSafety(unittest.TestCase):
         self.assertIsNotNone(conn)
         iec.MmsConnection_destroy(conn)
 
-    def test_destroy_null_is_noop(self):
-        iec.MmsConnection_destroy(None)
-
 
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
 class TestLinkedListSafety(unittest.TestCase):
     """LinkedList NULL guards."""
 
@@ -106,55 +85,23 @@ class TestLinkedListSafety(unittest.TestCase):
         self.assertIsNotNone(ll)
         iec.LinkedList_destroy(ll)
 
-    def test_destroy_null_is_noop(self):
-        iec.LinkedList_destroy(None)
 
-
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
 class TestMmsValueSafety(unittest.TestCase):
     """MmsValue NULL guards."""
 
-    def test_delete_null_is_noop(self):
-        iec.MmsValue_delete(None)
-
-    def test_new_integer(self):
-        val = iec.MmsValue_newInteger(32)
-        self.assertIsNotNone(val)
-        iec.MmsValue_delete(val)
-
-    def test_new_boolean(self):
-        val = iec.MmsValue_newBoolean(True)
-        self.assertIsNotNone(val)
-        iec.MmsValue_delete(val)
+    def test_new_values(self):
+        for ctor, arg in (
+            ("MmsValue_newInteger", 32),
+            ("MmsValue_newBoolean", True),
+            ("MmsValue_newFloat", 3.14),
+            ("MmsValue_newVisibleString", "hello"),
+        ):
+            with self.subTest(ctor=ctor):
+                val = getattr(iec, ctor)(arg)
+                self.assertIsNotNone(val)
+                iec.MmsValue_delete(val)
 
-    def test_new_float(self):
-        val = iec.MmsValue_newFloat(3.14)
-        self.assertIsNotNone(val)
-        iec.MmsValue_delete(val)
 
-    def test_new_visible_string(self):
-        val = iec.MmsValue_newVisibleString("hello")
-        self.assertIsNotNone(val)
-        iec.MmsValue_delete(val)
-
-
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
-class TestGoosePublisherSafety(unittest.TestCase):
-    """GoosePublisher NULL guards."""
-
-    def test_destroy_null_is_noop(self):
-        iec.GoosePublisher_destroy(None)
-
-
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
-class TestControlObjectSafety(unittest.TestCase):
-    """ControlObjectClient NULL guards."""
-
-    def test_destroy_null_is_noop(self):
-        iec.ControlObjectClient_destroy(None)
-
-
-@unittest.skipUnless(_HAS_SWIG, SKIP_MSG)
 class TestClientReportControlBlockSafety(unittest.TestCase):
     """ClientReportControlBlock NULL guards."""
 
@@ -163,8 +110,29 @@ class TestClientReportControlBlockSafety(unittest.TestCase):
         self.assertIsNotNone(rcb)
         iec.ClientReportControlBlock_destroy(rcb)
 
+
+# Destructors that must accept NULL without touching it. Resolved once at
+# import; the module is skipped above when the extension is missing.
+_NULL_SAFE_DESTRUCTORS = (
+    iec.GooseSubscriber_destroy,
+    iec.GooseReceiver_destroy,
+    iec.GoosePublisher_destroy,
+    iec.IedConnection_destroy,
+    iec.MmsConnection_destroy,
+    iec.LinkedList_destroy,
+    iec.MmsValue_delete,
+    iec.ControlObjectClient_destroy,
+    iec.ClientReportControlBlock_destroy,
+)
+
+
+class TestNullDestroySafety(unittest.TestCase):
+    """Destroying a NULL handle is a no-op, never a segfault."""
+
     def test_destroy_null_is_noop(self):
-        iec.ClientReportControlBlock_destroy(None)
+        for destroy in _NULL_SAFE_DESTRUCTORS:
+            with self.subTest(api=destroy.__name__):
+                destroy(None)
 
 
 if __name__ == "__main__":
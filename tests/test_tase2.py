@@ -6,10 +6,143 @@ These tests verify the TASE.2 client, types, constants, and exceptions
 without requiring an actual TASE.2 server connection.
 """
 
+import inspect
+import logging
+import os
+import queue
+import tempfile
+import time
 import unittest
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+from pyiec61850.tase2 import (
+    BLOCK_1,
+    BLOCK_2,
+    BLOCK_3,
+    BLOCK_4,
+    BLOCK_5,
+    BLOCK_6,
+    BLOCK_7,
+    BLOCK_8,
+    BLOCK_9,
+    CLIENT_STATES,
+    CMD_OFF,
+    CMD_ON,
+    CONFORMANCE_BLOCKS,
+    CONTROL_TYPE_COMMAND,
+    CONTROL_TYPES,
+    DEFAULT_INFO_BUFFER_SIZE,
+    DS_CONDITIONS_CHANGE,
+    DS_CONDITIONS_EXTERNAL_EVENT,
+    DS_CONDITIONS_INTEGRITY,
+    DS_CONDITIONS_INTERVAL,
+    DS_CONDITIONS_OPERATOR_REQUEST,
+    DSTS_VAR_DATA_SET_NAME,
+    DSTS_VAR_INTERVAL,
+    DSTS_VAR_RBE,
+    DSTS_VAR_STATUS,
+    IMTS_VAR_NAME,
+    IMTS_VAR_STATUS,
+    INFO_BUFF_VAR_ENTRIES,
+    INFO_BUFF_VAR_NAME,
+    INFO_BUFF_VAR_NEXT_ENTRY,
+    INFO_BUFF_VAR_SIZE,
+    INFO_MSG_VAR_CONTENT,
+    INFO_MSG_VAR_INFO_REF,
+    INFO_MSG_VAR_LOCAL_REF,
+    INFO_MSG_VAR_MSG_ID,
+    MAX_DATA_SET_SIZE,
+    MAX_INFO_MESSAGE_SIZE,
+    MAX_POINT_NAME_LENGTH,
+    POINT_TYPE_DISCRETE,
+    POINT_TYPE_REAL,
+    POINT_TYPE_STATE,
+    POINT_TYPE_STATE_SUPPLEMENTAL,
+    POINT_TYPES,
+    QUALITY_GOOD,
+    QUALITY_INVALID,
+    QUALITY_SOURCE_CALCULATED,
+    QUALITY_SOURCE_ENTERED,
+    QUALITY_SOURCE_ESTIMATED,
+    QUALITY_SOURCE_TELEMETERED,
+    QUALITY_VALIDITY_HELD,
+    QUALITY_VALIDITY_NOT_VALID,
+    QUALITY_VALIDITY_SUSPECT,
+    QUALITY_VALIDITY_VALID,
+    SBO_TIMEOUT,
+    STATE_CONNECTED,
+    STATE_DISCONNECTED,
+    SUPPORTED_FEATURES_BLOCK_1,
+    SUPPORTED_FEATURES_BLOCK_2,
+    SUPPORTED_FEATURES_BLOCK_3,
+    SUPPORTED_FEATURES_BLOCK_4,
+    SUPPORTED_FEATURES_BLOCK_5,
+    SUPPORTED_FEATURES_BLOCK_6,
+    SUPPORTED_FEATURES_BLOCK_7,
+    SUPPORTED_FEATURES_BLOCK_8,
+    SUPPORTED_FEATURES_BLOCK_9,
+    TAG_CLOSE_ONLY_INHIBIT,
+    TAG_INVALID,
+    TAG_NONE,
+    TAG_OPEN_AND_CLOSE_INHIBIT,
+    TASE2_EDITION_1996,
+    TASE2_EDITION_2000,
+    TASE2_EDITION_AUTO,
+    TRANSFER_REPORT_ACK,
+    TRANSFER_REPORT_NACK,
+    AccessDeniedError,
+    BilateralTable,
+    ClientStatistics,
+    ConnectionClosedError,
+    ConnectionFailedError,
+    ControlError,
+    DataFlags,
+    Domain,
+    DomainNotFoundError,
+    DSTransferSetConfig,
+    IMNotSupportedError,
+    IMTransferSetConfig,
+    IMTransferSetError,
+    InformationBuffer,
+    InformationMessage,
+    InformationMessageError,
+    LibraryNotFoundError,
+    MmsConnectionWrapper,
+    NotConnectedError,
+    OperateError,
+    PointValue,
+    ProtectionEvent,
+    ReadError,
+    SBOState,
+    SelectError,
+    ServerAddress,
+    ServerInfo,
+    TagError,
+    TagState,
+    TASE2Client,
+    TASE2Error,
+    TASE2TimeoutError,
+    TransferReport,
+    TransferSet,
+    TransferSetConditions,
+    VariableNotFoundError,
+    WriteError,
+    connection,
+    is_available,
+    map_ied_error,
+)
+from pyiec61850.tase2 import client as _client
+from pyiec61850.tase2.client import _validate_point_name
+from pyiec61850.tase2.connection import _InfoReportHandlerBase, _PyInfoReportHandler
+
+# Fixed timestamp for tests that only round-trip a datetime.
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+# Point names at and one past the 32-character limit.
+_NAME_MAX = "a" * 32
+_NAME_OVERFLOW = "a" * 33
+
 
 class TestTASE2Imports(unittest.TestCase):
     """Test module imports and availability."""
@@ -85,8 +218,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_domain_creation(self):
         """Test Domain dataclass creation."""
-        from pyiec61850.tase2 import Domain
-
         domain = Domain(name="ICC1", is_vcc=False)
         self.assertEqual(domain.name, "ICC1")
         self.assertEqual(domain.is_vcc, False)
@@ -94,15 +225,11 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_vcc_domain(self):
         """Test VCC domain type."""
-        from pyiec61850.tase2 import Domain
-
         domain = Domain(name="VCC", is_vcc=True)
         self.assertEqual(domain.domain_type, "VCC")
 
     def test_domain_with_variables(self):
         """Test Domain with variables list."""
-        from pyiec61850.tase2 import Domain
-
         domain = Domain(
             name="ICC1",
             is_vcc=False,
@@ -114,8 +241,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_point_value_creation(self):
         """Test PointValue dataclass creation."""
-        from pyiec61850.tase2 import PointValue
-
         pv = PointValue(value=230.5, quality="GOOD")
         self.assertEqual(pv.value, 230.5)
         self.assertEqual(pv.quality, "GOOD")
@@ -123,24 +248,17 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_point_value_invalid(self):
         """Test invalid PointValue."""
-        from pyiec61850.tase2 import PointValue
-
         pv = PointValue(value=None, quality="INVALID")
         self.assertIsNone(pv.value)
         self.assertFalse(pv.is_valid)
 
     def test_point_value_with_timestamp(self):
         """Test PointValue with timestamp."""
-        from pyiec61850.tase2 import PointValue
-
-        ts = datetime.now()
-        pv = PointValue(value=100.0, quality="GOOD", timestamp=ts)
-        self.assertEqual(pv.timestamp, ts)
+        pv = PointValue(value=100.0, quality="GOOD", timestamp=_FIXED_TS)
+        self.assertEqual(pv.timestamp, _FIXED_TS)
 
     def test_transfer_set_creation(self):
         """Test TransferSet dataclass creation."""
-        from pyiec61850.tase2 import TransferSet
-
         ts = TransferSet(
             name="TS1",
             domain="ICC1",
@@ -154,8 +272,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_bilateral_table_creation(self):
         """Test BilateralTable dataclass creation."""
-        from pyiec61850.tase2 import BilateralTable
-
         blt = BilateralTable(
             table_id="BLT001",
             ap_title="1.1.1.999",
@@ -165,8 +281,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_server_info_creation(self):
         """Test ServerInfo dataclass creation."""
-        from pyiec61850.tase2 import ServerInfo
-
         info = ServerInfo(
             vendor="TestVendor",
             model="TestModel",
@@ -179,13 +293,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_data_flags_creation(self):
         """Test DataFlags dataclass creation."""
-        from pyiec61850.tase2 import (
-            QUALITY_SOURCE_TELEMETERED,
-            QUALITY_VALIDITY_SUSPECT,
-            QUALITY_VALIDITY_VALID,
-            DataFlags,
-        )
-
         # Default flags (valid, telemetered)
         flags = DataFlags()
         self.assertEqual(flags.validity, QUALITY_VALIDITY_VALID)
@@ -200,8 +307,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_data_flags_from_raw(self):
         """Test DataFlags.from_raw class method."""
-        from pyiec61850.tase2 import DataFlags
-
         # Raw value: VALID(0) | TELEMETERED(0) | NORMAL_VALUE(64) = 64
         flags = DataFlags.from_raw(64)
         self.assertTrue(flags.is_valid)
@@ -216,18 +321,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_data_flags_round_trip(self):
         """Test DataFlags round-trip (from_raw -> raw_value)."""
-        from pyiec61850.tase2 import (
-            QUALITY_SOURCE_CALCULATED,
-            QUALITY_SOURCE_ENTERED,
-            QUALITY_SOURCE_ESTIMATED,
-            QUALITY_SOURCE_TELEMETERED,
-            QUALITY_VALIDITY_HELD,
-            QUALITY_VALIDITY_NOT_VALID,
-            QUALITY_VALIDITY_SUSPECT,
-            QUALITY_VALIDITY_VALID,
-            DataFlags,
-        )
-
         # Test all validity/source combinations
         # Per libtase2: SUSPECT=4, HELD=8, NOT_VALID=12
         test_values = [
@@ -241,14 +334,12 @@ class TestTASE2Types(unittest.TestCase):
         ]
 
         for raw in test_values:
-            flags = DataFlags.from_raw(raw)
-            # Round-trip should preserve the value
-            self.assertEqual(flags.raw_value, raw, f"Round-trip failed for raw={raw}")
+            with self.subTest(raw=raw):
+                # Round-trip should preserve the value
+                self.assertEqual(DataFlags.from_raw(raw).raw_value, raw)
 
     def test_data_flags_reserved_bits_ignored(self):
         """Test DataFlags.from_raw ignores reserved bits 0-1 per IEC 60870-6."""
-        from pyiec61850.tase2 import QUALITY_VALIDITY_VALID, DataFlags
-
         # Bits 0-1 are reserved and should be ignored during extraction.
         # A raw value with reserved bits set should still extract
         # validity=0 (VALID) since bits 2-3 are clear.
@@ -264,15 +355,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_transfer_set_conditions(self):
         """Test TransferSetConditions dataclass per IEC 60870-6-503 Section 8.1.7."""
-        from pyiec61850.tase2 import (
-            DS_CONDITIONS_CHANGE,
-            DS_CONDITIONS_EXTERNAL_EVENT,
-            DS_CONDITIONS_INTEGRITY,
-            DS_CONDITIONS_INTERVAL,
-            DS_CONDITIONS_OPERATOR_REQUEST,
-            TransferSetConditions,
-        )
-
         # Verify DSConditions bit positions per standard Section 8.1.7
         self.assertEqual(DS_CONDITIONS_INTERVAL, 1)  # bit 0
         self.assertEqual(DS_CONDITIONS_INTEGRITY, 2)  # bit 1
@@ -309,13 +391,11 @@ class TestTASE2Types(unittest.TestCase):
 
         # Test round-trip
         for raw in [0, 1, 2, 4, 8, 16, 31, 5, 10, 21]:
-            cond_rt = TransferSetConditions.from_raw(raw)
-            self.assertEqual(cond_rt.raw_value, raw, f"Round-trip failed for raw={raw}")
+            with self.subTest(raw=raw):
+                self.assertEqual(TransferSetConditions.from_raw(raw).raw_value, raw)
 
     def test_protection_event(self):
         """Test ProtectionEvent dataclass."""
-        from pyiec61850.tase2 import ProtectionEvent
-
         # Test creation with flags
         event = ProtectionEvent(
             event_flags=0b110,  # Phase A and Phase B
@@ -329,8 +409,6 @@ class TestTASE2Types(unittest.TestCase):
 
     def test_point_value_with_flags(self):
         """Test PointValue with DataFlags."""
-        from pyiec61850.tase2 import QUALITY_VALIDITY_SUSPECT, DataFlags, PointValue
-
         flags = DataFlags(validity=QUALITY_VALIDITY_SUSPECT)  # SUSPECT = 8
         pv = PointValue(value=123.45, flags=flags)
 
@@ -344,9 +422,9 @@ class TestTASE2Client(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures with mocked connection."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = False
         self.mock_connection.state = 0  # STATE_DISCONNECTED
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -357,38 +435,28 @@ class TestTASE2Client(unittest.TestCase):
 
     def test_client_creation(self):
         """Test TASE2Client creation."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.assertFalse(client.is_connected)
 
     def test_client_with_ap_titles(self):
         """Test TASE2Client with AP titles."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client(local_ap_title="1.1.1.999", remote_ap_title="1.1.1.998")
         self.assertEqual(client._local_ap_title, "1.1.1.999")
         self.assertEqual(client._remote_ap_title, "1.1.1.998")
 
     def test_not_connected_error(self):
         """Test NotConnectedError when not connected."""
-        from pyiec61850.tase2 import NotConnectedError, TASE2Client
-
         client = TASE2Client()
         with self.assertRaises(NotConnectedError):
             client.get_domains()
 
     def test_client_state(self):
         """Test client state property."""
-        from pyiec61850.tase2 import STATE_DISCONNECTED, TASE2Client
-
         client = TASE2Client()
         self.assertEqual(client.state, STATE_DISCONNECTED)
 
     def test_client_context_manager(self):
         """Test client as context manager."""
-        from pyiec61850.tase2 import TASE2Client
-
         with TASE2Client() as client:
             self.assertFalse(client.is_connected)
 
@@ -398,23 +466,17 @@ class TestTASE2Exceptions(unittest.TestCase):
 
     def test_base_exception(self):
         """Test TASE2Error base exception."""
-        from pyiec61850.tase2 import TASE2Error
-
         err = TASE2Error("test error")
         self.assertEqual(str(err), "test error")
 
     def test_connection_failed_error(self):
         """Test ConnectionFailedError."""
-        from pyiec61850.tase2 import ConnectionFailedError
-
         err = ConnectionFailedError("localhost", 102, "timeout")
         self.assertIn("localhost", str(err))
         self.assertIn("102", str(err))
 
     def test_not_connected_error(self):
         """Test NotConnectedError."""
-        from pyiec61850.tase2 import NotConnectedError
-
         err = NotConnectedError()
         self.assertIn("not connected", str(err).lower())
 
@@ -437,27 +499,16 @@ class TestTASE2Exceptions(unittest.TestCase):
 
     def test_domain_not_found_error(self):
         """Test DomainNotFoundError."""
-        from pyiec61850.tase2 import DomainNotFoundError
-
         err = DomainNotFoundError("ICC1")
         self.assertIn("ICC1", str(err))
 
     def test_read_error(self):
         """Test ReadError."""
-        from pyiec61850.tase2 import ReadError
-
         err = ReadError("ICC1/Voltage", "access denied")
         self.assertIn("ICC1/Voltage", str(err))
 
     def test_control_error_hierarchy(self):
         """Test control error inheritance."""
-        from pyiec61850.tase2 import (
-            ControlError,
-            OperateError,
-            SelectError,
-            TagError,
-        )
-
         self.assertTrue(issubclass(SelectError, ControlError))
         self.assertTrue(issubclass(OperateError, ControlError))
         self.assertTrue(issubclass(TagError, ControlError))
@@ -468,14 +519,6 @@ class TestTASE2Constants(unittest.TestCase):
 
     def test_point_types(self):
         """Test point type constants (IEC 60870-6 compliant ordering)."""
-        from pyiec61850.tase2 import (
-            POINT_TYPE_DISCRETE,
-            POINT_TYPE_REAL,
-            POINT_TYPE_STATE,
-            POINT_TYPE_STATE_SUPPLEMENTAL,
-            POINT_TYPES,
-        )
-
         # IEC 60870-6 ordering: STATE=1, STATE_SUPPLEMENTAL=2, DISCRETE=3, REAL=4
         self.assertEqual(POINT_TYPE_STATE, 1)
         self.assertEqual(POINT_TYPE_STATE_SUPPLEMENTAL, 2)
@@ -485,23 +528,11 @@ class TestTASE2Constants(unittest.TestCase):
 
     def test_control_types(self):
         """Test control type constants."""
-        from pyiec61850.tase2 import (
-            CONTROL_TYPE_COMMAND,
-            CONTROL_TYPES,
-        )
-
         self.assertEqual(CONTROL_TYPE_COMMAND, 1)
         self.assertIn(CONTROL_TYPE_COMMAND, CONTROL_TYPES)
 
     def test_conformance_blocks(self):
         """Test conformance block constants."""
-        from pyiec61850.tase2 import (
-            BLOCK_1,
-            BLOCK_2,
-            BLOCK_5,
-            CONFORMANCE_BLOCKS,
-        )
-
         self.assertEqual(BLOCK_1, 1)
         self.assertEqual(BLOCK_2, 2)
         self.assertEqual(BLOCK_5, 5)
@@ -509,23 +540,11 @@ class TestTASE2Constants(unittest.TestCase):
 
     def test_quality_flags(self):
         """Test quality flag constants."""
-        from pyiec61850.tase2 import (
-            QUALITY_GOOD,
-            QUALITY_INVALID,
-        )
-
         self.assertEqual(QUALITY_GOOD, "GOOD")
         self.assertEqual(QUALITY_INVALID, "INVALID")
 
     def test_tag_values(self):
         """Test tag value constants per libtase2 Tase2_TagValue."""
-        from pyiec61850.tase2 import (
-            TAG_CLOSE_ONLY_INHIBIT,
-            TAG_INVALID,
-            TAG_NONE,
-            TAG_OPEN_AND_CLOSE_INHIBIT,
-        )
-
         # Per libtase2: NO_TAG=0, OPEN_AND_CLOSE_INHIBIT=1, CLOSE_ONLY_INHIBIT=2, INVALID=3
         self.assertEqual(TAG_NONE, 0)
         self.assertEqual(TAG_OPEN_AND_CLOSE_INHIBIT, 1)
@@ -534,31 +553,17 @@ class TestTASE2Constants(unittest.TestCase):
 
     def test_command_values(self):
         """Test command value constants."""
-        from pyiec61850.tase2 import CMD_OFF, CMD_ON
-
         self.assertEqual(CMD_OFF, 0)
         self.assertEqual(CMD_ON, 1)
 
     def test_client_states(self):
         """Test client state constants."""
-        from pyiec61850.tase2 import (
-            CLIENT_STATES,
-            STATE_CONNECTED,
-            STATE_DISCONNECTED,
-        )
-
         self.assertEqual(STATE_DISCONNECTED, 0)
         self.assertEqual(STATE_CONNECTED, 2)
         self.assertIn(STATE_CONNECTED, CLIENT_STATES)
 
     def test_protocol_limits(self):
         """Test protocol limit constants."""
-        from pyiec61850.tase2 import (
-            MAX_DATA_SET_SIZE,
-            MAX_POINT_NAME_LENGTH,
-            SBO_TIMEOUT,
-        )
-
         # Per IEC 60870-6
         self.assertEqual(MAX_DATA_SET_SIZE, 500)
         self.assertEqual(SBO_TIMEOUT, 30)
@@ -570,8 +575,6 @@ class TestPointNameValidation(unittest.TestCase):
 
     def test_valid_names(self):
         """Test valid TASE.2 point names per IEC 60870-6-503 Section 8.1.2."""
-        from pyiec61850.tase2.client import _validate_point_name
-
         valid_names = [
             "Voltage",
             "voltage",
@@ -580,19 +583,18 @@ class TestPointNameValidation(unittest.TestCase):
             "Point1",
             "P",
             "ABC_123_xyz",
-            "a" * 32,  # Max length
+            _NAME_MAX,
             "Device$SBO",  # $ is valid per ISO 9506-2 Section 2.6.2
             "TS1$Interval",  # Common TASE.2 naming pattern
             "$GlobalVar",  # $ at start is valid (not a digit)
         ]
 
         for name in valid_names:
-            self.assertTrue(_validate_point_name(name), f"'{name}' should be valid")
+            with self.subTest(name=name):
+                self.assertTrue(_validate_point_name(name))
 
     def test_invalid_names(self):
         """Test invalid TASE.2 point names."""
-        from pyiec61850.tase2.client import _validate_point_name
-
         invalid_names = [
             "",  # Empty
             "1Point",  # Starts with digit
@@ -601,11 +603,12 @@ class TestPointNameValidation(unittest.TestCase):
             "Point.1",  # Contains dot
             "Point 1",  # Contains space
             "Point@1",  # Contains special char
-            "a" * 33,  # Too long
+            _NAME_OVERFLOW,
         ]
 
         for name in invalid_names:
-            self.assertFalse(_validate_point_name(name), f"'{name}' should be invalid")
+            with self.subTest(name=name):
+                self.assertFalse(_validate_point_name(name))
 
 
 class TestTASE2ClientMethods(unittest.TestCase):
@@ -614,9 +617,9 @@ class TestTASE2ClientMethods(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         # Patch the MmsConnectionWrapper
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_wrapper_class.return_value = self.mock_connection
 
     def tearDown(self):
@@ -625,8 +628,6 @@ class TestTASE2ClientMethods(unittest.TestCase):
 
     def test_connect(self):
         """Test connect method."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.connect.return_value = True
         self.mock_connection.is_connected = True
 
@@ -638,8 +639,6 @@ class TestTASE2ClientMethods(unittest.TestCase):
 
     def test_disconnect(self):
         """Test disconnect method."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.disconnect()
 
@@ -647,8 +646,6 @@ class TestTASE2ClientMethods(unittest.TestCase):
 
     def test_get_domains(self):
         """Test get_domains method."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.is_connected = True
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
         self.mock_connection.get_domain_variables.return_value = ["Var1", "Var2"]
@@ -662,8 +659,6 @@ class TestTASE2ClientMethods(unittest.TestCase):
 
     def test_read_point(self):
         """Test read_point method."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.is_connected = True
         self.mock_connection.read_variable.return_value = 230.5
 
@@ -679,9 +674,9 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures with mocked connection."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.state = 2  # STATE_CONNECTED
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -692,8 +687,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_select_device_success(self):
         """Test successful device selection."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -705,8 +698,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_select_device_not_connected(self):
         """Test select_device raises error when not connected."""
-        from pyiec61850.tase2 import NotConnectedError, TASE2Client
-
         self.mock_connection.is_connected = False
 
         client = TASE2Client()
@@ -715,8 +706,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_operate_device_success(self):
         """Test successful device operation."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -730,10 +719,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_operate_device_sbo_timeout(self):
         """Test operate_device raises error when SBO select has timed out."""
-        import time
-
-        from pyiec61850.tase2 import OperateError, TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -747,8 +732,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_send_command_on(self):
         """Test sending ON command."""
-        from pyiec61850.tase2 import CMD_ON, TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -759,8 +742,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_send_command_off(self):
         """Test sending OFF command."""
-        from pyiec61850.tase2 import CMD_OFF, TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -771,8 +752,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_send_setpoint_real(self):
         """Test sending real setpoint value."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -783,8 +762,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_send_setpoint_discrete(self):
         """Test sending discrete setpoint value."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -795,8 +772,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_set_tag(self):
         """Test setting device tag."""
-        from pyiec61850.tase2 import TAG_OPEN_AND_CLOSE_INHIBIT, TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -806,8 +781,6 @@ class TestTASE2ControlOperations(unittest.TestCase):
 
     def test_device_blocked_error(self):
         """Test OperateError when device write fails."""
-        from pyiec61850.tase2 import OperateError, TASE2Client
-
         self.mock_connection.write_variable.side_effect = Exception("Access denied")
 
         client = TASE2Client()
@@ -820,9 +793,9 @@ class TestTASE2TransferSets(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_wrapper_class.return_value = self.mock_connection
 
@@ -832,8 +805,6 @@ class TestTASE2TransferSets(unittest.TestCase):
 
     def test_get_transfer_sets(self):
         """Test discovering transfer sets."""
-        from pyiec61850.tase2 import TASE2Client
-
         # Mock data set names with transfer set patterns
         self.mock_connection.get_data_set_names.return_value = [
             "DS_TransferSet_1",
@@ -853,7 +824,6 @@ class TestTASE2TransferSets(unittest.TestCase):
 
     def test_get_transfer_set_details(self):
         """Test reading transfer set configuration."""
-        from pyiec61850.tase2 import TASE2Client
 
         # Mock reading config variables
         def mock_read(domain, name):
@@ -873,8 +843,6 @@ class TestTASE2TransferSets(unittest.TestCase):
 
     def test_enable_transfer_set(self):
         """Test enabling a transfer set."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -884,8 +852,6 @@ class TestTASE2TransferSets(unittest.TestCase):
 
     def test_disable_transfer_set(self):
         """Test disabling a transfer set."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -895,8 +861,6 @@ class TestTASE2TransferSets(unittest.TestCase):
 
     def test_transfer_set_not_found(self):
         """Test when no transfer sets found."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_data_set_names.return_value = []
         self.mock_connection.get_domain_variables.return_value = []
 
@@ -911,9 +875,9 @@ class TestTASE2DataOperations(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_wrapper_class.return_value = self.mock_connection
 
@@ -923,8 +887,6 @@ class TestTASE2DataOperations(unittest.TestCase):
 
     def test_write_point_success(self):
         """Test successful data point write."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -935,8 +897,6 @@ class TestTASE2DataOperations(unittest.TestCase):
 
     def test_write_point_failure(self):
         """Test write failure raises WriteError."""
-        from pyiec61850.tase2 import TASE2Client, WriteError
-
         self.mock_connection.write_variable.side_effect = Exception("Write failed")
 
         client = TASE2Client()
@@ -945,8 +905,6 @@ class TestTASE2DataOperations(unittest.TestCase):
 
     def test_read_points_batch(self):
         """Test batch reading multiple points."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.read_variable.return_value = 230.5
 
         client = TASE2Client()
@@ -959,7 +917,6 @@ class TestTASE2DataOperations(unittest.TestCase):
 
     def test_read_points_partial_failure(self):
         """Test batch read with some failures."""
-        from pyiec61850.tase2 import QUALITY_INVALID, TASE2Client
 
         def mock_read(domain, name):
             if name == "Current":
@@ -980,8 +937,6 @@ class TestTASE2DataOperations(unittest.TestCase):
 
     def test_get_data_sets(self):
         """Test getting data sets."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_data_set_names.return_value = ["DS1", "DS2"]
         self.mock_connection.get_domain_names.return_value = ["ICC1"]
         self.mock_connection.get_domain_variables.return_value = []
@@ -995,8 +950,6 @@ class TestTASE2DataOperations(unittest.TestCase):
 
     def test_get_data_set_values(self):
         """Test reading data set values."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.read_data_set_values.return_value = [100.0, 200.0, 300.0]
 
         client = TASE2Client()
@@ -1010,9 +963,9 @@ class TestTASE2Discovery(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_wrapper_class.return_value = self.mock_connection
 
@@ -1022,8 +975,6 @@ class TestTASE2Discovery(unittest.TestCase):
 
     def test_get_domain_by_name(self):
         """Test get_domain returns specific domain."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
         self.mock_connection.get_domain_variables.return_value = ["Var1"]
         self.mock_connection.get_data_set_names.return_value = []
@@ -1036,8 +987,6 @@ class TestTASE2Discovery(unittest.TestCase):
 
     def test_get_domain_not_found(self):
         """Test DomainNotFoundError when domain doesn't exist."""
-        from pyiec61850.tase2 import DomainNotFoundError, TASE2Client
-
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
         self.mock_connection.get_domain_variables.return_value = []
         self.mock_connection.get_data_set_names.return_value = []
@@ -1048,8 +997,6 @@ class TestTASE2Discovery(unittest.TestCase):
 
     def test_get_vcc_variables(self):
         """Test get_vcc_variables returns VCC domain variables."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
         self.mock_connection.get_domain_variables.side_effect = lambda d: (
             ["VCC_Var1", "VCC_Var2"] if d == "VCC" else ["ICC_Var1"]
@@ -1064,8 +1011,6 @@ class TestTASE2Discovery(unittest.TestCase):
 
     def test_get_domain_variables(self):
         """Test get_domain_variables returns domain variables."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_variables.return_value = ["Var1", "Var2", "Var3"]
 
         client = TASE2Client()
@@ -1076,8 +1021,6 @@ class TestTASE2Discovery(unittest.TestCase):
 
     def test_get_server_info(self):
         """Test get_server_info returns ServerInfo."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_server_identity.return_value = ("ABB", "RTU560", "1.0")
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = []
@@ -1092,8 +1035,6 @@ class TestTASE2Discovery(unittest.TestCase):
 
     def test_get_bilateral_table_id(self):
         """Test get_bilateral_table_id."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = ["Bilateral_Table_ID"]
         self.mock_connection.get_data_set_names.return_value = []
@@ -1110,9 +1051,9 @@ class TestTASE2ErrorHandling(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_wrapper_class.return_value = self.mock_connection
 
     def tearDown(self):
@@ -1121,8 +1062,6 @@ class TestTASE2ErrorHandling(unittest.TestCase):
 
     def test_connection_timeout(self):
         """Test connection timeout handling."""
-        from pyiec61850.tase2 import ConnectionFailedError, TASE2Client
-
         self.mock_connection.connect.side_effect = ConnectionFailedError(
             "192.168.1.100", 102, "timeout"
         )
@@ -1133,8 +1072,6 @@ class TestTASE2ErrorHandling(unittest.TestCase):
 
     def test_read_error_access_denied(self):
         """Test ReadError when access denied."""
-        from pyiec61850.tase2 import ReadError, TASE2Client
-
         self.mock_connection.is_connected = True
         self.mock_connection.read_variable.side_effect = Exception("Access denied")
 
@@ -1146,18 +1083,14 @@ class TestTASE2ErrorHandling(unittest.TestCase):
 
     def test_invalid_parameter_handling(self):
         """Test handling of invalid parameters."""
-        from pyiec61850.tase2.client import _validate_point_name
-
         # Invalid point names
         self.assertFalse(_validate_point_name(""))
         self.assertFalse(_validate_point_name("123abc"))  # Starts with digit
         self.assertFalse(_validate_point_name("var-name"))  # Contains hyphen
-        self.assertFalse(_validate_point_name("a" * 33))  # Too long
+        self.assertFalse(_validate_point_name(_NAME_OVERFLOW))
 
     def test_protocol_error_handling(self):
         """Test protocol error handling."""
-        from pyiec61850.tase2 import TASE2Client, TASE2Error
-
         self.mock_connection.is_connected = True
         self.mock_connection.get_domain_names.side_effect = Exception("Protocol error")
 
@@ -1171,9 +1104,6 @@ class TestMmsConnectionWrapper(unittest.TestCase):
 
     def test_wrapper_creation(self):
         """Test MmsConnectionWrapper creation."""
-        from pyiec61850.tase2.connection import MmsConnectionWrapper, is_available
-        from pyiec61850.tase2.exceptions import LibraryNotFoundError
-
         if not is_available():
             # Library not available, verify it raises appropriate error
             with self.assertRaises(LibraryNotFoundError):
@@ -1185,17 +1115,11 @@ class TestMmsConnectionWrapper(unittest.TestCase):
 
     def test_wrapper_is_available(self):
         """Test is_available function."""
-        from pyiec61850.tase2.connection import is_available
-
         result = is_available()
         self.assertIsInstance(result, bool)
 
     def test_wrapper_state_disconnected(self):
         """Test wrapper state when disconnected."""
-        from pyiec61850.tase2 import STATE_DISCONNECTED
-        from pyiec61850.tase2.connection import MmsConnectionWrapper, is_available
-        from pyiec61850.tase2.exceptions import LibraryNotFoundError
-
         if not is_available():
             # Library not available, verify it raises appropriate error
             with self.assertRaises(LibraryNotFoundError):
@@ -1211,9 +1135,9 @@ class TestTASE2SecurityAnalysis(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_wrapper_class.return_value = self.mock_connection
 
@@ -1223,8 +1147,6 @@ class TestTASE2SecurityAnalysis(unittest.TestCase):
 
     def test_enumerate_data_points(self):
         """Test enumerate_data_points."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_names.return_value = ["ICC1"]
         self.mock_connection.get_domain_variables.return_value = ["Var1", "Var2"]
         self.mock_connection.get_data_set_names.return_value = []
@@ -1237,8 +1159,6 @@ class TestTASE2SecurityAnalysis(unittest.TestCase):
 
     def test_test_control_access(self):
         """Test test_control_access."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
         self.mock_connection.read_variable.return_value = 0
 
@@ -1249,8 +1169,6 @@ class TestTASE2SecurityAnalysis(unittest.TestCase):
 
     def test_test_rbe_capability(self):
         """Test test_rbe_capability."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_data_set_names.return_value = ["DS_TransferSet_1"]
         self.mock_connection.get_domain_variables.return_value = []
 
@@ -1261,8 +1179,6 @@ class TestTASE2SecurityAnalysis(unittest.TestCase):
 
     def test_analyze_security(self):
         """Test analyze_security returns analysis dict."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
         self.mock_connection.get_domain_variables.return_value = ["Control_Point1"]
         self.mock_connection.get_data_set_names.return_value = []
@@ -1284,9 +1200,6 @@ class TestConnectionStateTracking(unittest.TestCase):
 
     def test_state_callback_registration(self):
         """Test registering and unregistering state callbacks."""
-        from pyiec61850.tase2.connection import MmsConnectionWrapper, is_available
-        from pyiec61850.tase2.exceptions import LibraryNotFoundError
-
         if not is_available():
             with self.assertRaises(LibraryNotFoundError):
                 MmsConnectionWrapper()
@@ -1311,8 +1224,6 @@ class TestConnectionStateTracking(unittest.TestCase):
 
     def test_state_callback_error_handling(self):
         """Test that callback errors don't crash state tracking."""
-        from pyiec61850.tase2.connection import MmsConnectionWrapper, is_available
-
         if not is_available():
             self.skipTest("pyiec61850 not available")
 
@@ -1330,9 +1241,9 @@ class TestConnectionLossNotification(unittest.TestCase):
     """Test Phase 1: Connection loss notification in client."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.state = 2
         self.mock_connection.register_state_callback = MagicMock()
@@ -1343,8 +1254,6 @@ class TestConnectionLossNotification(unittest.TestCase):
 
     def test_connection_lost_callback_fires(self):
         """Test user callback fires on connection loss."""
-        from pyiec61850.tase2 import STATE_CONNECTED, STATE_DISCONNECTED, TASE2Client
-
         callback_fired = []
         client = TASE2Client()
         client.on_connection_lost = lambda: callback_fired.append(True)
@@ -1356,8 +1265,6 @@ class TestConnectionLossNotification(unittest.TestCase):
 
     def test_connection_lost_clears_sbo(self):
         """Test connection loss clears SBO state."""
-        from pyiec61850.tase2 import STATE_CONNECTED, STATE_DISCONNECTED, TASE2Client
-
         client = TASE2Client()
         client._sbo_select_times["ICC1/Breaker1"] = 12345.0
 
@@ -1367,8 +1274,6 @@ class TestConnectionLossNotification(unittest.TestCase):
 
     def test_on_connection_lost_property(self):
         """Test on_connection_lost property getter/setter."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.assertIsNone(client.on_connection_lost)
 
@@ -1384,8 +1289,6 @@ class TestErrorMapping(unittest.TestCase):
 
     def test_map_access_denied(self):
         """Test ACCESS_DENIED maps to AccessDeniedError."""
-        from pyiec61850.tase2.exceptions import AccessDeniedError, map_ied_error
-
         try:
             import pyiec61850.pyiec61850 as iec61850
 
@@ -1398,8 +1301,6 @@ class TestErrorMapping(unittest.TestCase):
 
     def test_map_timeout(self):
         """Test TIMEOUT maps to TASE2TimeoutError."""
-        from pyiec61850.tase2.exceptions import TASE2TimeoutError, map_ied_error
-
         try:
             import pyiec61850.pyiec61850 as iec61850
 
@@ -1412,8 +1313,6 @@ class TestErrorMapping(unittest.TestCase):
 
     def test_map_connection_lost(self):
         """Test CONNECTION_LOST maps to ConnectionClosedError."""
-        from pyiec61850.tase2.exceptions import ConnectionClosedError, map_ied_error
-
         try:
             import pyiec61850.pyiec61850 as iec61850
 
@@ -1426,8 +1325,6 @@ class TestErrorMapping(unittest.TestCase):
 
     def test_map_object_not_found(self):
         """Test OBJECT_DOES_NOT_EXIST maps to VariableNotFoundError."""
-        from pyiec61850.tase2.exceptions import VariableNotFoundError, map_ied_error
-
         try:
             import pyiec61850.pyiec61850 as iec61850
 
@@ -1440,8 +1337,6 @@ class TestErrorMapping(unittest.TestCase):
 
     def test_map_unknown_error(self):
         """Test unknown error code returns TASE2Error."""
-        from pyiec61850.tase2.exceptions import TASE2Error, map_ied_error
-
         err = map_ied_error(999, "unknown op")
         self.assertIsInstance(err, TASE2Error)
         self.assertIn("999", str(err))
@@ -1451,9 +1346,9 @@ class TestDataSetLifecycle(unittest.TestCase):
     """Test Phase 2: Data set create/delete operations."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -1463,8 +1358,6 @@ class TestDataSetLifecycle(unittest.TestCase):
 
     def test_create_data_set(self):
         """Test creating a data set."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.create_data_set.return_value = True
 
         client = TASE2Client()
@@ -1477,16 +1370,12 @@ class TestDataSetLifecycle(unittest.TestCase):
 
     def test_create_data_set_empty_members(self):
         """Test creating data set with empty members raises error."""
-        from pyiec61850.tase2 import TASE2Client, TASE2Error
-
         client = TASE2Client()
         with self.assertRaises(TASE2Error):
             client.create_data_set("ICC1", "MyDS", [])
 
     def test_create_data_set_exceeds_limit(self):
         """Test creating data set exceeding TASE.2 limit raises error."""
-        from pyiec61850.tase2 import MAX_DATA_SET_SIZE, TASE2Client, TASE2Error
-
         client = TASE2Client()
         members = [f"Var{i}" for i in range(MAX_DATA_SET_SIZE + 1)]
         with self.assertRaises(TASE2Error):
@@ -1494,8 +1383,6 @@ class TestDataSetLifecycle(unittest.TestCase):
 
     def test_delete_data_set(self):
         """Test deleting a data set."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.delete_data_set.return_value = True
 
         client = TASE2Client()
@@ -1510,15 +1397,6 @@ class TestTransferSetStandard(unittest.TestCase):
 
     def test_standard_variable_names_defined(self):
         """Test standard DSTS variable names are defined."""
-        from pyiec61850.tase2 import (
-            DSTS_VAR_DATA_SET_NAME,
-            DSTS_VAR_INTERVAL,
-            DSTS_VAR_RBE,
-            DSTS_VAR_STATUS,
-            TRANSFER_REPORT_ACK,
-            TRANSFER_REPORT_NACK,
-        )
-
         self.assertEqual(DSTS_VAR_DATA_SET_NAME, "DSTransferSet_DataSetName")
         self.assertEqual(DSTS_VAR_INTERVAL, "DSTransferSet_Interval")
         self.assertEqual(DSTS_VAR_RBE, "DSTransferSet_RBE")
@@ -1528,9 +1406,7 @@ class TestTransferSetStandard(unittest.TestCase):
 
     def test_enable_transfer_set_tries_standard_first(self):
         """Test enable_transfer_set tries DSTransferSet_Status first."""
-        from pyiec61850.tase2 import TASE2Client
-
-        patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        patcher = patch.object(_client, "MmsConnectionWrapper")
         mock_wrapper_class = patcher.start()
         mock_conn = MagicMock()
         mock_conn.is_connected = True
@@ -1554,8 +1430,6 @@ class TestDSTransferSetConfig(unittest.TestCase):
 
     def test_config_creation(self):
         """Test DSTransferSetConfig creation."""
-        from pyiec61850.tase2 import DSTransferSetConfig, TransferSetConditions
-
         config = DSTransferSetConfig(
             data_set_name="MyDS",
             interval=10,
@@ -1570,8 +1444,6 @@ class TestDSTransferSetConfig(unittest.TestCase):
 
     def test_config_serialization(self):
         """Test DSTransferSetConfig to_dict."""
-        from pyiec61850.tase2 import DSTransferSetConfig
-
         config = DSTransferSetConfig(
             data_set_name="DS1",
             interval=5,
@@ -1585,9 +1457,7 @@ class TestDSTransferSetConfig(unittest.TestCase):
 
     def test_configure_transfer_set(self):
         """Test configure_transfer_set writes standard variables."""
-        from pyiec61850.tase2 import DSTransferSetConfig, TASE2Client
-
-        patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        patcher = patch.object(_client, "MmsConnectionWrapper")
         mock_wrapper_class = patcher.start()
         mock_conn = MagicMock()
         mock_conn.is_connected = True
@@ -1613,9 +1483,9 @@ class TestReportQueue(unittest.TestCase):
     """Test Phase 3: Report queue and callback."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -1625,24 +1495,18 @@ class TestReportQueue(unittest.TestCase):
 
     def test_get_next_report_empty(self):
         """Test get_next_report returns None when queue is empty."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         report = client.get_next_report(timeout=0.01)
         self.assertIsNone(report)
 
     def test_get_next_report_nonblocking(self):
         """Test non-blocking get_next_report."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         report = client.get_next_report()
         self.assertIsNone(report)
 
     def test_report_queue_put_and_get(self):
         """Test putting and getting reports from queue."""
-        from pyiec61850.tase2 import TASE2Client, TransferReport
-
         client = TASE2Client()
         report = TransferReport(
             domain="ICC1",
@@ -1658,8 +1522,6 @@ class TestReportQueue(unittest.TestCase):
 
     def test_set_report_callback(self):
         """Test setting report callback."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
 
         def callback(report):
@@ -1677,8 +1539,6 @@ class TestTransferReport(unittest.TestCase):
 
     def test_transfer_report_creation(self):
         """Test TransferReport creation."""
-        from pyiec61850.tase2 import PointValue, TransferReport
-
         report = TransferReport(
             domain="ICC1",
             transfer_set_name="TS1",
@@ -1695,10 +1555,6 @@ class TestTransferReport(unittest.TestCase):
 
     def test_transfer_report_serialization(self):
         """Test TransferReport to_dict."""
-        from datetime import datetime, timezone
-
-        from pyiec61850.tase2 import TransferReport
-
         ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
         report = TransferReport(
             domain="ICC1",
@@ -1718,9 +1574,9 @@ class TestTransferReportACK(unittest.TestCase):
     """Test Phase 3: Transfer Report ACK."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -1730,8 +1586,6 @@ class TestTransferReportACK(unittest.TestCase):
 
     def test_send_transfer_report_ack(self):
         """Test ACK written to correct variable."""
-        from pyiec61850.tase2 import TRANSFER_REPORT_ACK, TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -1745,9 +1599,9 @@ class TestBilateralValidation(unittest.TestCase):
     """Test Phase 4: Post-connect bilateral table reading."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -1757,8 +1611,6 @@ class TestBilateralValidation(unittest.TestCase):
 
     def test_parse_supported_features(self):
         """Test parsing Supported_Features bitstring."""
-        from pyiec61850.tase2 import BLOCK_1, BLOCK_2, BLOCK_5, TASE2Client
-
         client = TASE2Client()
         # Per ASN.1 BITSTRING: Block 1=0x80, Block 2=0x40, Block 5=0x08
         # Block 1 + Block 2 + Block 5 = 0x80 | 0x40 | 0x08 = 0xC8
@@ -1771,10 +1623,6 @@ class TestBilateralValidation(unittest.TestCase):
 
     def test_check_block_support_warning(self):
         """Test _check_block_support logs warning for unsupported blocks."""
-        import logging
-
-        from pyiec61850.tase2 import BLOCK_5, TASE2Client
-
         client = TASE2Client()
         client._server_capabilities["supported_blocks"] = [1, 2]
 
@@ -1792,8 +1640,6 @@ class TestBilateralValidation(unittest.TestCase):
     def test_check_block_support_no_warning_when_no_info(self):
         """Test _check_block_support does nothing when no capabilities."""
 
-        from pyiec61850.tase2 import BLOCK_5, TASE2Client
-
         client = TASE2Client()
         # No capabilities loaded - should not warn
         # This should not raise
@@ -1804,9 +1650,9 @@ class TestSBOCheckBack(unittest.TestCase):
     """Test Phase 4: SBO CheckBack ID capture and echo."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.write_variable.return_value = True
@@ -1817,8 +1663,6 @@ class TestSBOCheckBack(unittest.TestCase):
 
     def test_select_captures_sbo_state(self):
         """Test select_device captures SBOState."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.read_variable.return_value = 42
 
         client = TASE2Client()
@@ -1832,8 +1676,6 @@ class TestSBOCheckBack(unittest.TestCase):
 
     def test_operate_clears_sbo_state(self):
         """Test operate_device clears SBOState."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.select_device("ICC1", "Breaker1")
         client.operate_device("ICC1", "Breaker1", 1)
@@ -1842,8 +1684,6 @@ class TestSBOCheckBack(unittest.TestCase):
 
     def test_sbo_state_dataclass(self):
         """Test SBOState dataclass."""
-        from pyiec61850.tase2 import SBOState
-
         state = SBOState(
             select_time=12345.0,
             domain="ICC1",
@@ -1859,10 +1699,6 @@ class TestStructuredValueSizes(unittest.TestCase):
 
     def test_point_value_with_flags_and_timestamp(self):
         """Test PointValue with flags and timestamp."""
-        from datetime import datetime, timezone
-
-        from pyiec61850.tase2 import QUALITY_VALIDITY_VALID, DataFlags, PointValue
-
         ts = datetime(2025, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
         flags = DataFlags(validity=QUALITY_VALIDITY_VALID)
         pv = PointValue(
@@ -1888,9 +1724,9 @@ class TestFullTransferSetLifecycle(unittest.TestCase):
     """Test Phase 3: Full transfer set lifecycle (mocked)."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.write_variable.return_value = True
@@ -1903,14 +1739,6 @@ class TestFullTransferSetLifecycle(unittest.TestCase):
 
     def test_full_lifecycle(self):
         """Test create -> configure -> enable -> receive -> disable -> delete."""
-        from pyiec61850.tase2 import (
-            DSTransferSetConfig,
-            PointValue,
-            TASE2Client,
-            TransferReport,
-            TransferSetConditions,
-        )
-
         client = TASE2Client()
 
         # 1. Create data set
@@ -2008,20 +1836,12 @@ class TestInformationReportParsing(unittest.TestCase):
 
     def test_py_info_report_handler_creation(self):
         """Test _PyInfoReportHandler can be created."""
-        import queue
-
-        from pyiec61850.tase2.connection import _PyInfoReportHandler
-
         q = queue.Queue()
         handler = _PyInfoReportHandler(q)
         self.assertIsNotNone(handler)
 
     def test_py_info_report_handler_with_callback(self):
         """Test _PyInfoReportHandler with callback."""
-        import queue
-
-        from pyiec61850.tase2.connection import _PyInfoReportHandler
-
         q = queue.Queue()
         received = []
         handler = _PyInfoReportHandler(q, report_callback=lambda r: received.append(r))
@@ -2037,10 +1857,6 @@ class TestInformationReportParsing(unittest.TestCase):
 
     def test_py_info_report_handler_trigger_queues_report(self):
         """Test that trigger() puts a TransferReport into the queue."""
-        import queue
-
-        from pyiec61850.tase2.connection import _PyInfoReportHandler
-
         q = queue.Queue()
         handler = _PyInfoReportHandler(q)
         handler.trigger()
@@ -2054,9 +1870,9 @@ class TestReportCallback(unittest.TestCase):
     """Test Phase 3: Report callback invocation."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -2066,8 +1882,6 @@ class TestReportCallback(unittest.TestCase):
 
     def test_report_callback_called_on_queue_report(self):
         """Test report callback is stored and accessible."""
-        from pyiec61850.tase2 import TASE2Client
-
         received = []
         client = TASE2Client()
         client.set_report_callback(lambda r: received.append(r))
@@ -2076,8 +1890,6 @@ class TestReportCallback(unittest.TestCase):
 
     def test_report_callback_clear(self):
         """Test clearing report callback."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.set_report_callback(lambda r: None)
         self.assertIsNotNone(client._report_callback)
@@ -2117,8 +1929,6 @@ class TestInformationMessage(unittest.TestCase):
 
     def test_creation_with_text(self):
         """Test InformationMessage with text content."""
-        from pyiec61850.tase2 import InformationMessage
-
         msg = InformationMessage(
             info_ref=1,
             local_ref=2,
@@ -2133,8 +1943,6 @@ class TestInformationMessage(unittest.TestCase):
 
     def test_creation_with_string_content(self):
         """Test InformationMessage with string content."""
-        from pyiec61850.tase2 import InformationMessage
-
         msg = InformationMessage(
             info_ref=1,
             local_ref=1,
@@ -2146,8 +1954,6 @@ class TestInformationMessage(unittest.TestCase):
 
     def test_creation_with_binary_content(self):
         """Test InformationMessage with binary content."""
-        from pyiec61850.tase2 import InformationMessage
-
         binary_data = bytes([0x00, 0x01, 0xFF, 0xFE])
         msg = InformationMessage(
             info_ref=3,
@@ -2160,8 +1966,6 @@ class TestInformationMessage(unittest.TestCase):
 
     def test_default_values(self):
         """Test InformationMessage default values."""
-        from pyiec61850.tase2 import InformationMessage
-
         msg = InformationMessage()
         self.assertEqual(msg.info_ref, 0)
         self.assertEqual(msg.local_ref, 0)
@@ -2172,10 +1976,6 @@ class TestInformationMessage(unittest.TestCase):
 
     def test_with_timestamp(self):
         """Test InformationMessage with timestamp."""
-        from datetime import datetime, timezone
-
-        from pyiec61850.tase2 import InformationMessage
-
         ts = datetime(2025, 6, 15, 12, 0, 0, tzinfo=timezone.utc)
         msg = InformationMessage(
             info_ref=1,
@@ -2188,10 +1988,6 @@ class TestInformationMessage(unittest.TestCase):
 
     def test_serialization(self):
         """Test InformationMessage to_dict."""
-        from datetime import datetime, timezone
-
-        from pyiec61850.tase2 import InformationMessage
-
         ts = datetime(2025, 1, 1, tzinfo=timezone.utc)
         msg = InformationMessage(
             info_ref=5,
@@ -2209,8 +2005,6 @@ class TestInformationMessage(unittest.TestCase):
 
     def test_serialization_binary(self):
         """Test InformationMessage to_dict with binary content."""
-        from pyiec61850.tase2 import InformationMessage
-
         msg = InformationMessage(
             info_ref=1,
             local_ref=1,
@@ -2226,24 +2020,18 @@ class TestIMTransferSetConfig(unittest.TestCase):
 
     def test_creation(self):
         """Test IMTransferSetConfig creation."""
-        from pyiec61850.tase2 import IMTransferSetConfig
-
         config = IMTransferSetConfig(enabled=True, name="IM_TS")
         self.assertTrue(config.enabled)
         self.assertEqual(config.name, "IM_TS")
 
     def test_default_values(self):
         """Test IMTransferSetConfig defaults."""
-        from pyiec61850.tase2 import IMTransferSetConfig
-
         config = IMTransferSetConfig()
         self.assertFalse(config.enabled)
         self.assertIsNone(config.name)
 
     def test_serialization(self):
         """Test IMTransferSetConfig to_dict."""
-        from pyiec61850.tase2 import IMTransferSetConfig
-
         config = IMTransferSetConfig(enabled=True, name="MyIMTS")
         d = config.to_dict()
         self.assertTrue(d["enabled"])
@@ -2255,8 +2043,6 @@ class TestInformationBuffer(unittest.TestCase):
 
     def test_creation(self):
         """Test InformationBuffer creation."""
-        from pyiec61850.tase2 import InformationBuffer
-
         buf = InformationBuffer(
             name="InfoBuf1",
             domain="ICC1",
@@ -2270,8 +2056,6 @@ class TestInformationBuffer(unittest.TestCase):
 
     def test_with_messages(self):
         """Test InformationBuffer with messages."""
-        from pyiec61850.tase2 import InformationBuffer, InformationMessage
-
         msgs = [
             InformationMessage(info_ref=1, content=b"msg1"),
             InformationMessage(info_ref=2, content=b"msg2"),
@@ -2285,8 +2069,6 @@ class TestInformationBuffer(unittest.TestCase):
 
     def test_serialization(self):
         """Test InformationBuffer to_dict."""
-        from pyiec61850.tase2 import InformationBuffer, InformationMessage
-
         buf = InformationBuffer(
             name="Buf1",
             domain="ICC1",
@@ -2306,20 +2088,11 @@ class TestBlock4Constants(unittest.TestCase):
 
     def test_im_transfer_set_vars(self):
         """Test IM Transfer Set variable name constants."""
-        from pyiec61850.tase2 import IMTS_VAR_NAME, IMTS_VAR_STATUS
-
         self.assertEqual(IMTS_VAR_NAME, "IM_Transfer_Set")
         self.assertEqual(IMTS_VAR_STATUS, "IM_Transfer_Set_Status")
 
     def test_info_buffer_vars(self):
         """Test Information Buffer variable name constants."""
-        from pyiec61850.tase2 import (
-            INFO_BUFF_VAR_ENTRIES,
-            INFO_BUFF_VAR_NAME,
-            INFO_BUFF_VAR_NEXT_ENTRY,
-            INFO_BUFF_VAR_SIZE,
-        )
-
         self.assertEqual(INFO_BUFF_VAR_NAME, "Information_Buffer_Name")
         self.assertEqual(INFO_BUFF_VAR_SIZE, "Information_Buffer_Size")
         self.assertEqual(INFO_BUFF_VAR_NEXT_ENTRY, "Next_Buffer_Entry")
@@ -2327,13 +2100,6 @@ class TestBlock4Constants(unittest.TestCase):
 
     def test_info_message_vars(self):
         """Test Information Message variable name constants."""
-        from pyiec61850.tase2 import (
-            INFO_MSG_VAR_CONTENT,
-            INFO_MSG_VAR_INFO_REF,
-            INFO_MSG_VAR_LOCAL_REF,
-            INFO_MSG_VAR_MSG_ID,
-        )
-
         self.assertEqual(INFO_MSG_VAR_INFO_REF, "InfoRef")
         self.assertEqual(INFO_MSG_VAR_LOCAL_REF, "LocalRef")
         self.assertEqual(INFO_MSG_VAR_MSG_ID, "MsgId")
@@ -2341,15 +2107,11 @@ class TestBlock4Constants(unittest.TestCase):
 
     def test_block4_limits(self):
         """Test Block 4 limit constants."""
-        from pyiec61850.tase2 import DEFAULT_INFO_BUFFER_SIZE, MAX_INFO_MESSAGE_SIZE
-
         self.assertEqual(MAX_INFO_MESSAGE_SIZE, 65535)
         self.assertEqual(DEFAULT_INFO_BUFFER_SIZE, 64)
 
     def test_supported_features_block4(self):
         """Test SUPPORTED_FEATURES_BLOCK_4 constant."""
-        from pyiec61850.tase2 import SUPPORTED_FEATURES_BLOCK_4
-
         # Per ASN.1 BITSTRING: Block 4 = bit 3 = 0x10
         self.assertEqual(SUPPORTED_FEATURES_BLOCK_4, 0x10)
 
@@ -2359,24 +2121,18 @@ class TestBlock4Exceptions(unittest.TestCase):
 
     def test_information_message_error(self):
         """Test InformationMessageError."""
-        from pyiec61850.tase2 import InformationMessageError, TASE2Error
-
         self.assertTrue(issubclass(InformationMessageError, TASE2Error))
         err = InformationMessageError("test error")
         self.assertIn("test error", str(err))
 
     def test_im_transfer_set_error(self):
         """Test IMTransferSetError."""
-        from pyiec61850.tase2 import IMTransferSetError, InformationMessageError
-
         self.assertTrue(issubclass(IMTransferSetError, InformationMessageError))
         err = IMTransferSetError("enable failed")
         self.assertIn("enable failed", str(err))
 
     def test_im_not_supported_error(self):
         """Test IMNotSupportedError."""
-        from pyiec61850.tase2 import IMNotSupportedError, InformationMessageError
-
         self.assertTrue(issubclass(IMNotSupportedError, InformationMessageError))
         err = IMNotSupportedError()
         self.assertIn("Block 4", str(err))
@@ -2451,9 +2207,9 @@ class TestIMTransferSet(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -2464,8 +2220,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_enable_im_transfer_set(self):
         """Test enabling IM Transfer Set."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = []
@@ -2478,8 +2232,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_enable_im_transfer_set_searches_domains(self):
         """Test IM Transfer Set enable searches VCC then ICC."""
-        from pyiec61850.tase2 import TASE2Client
-
         # First call fails, second succeeds
         call_count = [0]
 
@@ -2500,8 +2252,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_enable_im_transfer_set_failure(self):
         """Test IM Transfer Set enable failure raises error."""
-        from pyiec61850.tase2 import IMTransferSetError, TASE2Client
-
         self.mock_connection.write_variable.side_effect = Exception("Write failed")
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = []
@@ -2513,8 +2263,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_disable_im_transfer_set(self):
         """Test disabling IM Transfer Set."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = []
@@ -2528,8 +2276,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_disable_im_transfer_set_failure(self):
         """Test IM Transfer Set disable failure raises error."""
-        from pyiec61850.tase2 import IMTransferSetError, TASE2Client
-
         self.mock_connection.write_variable.side_effect = Exception("Write failed")
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = []
@@ -2541,8 +2287,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_get_im_transfer_set_status(self):
         """Test reading IM Transfer Set status."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.read_variable.return_value = True
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = ["IM_Transfer_Set_Status"]
@@ -2554,8 +2298,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_get_im_transfer_set_status_default(self):
         """Test IM Transfer Set status returns default when not readable."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.read_variable.side_effect = Exception("Not found")
         self.mock_connection.get_domain_names.return_value = ["VCC"]
         self.mock_connection.get_domain_variables.return_value = []
@@ -2567,8 +2309,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_not_connected_raises_error(self):
         """Test IM Transfer Set operations require connection."""
-        from pyiec61850.tase2 import NotConnectedError, TASE2Client
-
         self.mock_connection.is_connected = False
 
         client = TASE2Client()
@@ -2577,8 +2317,6 @@ class TestIMTransferSet(unittest.TestCase):
 
     def test_disconnect_clears_im_state(self):
         """Test disconnect clears IM Transfer Set state."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._im_transfer_set_enabled = True
         client.disconnect()
@@ -2590,9 +2328,9 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -2603,8 +2341,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_send_info_message_text(self):
         """Test sending a text information message."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -2617,8 +2353,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_send_info_message_string_content(self):
         """Test sending string content (auto-encodes to bytes)."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.write_variable.return_value = True
 
         client = TASE2Client()
@@ -2629,8 +2363,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_send_info_message_too_large(self):
         """Test sending oversized message raises error."""
-        from pyiec61850.tase2 import InformationMessageError, TASE2Client
-
         client = TASE2Client()
         big_content = b"x" * 70000
         with self.assertRaises(InformationMessageError):
@@ -2638,8 +2370,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_send_info_message_all_writes_fail(self):
         """Test send_info_message raises error when all writes fail."""
-        from pyiec61850.tase2 import InformationMessageError, TASE2Client
-
         self.mock_connection.write_variable.side_effect = Exception("Write failed")
 
         client = TASE2Client()
@@ -2648,8 +2378,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_get_info_messages_empty(self):
         """Test get_info_messages returns empty list when no messages."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.read_variable.side_effect = Exception("Not found")
 
         client = TASE2Client()
@@ -2658,8 +2386,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_get_info_messages_from_queue(self):
         """Test get_info_messages returns queued messages."""
-        from pyiec61850.tase2 import InformationMessage, TASE2Client
-
         self.mock_connection.read_variable.side_effect = Exception("Not found")
 
         client = TASE2Client()
@@ -2674,8 +2400,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_get_info_message_by_ref_found(self):
         """Test get_info_message_by_ref finds queued message."""
-        from pyiec61850.tase2 import InformationMessage, TASE2Client
-
         self.mock_connection.read_variable.side_effect = Exception("Not found")
 
         client = TASE2Client()
@@ -2688,8 +2412,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_get_info_message_by_ref_not_found(self):
         """Test get_info_message_by_ref returns None when not found."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.read_variable.side_effect = Exception("Not found")
 
         client = TASE2Client()
@@ -2698,24 +2420,18 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_get_next_info_message_empty(self):
         """Test get_next_info_message returns None when queue empty."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         msg = client.get_next_info_message()
         self.assertIsNone(msg)
 
     def test_get_next_info_message_with_timeout(self):
         """Test get_next_info_message with timeout."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         msg = client.get_next_info_message(timeout=0.01)
         self.assertIsNone(msg)
 
     def test_get_next_info_message_queued(self):
         """Test get_next_info_message returns queued message."""
-        from pyiec61850.tase2 import InformationMessage, TASE2Client
-
         client = TASE2Client()
         client._im_message_queue.put(InformationMessage(info_ref=5, content=b"queued msg"))
 
@@ -2725,8 +2441,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_set_im_message_callback(self):
         """Test setting IM message callback."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
 
         def callback(msg):
@@ -2740,8 +2454,6 @@ class TestInfoMessageOperations(unittest.TestCase):
 
     def test_not_connected_send(self):
         """Test send_info_message raises NotConnectedError."""
-        from pyiec61850.tase2 import NotConnectedError, TASE2Client
-
         self.mock_connection.is_connected = False
 
         client = TASE2Client()
@@ -2754,9 +2466,9 @@ class TestInfoBufferOperations(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -2767,8 +2479,6 @@ class TestInfoBufferOperations(unittest.TestCase):
 
     def test_get_info_buffers(self):
         """Test discovering information buffers."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_variables.return_value = [
             "Information_Buffer_1",
             "Information_Buffer_2",
@@ -2786,8 +2496,6 @@ class TestInfoBufferOperations(unittest.TestCase):
 
     def test_get_info_buffers_empty(self):
         """Test get_info_buffers returns empty when no buffers found."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_domain_variables.return_value = ["Voltage", "Current", "Power"]
 
         client = TASE2Client()
@@ -2800,9 +2508,9 @@ class TestBlock4FileOperations(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -2813,8 +2521,6 @@ class TestBlock4FileOperations(unittest.TestCase):
 
     def test_get_file_directory(self):
         """Test get_file_directory delegates to connection."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_file_directory.return_value = [
             {"name": "report.txt", "size": 1024, "last_modified": 0},
         ]
@@ -2828,8 +2534,6 @@ class TestBlock4FileOperations(unittest.TestCase):
 
     def test_get_file_directory_with_path(self):
         """Test get_file_directory with subdirectory."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.get_file_directory.return_value = []
 
         client = TASE2Client()
@@ -2839,8 +2543,6 @@ class TestBlock4FileOperations(unittest.TestCase):
 
     def test_delete_file(self):
         """Test delete_file delegates to connection."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.delete_file.return_value = True
 
         client = TASE2Client()
@@ -2855,9 +2557,9 @@ class TestBlock4SupportedFeatures(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -2868,8 +2570,6 @@ class TestBlock4SupportedFeatures(unittest.TestCase):
 
     def test_parse_supported_features_with_block4(self):
         """Test Supported_Features parsing includes Block 4."""
-        from pyiec61850.tase2 import BLOCK_1, BLOCK_4, TASE2Client
-
         client = TASE2Client()
         # Per ASN.1 BITSTRING: Block 1=0x80, Block 4=0x10
         # Block 1 + Block 4 = 0x80 | 0x10 = 0x90
@@ -2881,8 +2581,6 @@ class TestBlock4SupportedFeatures(unittest.TestCase):
 
     def test_parse_all_blocks(self):
         """Test Supported_Features parsing with all first-octet blocks."""
-        from pyiec61850.tase2 import BLOCK_1, BLOCK_2, BLOCK_4, BLOCK_5, TASE2Client
-
         client = TASE2Client()
         # Per ASN.1 BITSTRING: Block 1=0x80, Block 2=0x40, Block 4=0x10, Block 5=0x08
         # Blocks 1+2+4+5: 0x80 | 0x40 | 0x10 | 0x08 = 0xD8
@@ -2900,9 +2598,9 @@ class TestBlock4FullLifecycle(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.write_variable.return_value = True
@@ -2917,8 +2615,6 @@ class TestBlock4FullLifecycle(unittest.TestCase):
 
     def test_full_lifecycle(self):
         """Test enable -> receive -> query -> disable lifecycle."""
-        from pyiec61850.tase2 import InformationMessage, TASE2Client
-
         client = TASE2Client()
 
         # 1. Enable IM Transfer Set
@@ -2978,8 +2674,6 @@ class TestTagStateDataclass(unittest.TestCase):
 
     def test_tag_state_defaults(self):
         """Test TagState default values."""
-        from pyiec61850.tase2 import TagState
-
         ts = TagState()
         self.assertEqual(ts.tag_value, 0)
         self.assertEqual(ts.reason, "")
@@ -2988,15 +2682,11 @@ class TestTagStateDataclass(unittest.TestCase):
 
     def test_tag_state_is_tagged_false(self):
         """Test is_tagged returns False when no tag."""
-        from pyiec61850.tase2 import TagState
-
         ts = TagState(tag_value=0)
         self.assertFalse(ts.is_tagged)
 
     def test_tag_state_is_tagged_true(self):
         """Test is_tagged returns True with tag."""
-        from pyiec61850.tase2 import TagState
-
         ts = TagState(tag_value=1)
         self.assertTrue(ts.is_tagged)
         ts2 = TagState(tag_value=2)
@@ -3004,8 +2694,6 @@ class TestTagStateDataclass(unittest.TestCase):
 
     def test_tag_state_tag_name(self):
         """Test tag_name returns correct names per libtase2 Tase2_TagValue."""
-        from pyiec61850.tase2 import TagState
-
         self.assertEqual(TagState(tag_value=0).tag_name, "NO_TAG")
         self.assertEqual(TagState(tag_value=1).tag_name, "OPEN_AND_CLOSE_INHIBIT")
         self.assertEqual(TagState(tag_value=2).tag_name, "CLOSE_ONLY_INHIBIT")
@@ -3014,8 +2702,6 @@ class TestTagStateDataclass(unittest.TestCase):
 
     def test_tag_state_to_dict(self):
         """Test TagState to_dict serialization."""
-        from pyiec61850.tase2 import TagState
-
         ts = TagState(tag_value=2, reason="Maintenance", device="BRK1", domain="ICC1")
         d = ts.to_dict()
         self.assertEqual(d["tag_value"], 2)
@@ -3027,8 +2713,6 @@ class TestTagStateDataclass(unittest.TestCase):
 
     def test_tag_state_to_dict_minimal(self):
         """Test TagState to_dict with no optional fields."""
-        from pyiec61850.tase2 import TagState
-
         ts = TagState(tag_value=0)
         d = ts.to_dict()
         self.assertEqual(d["tag_value"], 0)
@@ -3042,8 +2726,6 @@ class TestClientStatisticsDataclass(unittest.TestCase):
 
     def test_defaults(self):
         """Test ClientStatistics default values."""
-        from pyiec61850.tase2 import ClientStatistics
-
         cs = ClientStatistics()
         self.assertEqual(cs.total_reads, 0)
         self.assertEqual(cs.total_writes, 0)
@@ -3055,15 +2737,11 @@ class TestClientStatisticsDataclass(unittest.TestCase):
 
     def test_uptime_seconds_no_connect(self):
         """Test uptime_seconds returns 0 when not connected."""
-        from pyiec61850.tase2 import ClientStatistics
-
         cs = ClientStatistics()
         self.assertEqual(cs.uptime_seconds, 0.0)
 
     def test_uptime_seconds_with_connect(self):
         """Test uptime_seconds calculates duration."""
-        from pyiec61850.tase2 import ClientStatistics
-
         now = datetime.now()
         cs = ClientStatistics(connect_time=now)
         # Should be a small positive number (just connected)
@@ -3072,8 +2750,6 @@ class TestClientStatisticsDataclass(unittest.TestCase):
     def test_uptime_seconds_with_disconnect(self):
         """Test uptime_seconds uses disconnect_time if available."""
 
-        from pyiec61850.tase2 import ClientStatistics
-
         start = datetime(2025, 1, 1, 12, 0, 0)
         end = datetime(2025, 1, 1, 12, 5, 0)
         cs = ClientStatistics(connect_time=start, disconnect_time=end)
@@ -3081,8 +2757,6 @@ class TestClientStatisticsDataclass(unittest.TestCase):
 
     def test_to_dict(self):
         """Test ClientStatistics to_dict serialization."""
-        from pyiec61850.tase2 import ClientStatistics
-
         cs = ClientStatistics(
             total_reads=100,
             total_writes=50,
@@ -3100,8 +2774,6 @@ class TestClientStatisticsDataclass(unittest.TestCase):
 
     def test_to_dict_with_connect_time(self):
         """Test to_dict includes connect_time when set."""
-        from pyiec61850.tase2 import ClientStatistics
-
         cs = ClientStatistics(connect_time=datetime(2025, 1, 1, 12, 0, 0))
         d = cs.to_dict()
         self.assertIn("connect_time", d)
@@ -3154,9 +2826,9 @@ class TestGetTag(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -3170,8 +2842,6 @@ class TestGetTag(unittest.TestCase):
 
     def test_get_tag_success(self):
         """Test successful tag read."""
-        from pyiec61850.tase2 import PointValue, TagState, TASE2Client
-
         client = TASE2Client()
 
         # Mock read_point to return tag value and reason
@@ -3196,8 +2866,6 @@ class TestGetTag(unittest.TestCase):
 
     def test_get_tag_no_reason(self):
         """Test tag read without reason string."""
-        from pyiec61850.tase2 import PointValue, TASE2Client
-
         client = TASE2Client()
 
         def mock_read_point(domain, name):
@@ -3214,9 +2882,6 @@ class TestGetTag(unittest.TestCase):
 
     def test_get_tag_not_connected(self):
         """Test get_tag raises when not connected."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import NotConnectedError
-
         self.mock_connection.is_connected = False
         client = TASE2Client()
         with self.assertRaises(NotConnectedError):
@@ -3224,9 +2889,6 @@ class TestGetTag(unittest.TestCase):
 
     def test_get_tag_read_fails(self):
         """Test get_tag raises ReadError when tag variable cannot be read."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import ReadError
-
         client = TASE2Client()
         # All read attempts fail
         client.read_point = MagicMock(side_effect=Exception("Not found"))
@@ -3240,9 +2902,9 @@ class TestReadPointsBatch(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -3256,16 +2918,12 @@ class TestReadPointsBatch(unittest.TestCase):
 
     def test_batch_empty_list(self):
         """Test batch read with empty list returns empty."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         result = client.read_points_batch("ICC1", [])
         self.assertEqual(result, [])
 
     def test_batch_single_point(self):
         """Test batch read with single point delegates to read_point."""
-        from pyiec61850.tase2 import PointValue, TASE2Client
-
         client = TASE2Client()
         pv = PointValue(value=42.0, quality="GOOD", name="Voltage", domain="ICC1")
         client.read_point = MagicMock(return_value=pv)
@@ -3277,9 +2935,6 @@ class TestReadPointsBatch(unittest.TestCase):
 
     def test_batch_exceeds_limit(self):
         """Test batch read raises when exceeding MAX_DATA_SET_SIZE."""
-        from pyiec61850.tase2 import MAX_DATA_SET_SIZE, TASE2Client
-        from pyiec61850.tase2.exceptions import TASE2Error
-
         client = TASE2Client()
         names = [f"Point_{i}" for i in range(MAX_DATA_SET_SIZE + 1)]
         with self.assertRaises(TASE2Error):
@@ -3287,8 +2942,6 @@ class TestReadPointsBatch(unittest.TestCase):
 
     def test_batch_creates_and_deletes_temp_dataset(self):
         """Test batch read creates and cleans up temp data set."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         # Mock read_data_set_values to return raw values
         self.mock_connection.read_data_set_values.return_value = [
@@ -3298,8 +2951,6 @@ class TestReadPointsBatch(unittest.TestCase):
         ]
 
         # Mock _parse_point_value
-        from pyiec61850.tase2 import PointValue
-
         client._parse_point_value = MagicMock(
             return_value=PointValue(value=1.0, quality="GOOD", name="P", domain="D")
         )
@@ -3321,8 +2972,6 @@ class TestReadPointsBatch(unittest.TestCase):
 
     def test_batch_fallback_on_failure(self):
         """Test batch read falls back to sequential on data set failure."""
-        from pyiec61850.tase2 import PointValue, TASE2Client
-
         client = TASE2Client()
         # Make create_data_set fail
         self.mock_connection.create_data_set.side_effect = Exception("Not supported")
@@ -3337,9 +2986,6 @@ class TestReadPointsBatch(unittest.TestCase):
 
     def test_batch_not_connected(self):
         """Test batch read raises when not connected."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import NotConnectedError
-
         self.mock_connection.is_connected = False
         client = TASE2Client()
         with self.assertRaises(NotConnectedError):
@@ -3351,9 +2997,9 @@ class TestGetTransferSetsNative(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -3367,8 +3013,6 @@ class TestGetTransferSetsNative(unittest.TestCase):
 
     def test_native_discovery_chain(self):
         """Test following Next_DSTransfer_Set chain."""
-        from pyiec61850.tase2 import PointValue, TASE2Client
-
         client = TASE2Client()
 
         call_count = [0]
@@ -3395,8 +3039,6 @@ class TestGetTransferSetsNative(unittest.TestCase):
 
     def test_native_discovery_fallback(self):
         """Test fallback to pattern matching when Next_DSTransfer_Set missing."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         # All reads fail -> no Next_DSTransfer_Set
         client.read_point = MagicMock(side_effect=Exception("Not found"))
@@ -3408,8 +3050,6 @@ class TestGetTransferSetsNative(unittest.TestCase):
 
     def test_native_discovery_circular_detection(self):
         """Test circular reference detection in chain."""
-        from pyiec61850.tase2 import PointValue, TASE2Client
-
         client = TASE2Client()
 
         def mock_read_point(domain, name):
@@ -3431,9 +3071,6 @@ class TestGetTransferSetsNative(unittest.TestCase):
 
     def test_native_discovery_not_connected(self):
         """Test raises when not connected."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import NotConnectedError
-
         self.mock_connection.is_connected = False
         client = TASE2Client()
         with self.assertRaises(NotConnectedError):
@@ -3445,9 +3082,9 @@ class TestDownloadFile(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -3461,8 +3098,6 @@ class TestDownloadFile(unittest.TestCase):
 
     def test_download_file_success(self):
         """Test successful file download."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         test_data = b"file content here"
         self.mock_connection.download_file.return_value = test_data
@@ -3473,11 +3108,6 @@ class TestDownloadFile(unittest.TestCase):
 
     def test_download_file_with_local_path(self):
         """Test file download saves to local path."""
-        import os
-        import tempfile
-
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         test_data = b"saved file content"
         self.mock_connection.download_file.return_value = test_data
@@ -3495,9 +3125,6 @@ class TestDownloadFile(unittest.TestCase):
 
     def test_download_file_not_connected(self):
         """Test download_file raises when not connected."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import NotConnectedError
-
         self.mock_connection.is_connected = False
         client = TASE2Client()
         with self.assertRaises(NotConnectedError):
@@ -3505,9 +3132,6 @@ class TestDownloadFile(unittest.TestCase):
 
     def test_download_file_connection_error(self):
         """Test download_file wraps errors in TASE2Error."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import TASE2Error
-
         client = TASE2Client()
         self.mock_connection.download_file.side_effect = RuntimeError("IO error")
 
@@ -3520,9 +3144,9 @@ class TestClientStatistics(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -3536,8 +3160,6 @@ class TestClientStatistics(unittest.TestCase):
 
     def test_get_statistics_initial(self):
         """Test initial statistics are zero."""
-        from pyiec61850.tase2 import ClientStatistics, TASE2Client
-
         client = TASE2Client()
         stats = client.get_statistics()
         self.assertIsInstance(stats, ClientStatistics)
@@ -3549,8 +3171,6 @@ class TestClientStatistics(unittest.TestCase):
 
     def test_statistics_returns_copy(self):
         """Test get_statistics returns a copy, not the internal object."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         stats1 = client.get_statistics()
         stats1.total_reads = 999
@@ -3560,8 +3180,6 @@ class TestClientStatistics(unittest.TestCase):
 
     def test_statistics_read_increments(self):
         """Test read operations increment statistics."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         # Simulate a successful read by directly incrementing
         client._statistics.total_reads += 1
@@ -3571,8 +3189,6 @@ class TestClientStatistics(unittest.TestCase):
 
     def test_statistics_connect_time(self):
         """Test connect sets connect_time in statistics."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.mock_connection.connect.return_value = True
         client.connect("192.168.1.1")
@@ -3581,8 +3197,6 @@ class TestClientStatistics(unittest.TestCase):
 
     def test_statistics_disconnect_time(self):
         """Test disconnect sets disconnect_time in statistics."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.disconnect()
         stats = client.get_statistics()
@@ -3594,9 +3208,9 @@ class TestLocalIdentity(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -3607,15 +3221,11 @@ class TestLocalIdentity(unittest.TestCase):
 
     def test_identity_not_set_initially(self):
         """Test local identity is None initially."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.assertIsNone(client.get_local_identity())
 
     def test_set_and_get_identity(self):
         """Test setting and getting local identity."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.set_local_identity("ACME Corp", "EMS-2000", "3.1.0")
         identity = client.get_local_identity()
@@ -3623,8 +3233,6 @@ class TestLocalIdentity(unittest.TestCase):
 
     def test_identity_overwrite(self):
         """Test overwriting local identity."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.set_local_identity("Vendor1", "Model1", "1.0")
         client.set_local_identity("Vendor2", "Model2", "2.0")
@@ -3637,9 +3245,9 @@ class TestEditionAwareTimestamps(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -3650,39 +3258,29 @@ class TestEditionAwareTimestamps(unittest.TestCase):
 
     def test_default_edition_is_auto(self):
         """Test default edition is 'auto'."""
-        from pyiec61850.tase2 import TASE2_EDITION_AUTO, TASE2Client
-
         client = TASE2Client()
         self.assertEqual(client.tase2_edition, TASE2_EDITION_AUTO)
 
     def test_set_edition_1996(self):
         """Test setting edition to 1996."""
-        from pyiec61850.tase2 import TASE2_EDITION_1996, TASE2Client
-
         client = TASE2Client()
         client.tase2_edition = TASE2_EDITION_1996
         self.assertEqual(client.tase2_edition, TASE2_EDITION_1996)
 
     def test_set_edition_2000(self):
         """Test setting edition to 2000."""
-        from pyiec61850.tase2 import TASE2_EDITION_2000, TASE2Client
-
         client = TASE2Client()
         client.tase2_edition = TASE2_EDITION_2000
         self.assertEqual(client.tase2_edition, TASE2_EDITION_2000)
 
     def test_set_invalid_edition_raises(self):
         """Test setting invalid edition raises ValueError."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         with self.assertRaises(ValueError):
             client.tase2_edition = "invalid"
 
     def test_convert_timestamp_1996_seconds(self):
         """Test timestamp conversion with 1996 edition (seconds)."""
-        from pyiec61850.tase2 import TASE2_EDITION_1996, TASE2Client
-
         client = TASE2Client()
         client.tase2_edition = TASE2_EDITION_1996
         # 2025-01-01 00:00:00 UTC = 1735689600 seconds
@@ -3694,8 +3292,6 @@ class TestEditionAwareTimestamps(unittest.TestCase):
 
     def test_convert_timestamp_2000_milliseconds(self):
         """Test timestamp conversion with 2000 edition (milliseconds)."""
-        from pyiec61850.tase2 import TASE2_EDITION_2000, TASE2Client
-
         client = TASE2Client()
         client.tase2_edition = TASE2_EDITION_2000
         # 2025-01-01 00:00:00 UTC = 1735689600000 milliseconds
@@ -3707,8 +3303,6 @@ class TestEditionAwareTimestamps(unittest.TestCase):
 
     def test_convert_timestamp_auto_large_value(self):
         """Test auto-detect with large value (milliseconds)."""
-        from pyiec61850.tase2 import TASE2_EDITION_AUTO, TASE2Client
-
         client = TASE2Client()
         client.tase2_edition = TASE2_EDITION_AUTO
         # A value > 32503680000 should be treated as milliseconds
@@ -3719,8 +3313,6 @@ class TestEditionAwareTimestamps(unittest.TestCase):
 
     def test_convert_timestamp_overflow(self):
         """Test timestamp conversion with overflow value returns None."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         # Extremely large value that would overflow datetime
         result = client._convert_timestamp(99999999999999999999)
@@ -3732,9 +3324,9 @@ class TestMaxOutstandingCalls(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.connect.return_value = True
@@ -3749,30 +3341,22 @@ class TestMaxOutstandingCalls(unittest.TestCase):
 
     def test_default_none(self):
         """Test max_outstanding_calls defaults to None."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.assertIsNone(client.max_outstanding_calls)
 
     def test_constructor_param(self):
         """Test max_outstanding_calls set via constructor."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client(max_outstanding_calls=5)
         self.assertEqual(client.max_outstanding_calls, 5)
 
     def test_applied_at_connect(self):
         """Test max_outstanding_calls applied after connect."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client(max_outstanding_calls=10)
         client.connect("192.168.1.1")
         self.mock_connection.set_max_outstanding_calls.assert_called_with(10, 10)
 
     def test_property_setter_when_connected(self):
         """Test setting max_outstanding_calls while connected applies immediately."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.max_outstanding_calls = 8
         self.assertEqual(client.max_outstanding_calls, 8)
@@ -3780,8 +3364,6 @@ class TestMaxOutstandingCalls(unittest.TestCase):
 
     def test_property_setter_when_not_connected(self):
         """Test setting max_outstanding_calls while disconnected stores for later."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.is_connected = False
         client = TASE2Client()
         client.max_outstanding_calls = 5
@@ -3795,9 +3377,9 @@ class TestRequestTimeout(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -3808,16 +3390,12 @@ class TestRequestTimeout(unittest.TestCase):
 
     def test_set_timeout_when_connected(self):
         """Test setting request timeout when connected."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.set_request_timeout(5000)
         self.mock_connection.set_request_timeout.assert_called_once_with(5000)
 
     def test_set_timeout_when_not_connected(self):
         """Test setting request timeout when not connected logs warning."""
-        from pyiec61850.tase2 import TASE2Client
-
         self.mock_connection.is_connected = False
         client = TASE2Client()
         # Should not raise, just warn
@@ -3857,8 +3435,6 @@ class TestServerAddress(unittest.TestCase):
 
     def test_creation_defaults(self):
         """Test ServerAddress with default values."""
-        from pyiec61850.tase2 import ServerAddress
-
         addr = ServerAddress("192.168.1.100")
         self.assertEqual(addr.host, "192.168.1.100")
         self.assertEqual(addr.port, 102)
@@ -3866,8 +3442,6 @@ class TestServerAddress(unittest.TestCase):
 
     def test_creation_full(self):
         """Test ServerAddress with all values specified."""
-        from pyiec61850.tase2 import ServerAddress
-
         addr = ServerAddress("10.0.0.1", 5000, priority="backup")
         self.assertEqual(addr.host, "10.0.0.1")
         self.assertEqual(addr.port, 5000)
@@ -3875,8 +3449,6 @@ class TestServerAddress(unittest.TestCase):
 
     def test_is_primary(self):
         """Test is_primary property."""
-        from pyiec61850.tase2 import ServerAddress
-
         primary = ServerAddress("host1", priority="primary")
         backup = ServerAddress("host2", priority="backup")
         self.assertTrue(primary.is_primary)
@@ -3886,8 +3458,6 @@ class TestServerAddress(unittest.TestCase):
 
     def test_str_representation(self):
         """Test string representation of ServerAddress."""
-        from pyiec61850.tase2 import ServerAddress
-
         addr = ServerAddress("192.168.1.100", 102, priority="primary")
         s = str(addr)
         self.assertIn("192.168.1.100", s)
@@ -3900,9 +3470,9 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.connect.return_value = True
@@ -3917,8 +3487,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_connect_single_host(self):
         """Test connect with a single host string works as before."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         result = client.connect("192.168.1.100", port=102)
         self.assertTrue(result)
@@ -3926,8 +3494,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_connect_with_server_list(self):
         """Test connect with list of (host, port) tuples."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         servers = [
             ("192.168.1.100", 102),
@@ -3940,9 +3506,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_connect_server_list_failover_to_second(self):
         """Test failover connects to second server when first fails."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import ConnectionFailedError
-
         # First call fails, second succeeds
         self.mock_connection.connect.side_effect = [
             ConnectionFailedError("host1", 102, "refused"),
@@ -3960,9 +3523,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_connect_server_list_all_fail(self):
         """Test raises when all servers in list fail."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import ConnectionFailedError
-
         self.mock_connection.connect.side_effect = ConnectionFailedError("host", 102, "refused")
 
         client = TASE2Client()
@@ -3975,8 +3535,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_add_server(self):
         """Test add_server builds server list."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.add_server("192.168.1.100", 102, priority="primary")
         client.add_server("10.0.0.100", 102, priority="backup")
@@ -3991,8 +3549,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_add_server_and_connect_with_failover(self):
         """Test add_server followed by connect with failover=True."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.add_server("192.168.1.100", 102, priority="primary")
         client.add_server("192.168.1.101", 102, priority="primary")
@@ -4002,8 +3558,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_server_list_property_returns_copy(self):
         """Test server_list returns a copy."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.add_server("192.168.1.100")
         sl = client.server_list
@@ -4013,8 +3567,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_failover_on_connection_lost(self):
         """Test connection loss triggers failover to next server."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         servers = [
             ("192.168.1.100", 102),
@@ -4034,8 +3586,6 @@ class TestMultiServerFailover(unittest.TestCase):
 
     def test_failover_disabled_calls_callback(self):
         """Test connection loss without failover calls callback."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         callback = MagicMock()
         client.on_connection_lost = callback
@@ -4050,9 +3600,9 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -4066,29 +3616,21 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def test_default_max_consecutive_errors(self):
         """Test default max_consecutive_errors is 10."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.assertEqual(client.max_consecutive_errors, 10)
 
     def test_custom_max_consecutive_errors(self):
         """Test custom max_consecutive_errors via constructor."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client(max_consecutive_errors=5)
         self.assertEqual(client.max_consecutive_errors, 5)
 
     def test_initial_consecutive_errors_zero(self):
         """Test initial consecutive error count is zero."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.assertEqual(client.consecutive_errors, 0)
 
     def test_record_success_resets_count(self):
         """Test _record_success resets consecutive error count."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._consecutive_errors = 5
         client._record_success()
@@ -4096,8 +3638,6 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def test_record_error_increments_count(self):
         """Test _record_error increments consecutive error count."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._record_error()
         self.assertEqual(client.consecutive_errors, 1)
@@ -4106,8 +3646,6 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def test_record_error_increments_total_errors(self):
         """Test _record_error increments total errors in statistics."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._record_error()
         client._record_error()
@@ -4116,8 +3654,6 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def test_threshold_triggers_connection_lost(self):
         """Test reaching threshold triggers _handle_connection_lost."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client(max_consecutive_errors=3)
         callback = MagicMock()
         client.on_connection_lost = callback
@@ -4132,8 +3668,6 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def test_success_between_errors_resets_count(self):
         """Test success between errors resets the counter."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client(max_consecutive_errors=3)
         callback = MagicMock()
         client.on_connection_lost = callback
@@ -4148,11 +3682,8 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def test_read_point_records_success(self):
         """Test successful read_point calls _record_success."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         self.mock_connection.read_variable.return_value = 42.0
-        self.mock_connection.get_variable_type.return_value = 6  # FLOAT
 
         client._consecutive_errors = 3
         client.read_point("ICC1", "Voltage")
@@ -4160,9 +3691,6 @@ class TestConsecutiveErrorCounting(unittest.TestCase):
 
     def test_read_point_records_error(self):
         """Test failed read_point calls _record_error."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import ReadError
-
         client = TASE2Client()
         self.mock_connection.read_variable.side_effect = Exception("read fail")
 
@@ -4176,9 +3704,9 @@ class TestDataSetTransferMetadata(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -4193,8 +3721,6 @@ class TestDataSetTransferMetadata(unittest.TestCase):
 
     def test_create_data_set_no_metadata(self):
         """Test create_data_set without transfer metadata."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         members = ["Voltage", "Current"]
         client.create_data_set("ICC1", "DS1", members)
@@ -4205,8 +3731,6 @@ class TestDataSetTransferMetadata(unittest.TestCase):
 
     def test_create_data_set_with_metadata(self):
         """Test create_data_set with include_transfer_metadata=True."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         members = ["Voltage", "Current"]
         client.create_data_set("ICC1", "DS1", members, include_transfer_metadata=True)
@@ -4225,8 +3749,6 @@ class TestDataSetTransferMetadata(unittest.TestCase):
 
     def test_create_data_set_metadata_preserves_originals(self):
         """Test include_transfer_metadata does not modify input list."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         members = ["Voltage", "Current"]
         original_len = len(members)
@@ -4242,9 +3764,9 @@ class TestEnableTransferSetInitialRead(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -4259,8 +3781,6 @@ class TestEnableTransferSetInitialRead(unittest.TestCase):
 
     def test_enable_without_initial_read(self):
         """Test enable_transfer_set returns bool without initial_read."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         result = client.enable_transfer_set("ICC1", "TS1")
         self.assertTrue(result)
@@ -4268,8 +3788,6 @@ class TestEnableTransferSetInitialRead(unittest.TestCase):
 
     def test_enable_with_initial_read(self):
         """Test enable_transfer_set returns tuple with initial_read=True."""
-        from pyiec61850.tase2 import PointValue, TASE2Client
-
         client = TASE2Client()
         mock_values = [
             PointValue(value=42.0, quality="GOOD", name="Voltage", domain="ICC1"),
@@ -4286,8 +3804,6 @@ class TestEnableTransferSetInitialRead(unittest.TestCase):
 
     def test_enable_initial_read_uses_data_set_name(self):
         """Test initial_read uses data_set_name when provided."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.get_data_set_values = MagicMock(return_value=[])
 
@@ -4296,8 +3812,6 @@ class TestEnableTransferSetInitialRead(unittest.TestCase):
 
     def test_enable_initial_read_uses_ts_name_as_default_ds(self):
         """Test initial_read uses transfer set name as default ds name."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.get_data_set_values = MagicMock(return_value=[])
 
@@ -4306,8 +3820,6 @@ class TestEnableTransferSetInitialRead(unittest.TestCase):
 
     def test_enable_initial_read_failure_returns_empty(self):
         """Test initial_read failure returns empty list, not error."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client.get_data_set_values = MagicMock(side_effect=Exception("read failed"))
 
@@ -4322,9 +3834,9 @@ class TestReportAckViaInformationReport(unittest.TestCase):
 
     def setUp(self):
         """Set up test fixtures."""
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_connection.get_domain_names.return_value = ["VCC", "ICC1"]
@@ -4339,8 +3851,6 @@ class TestReportAckViaInformationReport(unittest.TestCase):
 
     def test_ack_without_transfer_set_name(self):
         """Test ACK without transfer_set_name uses write-variable fallback."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         result = client.send_transfer_report_ack("ICC1")
         self.assertTrue(result)
@@ -4348,8 +3858,6 @@ class TestReportAckViaInformationReport(unittest.TestCase):
 
     def test_ack_with_transfer_set_name_fallback(self):
         """Test ACK with transfer_set_name falls back to write when no SWIG method."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         # sendUnconfirmedPDU is not available in the SWIG bindings
         result = client.send_transfer_report_ack("ICC1", transfer_set_name="TS1")
@@ -4359,9 +3867,6 @@ class TestReportAckViaInformationReport(unittest.TestCase):
 
     def test_ack_write_failure_raises(self):
         """Test ACK raises WriteError when write fails."""
-        from pyiec61850.tase2 import TASE2Client
-        from pyiec61850.tase2.exceptions import WriteError
-
         client = TASE2Client()
         self.mock_connection.write_variable.side_effect = RuntimeError("fail")
 
@@ -4431,9 +3936,9 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
     """Test full 9-block Supported_Features parsing and get_server_blocks."""
 
     def setUp(self):
-        self.patcher = patch("pyiec61850.tase2.client.MmsConnectionWrapper")
+        self.patcher = patch.object(_client, "MmsConnectionWrapper")
         self.mock_wrapper_class = self.patcher.start()
-        self.mock_connection = MagicMock()
+        self.mock_connection = MagicMock(spec=MmsConnectionWrapper)
         self.mock_connection.is_connected = True
         self.mock_connection.register_state_callback = MagicMock()
         self.mock_wrapper_class.return_value = self.mock_connection
@@ -4443,19 +3948,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_all_9_blocks_decoded(self):
         """Test that all 9 block bits are decoded from a 2-octet bitstring."""
-        from pyiec61850.tase2 import (
-            BLOCK_1,
-            BLOCK_2,
-            BLOCK_3,
-            BLOCK_4,
-            BLOCK_5,
-            BLOCK_6,
-            BLOCK_7,
-            BLOCK_8,
-            BLOCK_9,
-            TASE2Client,
-        )
-
         client = TASE2Client()
         # All 9 blocks set:
         # Octet 1: 0xFF (blocks 1-8, bits 0-7)
@@ -4480,19 +3972,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_single_block_bits(self):
         """Test each block bit individually."""
-        from pyiec61850.tase2 import (
-            SUPPORTED_FEATURES_BLOCK_1,
-            SUPPORTED_FEATURES_BLOCK_2,
-            SUPPORTED_FEATURES_BLOCK_3,
-            SUPPORTED_FEATURES_BLOCK_4,
-            SUPPORTED_FEATURES_BLOCK_5,
-            SUPPORTED_FEATURES_BLOCK_6,
-            SUPPORTED_FEATURES_BLOCK_7,
-            SUPPORTED_FEATURES_BLOCK_8,
-            SUPPORTED_FEATURES_BLOCK_9,
-            TASE2Client,
-        )
-
         expected = [
             (SUPPORTED_FEATURES_BLOCK_1, 1),
             (SUPPORTED_FEATURES_BLOCK_2, 2),
@@ -4515,18 +3994,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_block_bit_values(self):
         """Test SUPPORTED_FEATURES constants have correct bit values."""
-        from pyiec61850.tase2 import (
-            SUPPORTED_FEATURES_BLOCK_1,
-            SUPPORTED_FEATURES_BLOCK_2,
-            SUPPORTED_FEATURES_BLOCK_3,
-            SUPPORTED_FEATURES_BLOCK_4,
-            SUPPORTED_FEATURES_BLOCK_5,
-            SUPPORTED_FEATURES_BLOCK_6,
-            SUPPORTED_FEATURES_BLOCK_7,
-            SUPPORTED_FEATURES_BLOCK_8,
-            SUPPORTED_FEATURES_BLOCK_9,
-        )
-
         self.assertEqual(SUPPORTED_FEATURES_BLOCK_1, 0x80)
         self.assertEqual(SUPPORTED_FEATURES_BLOCK_2, 0x40)
         self.assertEqual(SUPPORTED_FEATURES_BLOCK_3, 0x20)
@@ -4539,8 +4006,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_blocks_6_through_8_first_octet(self):
         """Test blocks 6-8 in the low bits of the first octet."""
-        from pyiec61850.tase2 import BLOCK_6, BLOCK_7, BLOCK_8, TASE2Client
-
         client = TASE2Client()
         # Blocks 6+7+8 = 0x04 | 0x02 | 0x01 = 0x07
         client._parse_supported_features(0x07)
@@ -4553,8 +4018,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_no_blocks_set(self):
         """Test parsing with zero features bitstring."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._parse_supported_features(0x00)
 
@@ -4563,8 +4026,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_typical_d2000_bitstring(self):
         """Test parsing the typical D2000 bitstring (0xC0 = blocks 1+2)."""
-        from pyiec61850.tase2 import BLOCK_1, BLOCK_2, TASE2Client
-
         client = TASE2Client()
         client._parse_supported_features(0xC0)
 
@@ -4573,8 +4034,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_supported_blocks_summary(self):
         """Test human-readable summary is stored."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._parse_supported_features(0xC8)  # blocks 1, 2, 5
 
@@ -4588,8 +4047,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_supported_blocks_summary_empty(self):
         """Test summary when no blocks are supported."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._parse_supported_features(0x00)
 
@@ -4598,8 +4055,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_get_server_blocks_with_capabilities(self):
         """Test get_server_blocks returns all 9 blocks with support status."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         # Parse blocks 1, 2, 5 (0xC8)
         client._parse_supported_features(0xC8)
@@ -4633,8 +4088,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_get_server_blocks_no_capabilities(self):
         """Test get_server_blocks returns None for supported when no data."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         # Don't parse any features
 
@@ -4649,8 +4102,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_get_server_blocks_all_supported(self):
         """Test get_server_blocks when all 9 blocks are supported."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._parse_supported_features(0x80FF)  # all 9 blocks
 
@@ -4663,8 +4114,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_get_server_blocks_informative_descriptions(self):
         """Test that blocks 6-9 have informative-since-2014 descriptions."""
-        from pyiec61850.tase2 import TASE2Client
-
         client = TASE2Client()
         client._parse_supported_features(0x00)
 
@@ -4681,8 +4130,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_conformance_blocks_has_9_entries(self):
         """Test CONFORMANCE_BLOCKS dict has all 9 blocks."""
-        from pyiec61850.tase2 import CONFORMANCE_BLOCKS
-
         self.assertEqual(len(CONFORMANCE_BLOCKS), 9)
         for block_num in range(1, 10):
             self.assertIn(
@@ -4691,16 +4138,12 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_block_3_renamed_from_reserved(self):
         """Test Block 3 was renamed from RESERVED to BLOCKED_TRANSFERS."""
-        from pyiec61850.tase2 import BLOCK_3, CONFORMANCE_BLOCKS
-
         name, description = CONFORMANCE_BLOCKS[BLOCK_3]
         self.assertEqual(name, "BLOCKED_TRANSFERS")
         self.assertIn("Blocked data transfers", description)
 
     def test_new_block_constants_importable(self):
         """Test BLOCK_6 through BLOCK_9 are importable."""
-        from pyiec61850.tase2 import BLOCK_6, BLOCK_7, BLOCK_8, BLOCK_9
-
         self.assertEqual(BLOCK_6, 6)
         self.assertEqual(BLOCK_7, 7)
         self.assertEqual(BLOCK_8, 8)
@@ -4708,13 +4151,6 @@ class TestSupportedFeaturesAllBlocks(unittest.TestCase):
 
     def test_new_supported_features_constants_importable(self):
         """Test SUPPORTED_FEATURES_BLOCK_6 through _9 are importable."""
-        from pyiec61850.tase2 import (
-            SUPPORTED_FEATURES_BLOCK_6,
-            SUPPORTED_FEATURES_BLOCK_7,
-            SUPPORTED_FEATURES_BLOCK_8,
-            SUPPORTED_FEATURES_BLOCK_9,
-        )
-
         self.assertIsInstance(SUPPORTED_FEATURES_BLOCK_6, int)
         self.assertIsInstance(SUPPORTED_FEATURES_BLOCK_7, int)
         self.assertIsInstance(SUPPORTED_FEATURES_BLOCK_8, int)
@@ -4742,8 +4178,6 @@ class TestPyInfoReportHandlerDirectorInheritance(unittest.TestCase):
 
     def test_base_class_is_dynamic(self):
         """_InfoReportHandlerBase must exist as module-level dynamic base class."""
-        from pyiec61850.tase2 import connection
-
         self.assertTrue(
             hasattr(connection, "_InfoReportHandlerBase"),
             "_InfoReportHandlerBase not defined — handler won't inherit",
@@ -4751,21 +4185,12 @@ class TestPyInfoReportHandlerDirectorInheritance(unittest.TestCase):
 
     def test_handler_uses_dynamic_base(self):
         """_PyInfoReportHandler must inherit from _InfoReportHandlerBase."""
-        from pyiec61850.tase2.connection import (
-            _InfoReportHandlerBase,
-            _PyInfoReportHandler,
-        )
-
         self.assertTrue(
             issubclass(_PyInfoReportHandler, _InfoReportHandlerBase),
         )
 
     def test_handler_calls_super_init(self):
         """__init__ must call super().__init__(), not iec61850.X.__init__(self)."""
-        import inspect
-
-        from pyiec61850.tase2.connection import _PyInfoReportHandler
-
         source = inspect.getsource(_PyInfoReportHandler.__init__)
         self.assertIn("super().__init__", source)
         self.assertNotIn("InformationReportHandler.__init__(self)", source)